@@ -0,0 +1,124 @@
+import errno
+import os
+import shutil
+
+try:
+    import fcntl
+except ImportError:  # Linux dışı platformlar
+    fcntl = None
+
+BACKUP_SUFFIX = '.metadatacleaner.bak'
+
+# linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+# Denenecek yöntemler, ucuzdan pahalıya
+DEFAULT_STRATEGIES = ('reflink', 'hardlink', 'copy')
+
+# Bu hatalar dosya sisteminin yöntemi hiç desteklemediğini gösterir
+UNSUPPORTED_ERRNOS = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.EXDEV, errno.ENOSYS}
+
+# (st_dev, yöntem) -> desteklenmiyor; her dosyada tekrar denenmez
+_unsupported = set()
+
+
+class Backup:
+    """Bir dosyanın temizlik öncesi yedeği
+
+    restore() orijinal içeriği geri koyar ve yedeği siler, discard() yalnızca
+    yedeği siler. Her iki durumda da yedek dosyası geride kalmaz.
+    """
+
+    def __init__(self, path, backup_path, method):
+        self.path = path
+        self.backup_path = backup_path
+        self.method = method
+
+    def exists(self):
+        return os.path.lexists(self.backup_path)
+
+    def restore(self):
+        if not self.exists():
+            return
+        try:
+            same = os.path.samefile(self.path, self.backup_path)
+        except OSError:
+            same = False
+        if same:
+            # Sabit bağ ve dosya hâlâ aynı: orijinal hiç değişmemiş.
+            # rename() aynı dosyaya işaret eden iki bağda hiçbir şey yapmaz.
+            os.remove(self.backup_path)
+        else:
+            os.replace(self.backup_path, self.path)
+
+    def discard(self):
+        if self.exists():
+            os.remove(self.backup_path)
+
+
+def reflink(src, dst):
+    """Veriyi kopyalamadan paylaşan bir klon oluştur (btrfs, XFS, bcachefs)"""
+    if fcntl is None:
+        raise OSError(errno.ENOSYS, "FICLONE desteklenmiyor")
+    try:
+        with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+            fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+        shutil.copystat(src, dst)
+    except BaseException:
+        try:
+            os.remove(dst)
+        except OSError:
+            pass
+        raise
+
+
+def hardlink(src, dst):
+    """Orijinal inode'u yedek adıyla tut
+
+    ExifTool -overwrite_original çıktıyı geçici dosyaya yazıp orijinalin
+    üzerine taşıdığı için eski inode, yani yedek, değişmeden kalır.
+    """
+    os.link(src, dst)
+
+
+def copy(src, dst):
+    shutil.copy2(src, dst)
+
+
+METHODS = {
+    'reflink': reflink,
+    'hardlink': hardlink,
+    'copy': copy,
+}
+
+
+def create_backup(path, strategies=DEFAULT_STRATEGIES, logger=None):
+    """Sırayla yöntemleri deneyerek yedek oluştur ve Backup döndür
+
+    Yalnızca son yöntem de başarısız olursa OSError fırlatılır.
+    """
+    backup_path = f"{path}{BACKUP_SUFFIX}"
+    if os.path.lexists(backup_path):
+        # shutil.copy2 gibi eski yedeğin üzerine yaz
+        os.remove(backup_path)
+
+    try:
+        device = os.stat(path).st_dev
+    except OSError:
+        device = None
+
+    last_error = None
+    for method in strategies:
+        if (device, method) in _unsupported:
+            continue
+        try:
+            METHODS[method](path, backup_path)
+            return Backup(path, backup_path, method)
+        except OSError as e:
+            last_error = e
+            if e.errno in UNSUPPORTED_ERRNOS and method != 'copy':
+                _unsupported.add((device, method))
+            if logger:
+                logger.debug(f"Yedekleme yöntemi kullanılamadı ({method}): {path} - {e}")
+
+    raise last_error or OSError(errno.EINVAL, "Yedekleme yöntemi yok")
@@ -0,0 +1,256 @@
+from backup_strategy import create_backup
+from exiftool_engine import ExifToolError
+import native_cleaner
+from native_cleaner import NativeCleanError
+
+# Tüm metadata'yı silip temel dosya bilgilerini koruyan ExifTool argümanları
+CLEAN_ARGS = [
+    '-all=',                    # Tüm metadata'yı sil
+    '-tagsFromFile', '@',       # Orijinal dosyadan temel etiketleri koru
+    '-FileType',                # Dosya tipini koru
+    '-FileTypeExtension',       # Dosya uzantısını koru
+    '-MIMEType',               # MIME tipini koru
+    '-ImageSize',              # Görüntü boyutunu koru
+    '-overwrite_original',     # Orijinal dosyayı değiştir
+    '-P',                      # Dosya izinlerini koru
+]
+
+DEFAULT_CHUNK_SIZE = 200
+
+# İptal edildiği için hiç işlenmeyen dosyaların hata metni
+CANCELLED_ERROR = "İptal edildi"
+
+# Ön kontrol okuması: '-G0:1' anahtarları 'Aile0:Aile1:Etiket' yapar. '-fast'
+# kullanılmaz; JPEG sonekleri ve AVI/WAV verisi atlanınca dosya temiz sanılırdı
+PROBE_ARGS = [
+    '-G0:1',
+    '-charset', 'filename=utf8',
+    '-charset', 'utf8',
+]
+
+# Temizlikten sonra da kalan, silinemeyen gruplar
+KEPT_GROUPS = {'File', 'ExifTool', 'Composite'}
+# QuickTime'da yalnızca bu alt gruplar yapısaldır (UserData, ItemList, Keys silinir)
+KEPT_QUICKTIME_GROUPS = {'QuickTime', 'Video', 'Audio'}
+
+
+def has_removable_tags(entry):
+    """Ön kontrol çıktısındaki bir dosyada silinebilir etiket var mı
+
+    ExifTool okurken hata ya da uyarı verdiyse karar verilemez; dosya
+    silinecek etiketi varmış gibi temizlemeye bırakılır.
+    """
+    for key in entry:
+        if key == 'SourceFile':
+            continue
+        family0, family1 = (key.split(':') + ['', ''])[:2]
+        if family0 == 'ExifTool' and key.rsplit(':', 1)[-1] in ('Error', 'Warning'):
+            return True
+        if family0 in KEPT_GROUPS:
+            continue
+        if family0 == 'QuickTime' and (family1 in KEPT_QUICKTIME_GROUPS or family1.startswith('Track')):
+            continue
+        return True
+    return False
+
+
+class CleanResult:
+    """Tek bir dosyanın temizleme (ya da okuma/düzenleme) sonucu"""
+
+    def __init__(self, path, success, error=None, skipped=False, data=None, cancelled=False):
+        self.path = path
+        self.success = success
+        self.error = error
+        self.skipped = skipped      # Silinecek metadata yoktu, dosyaya dokunulmadı
+        self.data = data            # İşlemin ürettiği veri (ör. okunan metadata)
+        self.cancelled = cancelled  # İptal nedeniyle dosyaya hiç dokunulmadı
+
+    @classmethod
+    def cancelled_result(cls, path):
+        return cls(path, False, CANCELLED_ERROR, cancelled=True)
+
+    def __repr__(self):
+        state = 'ok' if self.success else f'error={self.error!r}'
+        if self.skipped:
+            state = 'skipped'
+        elif self.cancelled:
+            state = 'cancelled'
+        return f"CleanResult({self.path!r}, {state})"
+
+
+def parse_file_errors(stderr, paths):
+    """ExifTool stderr çıktısındaki 'Error: ... - dosya' satırlarını dosyalara eşle"""
+    errors = {}
+    # Uzun yollar önce denenir, böylece '/a/b.jpg' ile '/x/a/b.jpg' karışmaz
+    ordered = sorted(paths, key=len, reverse=True)
+    for line in stderr.splitlines():
+        if not line.startswith('Error'):
+            continue
+        for path in ordered:
+            if line.endswith(f' - {path}'):
+                message = line[:-len(path) - 3]
+                errors.setdefault(path, message.split(':', 1)[-1].strip())
+                break
+    return errors
+
+
+class BatchCleaner:
+    """Çok sayıda dosyayı parçalar halinde tek ExifTool komutuyla temizler
+
+    profile (CleanProfile) verilirse yalnızca profilin etiketleri silinir;
+    yerel temizleyici ve ön kontrol yalnızca ICC dışında bir şey korumayan
+    tam temizlik profillerinde kullanılır.
+    """
+
+    def __init__(self, engine, chunk_size=DEFAULT_CHUNK_SIZE, native=True, keep_icc=True,
+                 skip_clean=False, cancelled=None, profile=None, logger=None):
+        self.engine = engine
+        self.cancelled = cancelled or (lambda: False)
+        self.chunk_size = max(1, int(chunk_size))
+        self.clean_args = CLEAN_ARGS
+        self.native = native
+        self.keep_icc = keep_icc
+        self.skip_clean = skip_clean
+        if profile is not None:
+            self.clean_args = profile.exiftool_args()
+            self.native = native and profile.native
+            # Varsayılan profilde ICC ayarı kullanıcı ayarından gelir
+            if profile.keep:
+                self.keep_icc = profile.keep_icc
+            self.skip_clean = skip_clean and profile.native
+        self.logger = logger
+
+    def chunks(self, paths):
+        for start in range(0, len(paths), self.chunk_size):
+            yield paths[start:start + self.chunk_size]
+
+    def clean(self, paths):
+        """Dosyaları parça parça temizle, sonuçları sırayla döndür"""
+        for chunk in self.chunks(list(paths)):
+            yield from self.clean_chunk(chunk)
+
+    def clean_native(self, path):
+        """Yerel temizleyiciyi dene; dosya ExifTool'a bırakılacaksa None döndür
+
+        Geçici dosyaya yazılıp atomik olarak yer değiştirildiği için yedek
+        gerekmez: hata durumunda orijinal dosya hiç değişmemiş olur.
+        """
+        if not native_cleaner.supports(path):
+            return None
+        try:
+            native_cleaner.strip_file(path, keep_icc=self.keep_icc)
+            return CleanResult(path, True)
+        except NativeCleanError as e:
+            if self.logger:
+                self.logger.debug(f"Yerel temizleme atlandı, ExifTool kullanılacak: {path} - {e}")
+            return None
+        except OSError as e:
+            return CleanResult(path, False, str(e))
+
+    def find_clean_files(self, paths):
+        """Silinecek metadata'sı olmayan dosyaları bul (yalnızca okuma yapılır)
+
+        JPEG/PNG başlıkları yerel olarak taranır, diğer dosyalar tek bir
+        ExifTool okumasıyla denetlenir. Emin olunamayan dosya temiz sayılmaz.
+        """
+        clean = set()
+        # Yerel temizleyici kapalıysa ExifTool ICC profilini de siler
+        keep_icc = self.keep_icc if self.native else False
+        engine_paths = []
+        for path in paths:
+            if native_cleaner.supports(path):
+                try:
+                    if not native_cleaner.has_metadata(path, keep_icc=keep_icc):
+                        clean.add(path)
+                    continue
+                except NativeCleanError:
+                    pass
+                except OSError:
+                    continue
+            engine_paths.append(path)
+
+        if engine_paths:
+            try:
+                entries = self.engine.execute_json(*PROBE_ARGS, *engine_paths)
+            except (ExifToolError, OSError, ValueError) as e:
+                if self.logger:
+                    self.logger.debug(f"Ön kontrol başarısız, dosyalar temizlenecek: {e}")
+                return clean
+            for entry in entries:
+                if entry.get('SourceFile') in engine_paths and not has_removable_tags(entry):
+                    clean.add(entry['SourceFile'])
+        return clean
+
+    def clean_chunk(self, paths):
+        """Bir parçayı tek komutla temizle ve dosya başına sonuç döndür"""
+        backups = {}
+        results = {}
+
+        # Zaten temiz olan dosyalar yeniden yazılmaz
+        if self.skip_clean:
+            for path in self.find_clean_files(paths):
+                results[path] = CleanResult(path, True, skipped=True)
+
+        # JPEG/PNG dosyaları ExifTool'a gitmeden yerel olarak temizlenir
+        if self.native:
+            for path in paths:
+                if path in results:
+                    continue
+                if self.cancelled():
+                    break
+                result = self.clean_native(path)
+                if result is not None:
+                    results[path] = result
+
+        # İptal edildiyse dokunulmamış dosyalar ExifTool'a gönderilmez
+        if self.cancelled():
+            for path in paths:
+                results.setdefault(path, CleanResult.cancelled_result(path))
+
+        # Yedek dosyaları oluştur; yedeklenemeyen dosya temizlenmez
+        for path in paths:
+            if path in results:
+                continue
+            try:
+                backups[path] = create_backup(path, logger=self.logger)
+            except OSError as e:
+                results[path] = CleanResult(path, False, str(e))
+
+        targets = [path for path in paths if path in backups]
+        if targets:
+            try:
+                if self.logger:
+                    self.logger.debug(f"Toplu temizlik: {len(targets)} dosya tek komutla işleniyor")
+                result = self.engine.execute(*self.clean_args, *targets)
+                if result.stderr and self.logger:
+                    self.logger.warning(f"ExifTool uyarıları: {result.stderr}")
+
+                file_errors = parse_file_errors(result.stderr, targets)
+                # Dosyaya eşlenemeyen bir hata satırı varsa hatası bilinmeyen dosyalar da
+                # başarısız sayılır (hangisine ait olduğu bilinmez, hepsi geri yüklenir)
+                general_error = None
+                unmapped = [line for line in result.errors
+                            if not any(line.endswith(f' - {path}') for path in targets)]
+                if unmapped:
+                    general_error = '\n'.join(unmapped)
+
+                for path in targets:
+                    error = file_errors.get(path, general_error)
+                    results[path] = CleanResult(path, error is None, error)
+
+            except (ExifToolError, OSError) as e:
+                if self.logger:
+                    self.logger.error(f"Toplu temizlik hatası: {e}")
+                for path in targets:
+                    results[path] = CleanResult(path, False, str(e))
+
+        # Başarısız dosyaları yedekten geri yükle, yedekleri sil
+        for path, backup in backups.items():
+            if not results[path].success:
+                if self.logger:
+                    self.logger.info(f"Yedek dosya geri yükleniyor: {path}")
+                backup.restore()
+            else:
+                backup.discard()
+
+        return [results[path] for path in paths]
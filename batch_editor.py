@@ -0,0 +1,78 @@
+import json
+
+from batch_cleaner import CleanResult, parse_file_errors
+from exiftool_engine import ExifToolError, READ_ARGS
+
+# Salt okunur, yazılamayan etiket grupları
+READ_ONLY_GROUPS = ('File:', 'Composite:')
+
+EDIT_ARGS = [
+    '-overwrite_original',
+    '-P',
+    '-charset', 'filename=utf8',
+    '-charset', 'utf8',
+]
+
+
+def edit_args(changes):
+    """{'Grup:Etiket': değer} değişikliklerini ExifTool '-Etiket=değer' argümanlarına çevir"""
+    args = []
+    for key, value in changes.items():
+        # Salt okunur etiketleri atla
+        if key.startswith(READ_ONLY_GROUPS):
+            continue
+        tag_name = key.split(':', 1)[1] if ':' in key else key
+        args.append(f'-{tag_name}={value}')
+    return args
+
+
+class BatchEditor:
+    """Aynı etiket değişikliklerini birçok dosyaya tek ExifTool komutuyla uygular
+
+    ExifTool -overwrite_original çıktıyı geçici dosyaya yazıp orijinalin
+    üzerine taşıdığı için yedek gerekmez: başarısız dosya değişmeden kalır.
+    """
+
+    def __init__(self, engine, changes, logger=None):
+        self.engine = engine
+        self.args = edit_args(changes)
+        self.logger = logger
+
+    def edit_chunk(self, paths):
+        if not self.args:
+            return [CleanResult(path, True, skipped=True) for path in paths]
+        try:
+            result = self.engine.execute(*EDIT_ARGS, *self.args, *paths)
+        except (ExifToolError, OSError) as e:
+            if self.logger:
+                self.logger.error(f"Toplu düzenleme hatası: {e}")
+            return [CleanResult(path, False, str(e)) for path in paths]
+
+        file_errors = parse_file_errors(result.stderr, paths)
+        general_error = None
+        if result.errors and not file_errors:
+            general_error = result.stderr.strip()
+        return [CleanResult(path, path not in file_errors and general_error is None,
+                            file_errors.get(path, general_error))
+                for path in paths]
+
+
+def read_chunk(engine, paths, logger=None):
+    """Dosyaların metadata'sını tek komutla oku; veri CleanResult.data'da döner"""
+    try:
+        result = engine.execute('-json', *READ_ARGS, *paths)
+        entries = json.loads(result.stdout) if result.stdout.strip() else []
+    except (ExifToolError, OSError, ValueError) as e:
+        if logger:
+            logger.error(f"Toplu okuma hatası: {e}")
+        return [CleanResult(path, False, str(e)) for path in paths]
+
+    by_path = {entry.get('SourceFile'): entry for entry in entries}
+    file_errors = parse_file_errors(result.stderr, paths)
+    results = []
+    for path in paths:
+        if path in by_path:
+            results.append(CleanResult(path, True, data=by_path[path]))
+        else:
+            results.append(CleanResult(path, False, file_errors.get(path, "Metadata okunamadı")))
+    return results
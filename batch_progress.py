@@ -0,0 +1,84 @@
+import os
+import threading
+import time
+from collections import namedtuple
+
+# İlerleme geri çağrısı en fazla bu aralıkla yapılır (arayüz döngüsünü boğmamak için)
+DEFAULT_INTERVAL = 0.25
+
+ProgressSnapshot = namedtuple('ProgressSnapshot', [
+    'done', 'total', 'failed', 'bytes_done', 'bytes_total', 'files_per_second', 'eta', 'finished',
+])
+
+
+def format_bytes(size):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def format_duration(seconds):
+    if seconds is None:
+        return "--:--"
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+class BatchProgress:
+    """Toplu işlemin ilerlemesini sayar ve kısıtlanmış aralıklarla bildirir
+
+    update() her dosya sonucu için işçi iş parçacıklarından çağrılır;
+    on_progress(snapshot) en fazla `interval` saniyede bir ve bitişte bir
+    kez çağrılır. Kalan süre işlenen bayt hızından, boyut bilinmiyorsa
+    dosya hızından tahmin edilir.
+    """
+
+    def __init__(self, paths, on_progress, interval=DEFAULT_INTERVAL):
+        self.on_progress = on_progress
+        self.interval = interval
+        self.sizes = {}
+        for path in paths:
+            try:
+                self.sizes[path] = os.path.getsize(path)
+            except OSError:
+                self.sizes[path] = 0
+        self.total = len(self.sizes)
+        self.bytes_total = sum(self.sizes.values())
+        self.done = 0
+        self.failed = 0
+        self.bytes_done = 0
+        self.started = time.monotonic()
+        self._last_report = 0.0
+        self._lock = threading.Lock()
+
+    def snapshot(self, finished=False):
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        rate = self.done / elapsed
+        eta = None
+        if self.bytes_done and self.bytes_total:
+            eta = (self.bytes_total - self.bytes_done) / (self.bytes_done / elapsed)
+        elif rate:
+            eta = (self.total - self.done) / rate
+        return ProgressSnapshot(self.done, self.total, self.failed, self.bytes_done, self.bytes_total,
+                                rate, 0.0 if finished else eta, finished)
+
+    def update(self, result):
+        with self._lock:
+            self.done += 1
+            if not result.success:
+                self.failed += 1
+            self.bytes_done += self.sizes.get(result.path, 0)
+            now = time.monotonic()
+            if now - self._last_report < self.interval:
+                return
+            self._last_report = now
+            snapshot = self.snapshot()
+        self.on_progress(snapshot)
+
+    def finish(self):
+        with self._lock:
+            snapshot = self.snapshot(finished=True)
+        self.on_progress(snapshot)
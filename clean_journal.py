@@ -0,0 +1,198 @@
+import json
+import os
+import threading
+import time
+
+from backup_strategy import BACKUP_SUFFIX, Backup
+from native_cleaner import TMP_PREFIX, TMP_SUFFIX
+
+JOURNAL_FILE = 'clean-journal.jsonl'
+
+# Kayıtlar her yazımda işletim sistemine aktarılır (süreç öldürülse de kalır);
+# diske zorla yazma (fsync) en fazla bu aralıkla yapılır
+SYNC_INTERVAL = 1.0
+
+# Bundan yeni geçici dosyalara dokunulmaz (başka bir süreç hâlâ yazıyor olabilir)
+ORPHAN_MIN_AGE = 60
+
+
+class JournalState:
+    """Yarım kalmış bir temizlik çalışmasının günlükten okunan durumu"""
+
+    def __init__(self, files, profile=None):
+        self.files = files
+        self.profile = profile  # Çalışmada kullanılan temizlik profilinin adı
+        self.done = {}        # yol -> başarılı_mı
+        self.started = set()  # temizliği başlamış ama bitmemiş dosyalar
+
+    def remaining(self):
+        """Başarıyla temizlenmemiş dosyalar, giriş sırasıyla"""
+        return [path for path in self.files if not self.done.get(path)]
+
+    def completed_count(self):
+        return sum(1 for ok in self.done.values() if ok)
+
+
+class CleanJournal:
+    """Uzun temizlik çalışmaları için önceden yazılan (write-ahead) günlük
+
+    Her dosya için 'start' ve 'done' kayıtları JSON satırları olarak eklenir.
+    Çalışma düzgün biterse günlük silinir; uygulama yarıda kapanırsa bir
+    sonraki açılışta load() ile kalan dosyalar ve yarım kalan yedekler
+    bulunur. Son satırın yarım yazılmış olması sorun değildir.
+    """
+
+    def __init__(self, directory, logger=None):
+        self.path = os.path.join(directory, JOURNAL_FILE)
+        self.logger = logger
+        self._file = None
+        self._last_sync = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def active(self):
+        return self._file is not None
+
+    def begin(self, files, profile=None):
+        """Yeni bir çalışma başlat; önceki günlüğün üzerine yazılır"""
+        with self._lock:
+            self._close_file()
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = open(self.path, 'w', encoding='utf-8')
+            record = {'op': 'begin', 'time': time.time(), 'files': list(files)}
+            if profile:
+                record['profile'] = profile
+            self._write(record, sync=True)
+
+    def mark_started(self, paths):
+        with self._lock:
+            for path in paths:
+                self._write({'op': 'start', 'path': path})
+
+    def mark_done(self, path, success, error=None):
+        with self._lock:
+            record = {'op': 'done', 'path': path, 'ok': bool(success)}
+            if error:
+                record['error'] = str(error)
+            self._write(record)
+
+    def finish(self):
+        """Çalışma tamamlandı: günlüğü sil"""
+        with self._lock:
+            self._close_file()
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                if self.logger:
+                    self.logger.warning(f"Temizlik günlüğü silinemedi: {e}")
+
+    def close(self):
+        """Günlüğü silmeden kapat (çalışma daha sonra sürdürülebilir)"""
+        with self._lock:
+            self._close_file()
+
+    def _write(self, record, sync=False):
+        if self._file is None:
+            return
+        try:
+            self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+            self._file.flush()
+            now = time.monotonic()
+            if sync or now - self._last_sync >= SYNC_INTERVAL:
+                os.fsync(self._file.fileno())
+                self._last_sync = now
+        except OSError as e:
+            if self.logger:
+                self.logger.warning(f"Temizlik günlüğüne yazılamadı: {e}")
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            except OSError:
+                pass
+            self._file.close()
+            self._file = None
+
+    def load(self):
+        """Yarım kalmış çalışma varsa JournalState döndür, yoksa None"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except OSError:
+            return None
+
+        state = None
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Çökme anında yarım kalmış satır
+            op = record.get('op')
+            if op == 'begin':
+                state = JournalState(record.get('files', []), record.get('profile'))
+            elif state is None:
+                continue
+            elif op == 'start':
+                state.started.add(record['path'])
+            elif op == 'done':
+                state.done[record['path']] = record.get('ok', False)
+                state.started.discard(record['path'])
+        return state
+
+    def recover_backups(self, state):
+        """Yarım kalan yedekleri çöz: başarıyla bitmiş dosyanın yedeğini sil,
+        diğerlerini geri yükle. (geri_yüklenen, silinen) sayılarını döndür."""
+        restored = removed = 0
+        for path in state.files:
+            backup = Backup(path, f"{path}{BACKUP_SUFFIX}", 'journal')
+            if not backup.exists():
+                continue
+            try:
+                if state.done.get(path):
+                    backup.discard()
+                    removed += 1
+                else:
+                    backup.restore()
+                    restored += 1
+            except OSError as e:
+                if self.logger:
+                    self.logger.error(f"Yarım kalan yedek çözülemedi: {backup.backup_path} - {e}")
+        self.remove_orphans(state)
+        return restored, removed
+
+    def remove_orphans(self, state):
+        """Yarıda kesilen yazmaların geride bıraktığı geçici dosyaları sil
+
+        Yerel temizleyicinin '.metador-*.tmp' dosyaları ve ExifTool'un
+        '<dosya>_exiftool_tmp' dosyaları hiçbir zaman tamamlanmış bir dosya
+        değildir (yerine taşıma atomiktir), bu yüzden geri yüklenmez, silinir.
+        """
+        candidates = [f"{path}_exiftool_tmp" for path in state.files]
+        for directory in {os.path.dirname(os.path.abspath(path)) for path in state.files}:
+            try:
+                names = os.listdir(directory)
+            except OSError:
+                continue
+            candidates += [os.path.join(directory, name) for name in names
+                           if name.startswith(TMP_PREFIX) and name.endswith(TMP_SUFFIX)]
+
+        removed = 0
+        now = time.time()
+        for candidate in candidates:
+            try:
+                if now - os.lstat(candidate).st_mtime < ORPHAN_MIN_AGE:
+                    continue
+                os.remove(candidate)
+                removed += 1
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                if self.logger:
+                    self.logger.warning(f"Geçici dosya silinemedi: {candidate} - {e}")
+        if removed and self.logger:
+            self.logger.info(f"Yarım kalan temizlikten {removed} geçici dosya silindi")
+        return removed
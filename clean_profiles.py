@@ -0,0 +1,108 @@
+from batch_cleaner import CLEAN_ARGS
+
+DEFAULT_PROFILE = 'full'
+
+# Gömülü renk profilinin blok etiketi; '-tagsFromFile @ -ICC_Profile' profili tek
+# parça kopyalar ('ICC_Profile:all' alt etiketlerinin çoğu tek tek yazılamaz)
+ICC_PROFILE = 'ICC_Profile'
+
+# Her profil silinecek ve (yalnızca 'all' silinirken) korunacak ExifTool etiket
+# belirtimlerinden oluşur: 'GPS:all', 'XMP:GPS*', '*SerialNumber', 'Copyright' gibi
+BUILTIN_PROFILES = {
+    'full': {
+        'remove': ['all'],
+        'keep': [],
+    },
+    'gps': {
+        'remove': ['GPS:all', 'XMP:GPS*', 'GPSCoordinates', 'LocationInformation'],
+    },
+    'camera': {
+        'remove': ['MakerNotes:all', '*SerialNumber', 'Make', 'Model', 'LensMake', 'LensModel',
+                   'OwnerName', 'CameraOwnerName', 'Software'],
+    },
+    'keep_copyright': {
+        'remove': ['all'],
+        'keep': ['Copyright', 'Artist', 'XMP-dc:Rights', 'XMP-dc:Creator',
+                 'IPTC:CopyrightNotice', 'IPTC:By-line', ICC_PROFILE],
+    },
+}
+
+# Tam temizlikte yerel temizleyicinin de koruyabildiği tek grup
+NATIVE_KEEPABLE = {ICC_PROFILE}
+
+# Yapısal etiketler; tam temizlikte her zaman korunur (CLEAN_ARGS ile aynı)
+_BASE_KEEP_ARGS = CLEAN_ARGS[CLEAN_ARGS.index('-tagsFromFile'):CLEAN_ARGS.index('-overwrite_original')]
+
+
+def _tag_list(name, field, tags):
+    """Etiket listesini doğrula; tek bir dizge ('GPS:all') harflerine bölünmez"""
+    if not isinstance(tags, (list, tuple)) or not all(isinstance(tag, str) and tag for tag in tags):
+        raise ValueError(f"Profil '{name}': '{field}' etiket adlarından oluşan bir liste olmalı")
+    return list(tags)
+
+
+class CleanProfile:
+    """Adlandırılmış bir temizlik profili
+
+    'all' silinmiyorsa yalnızca listelenen etiketler silinir; ExifTool
+    silinecek bir şey bulamadığı dosyayı yeniden yazmaz. Tam temizlikte
+    korunacaklar yalnızca ICC profili olabiliyorsa JPEG/PNG için yerel
+    temizleyici kullanılabilir.
+    """
+
+    def __init__(self, name, remove, keep=None, title=None):
+        self.name = name
+        self.title = title or name
+        self.remove = _tag_list(name, 'remove', remove)
+        # Eski yazım 'ICC_Profile:all' blok etiketine çevrilir
+        self.keep = [ICC_PROFILE if tag == 'ICC_Profile:all' else tag
+                     for tag in _tag_list(name, 'keep', keep or [])]
+        if not self.remove:
+            raise ValueError(f"Profilde silinecek etiket yok: {name}")
+
+    @property
+    def is_full(self):
+        """Tüm metadata silinir mi (korunanlar hariç)"""
+        return 'all' in self.remove
+
+    @property
+    def native(self):
+        return self.is_full and set(self.keep) <= NATIVE_KEEPABLE
+
+    @property
+    def keep_icc(self):
+        return ICC_PROFILE in self.keep
+
+    def exiftool_args(self):
+        """Profili en küçük ExifTool argüman listesine çevir"""
+        if self.is_full:
+            args = ['-all=', *_BASE_KEEP_ARGS]
+            args += [f'-{tag}' for tag in self.keep]
+        else:
+            args = [f'-{tag}=' for tag in self.remove]
+        return args + ['-overwrite_original', '-P']
+
+    def __repr__(self):
+        return f"CleanProfile({self.name!r})"
+
+
+def load_profiles(settings=None, logger=None):
+    """Yerleşik profilleri ve settings['clean_profiles'] içindeki kullanıcı
+    profillerini ad -> CleanProfile sözlüğü olarak döndür
+
+    Kullanıcı profili aynı adlı yerleşik profilin yerine geçer; geçersiz
+    profiller günlüğe yazılıp atlanır.
+    """
+    specs = dict(BUILTIN_PROFILES)
+    user_profiles = (settings or {}).get('clean_profiles', {})
+    if isinstance(user_profiles, dict):
+        specs.update(user_profiles)
+
+    profiles = {}
+    for name, spec in specs.items():
+        try:
+            profiles[name] = CleanProfile(name, spec['remove'], spec.get('keep'), spec.get('title'))
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            if logger:
+                logger.warning(f"Geçersiz temizlik profili atlandı: {name} - {e!r}")
+    return profiles
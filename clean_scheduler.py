@@ -0,0 +1,221 @@
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from exiftool_engine import ExifToolEngine
+from batch_cleaner import BatchCleaner, CleanResult, DEFAULT_CHUNK_SIZE
+from batch_progress import BatchProgress
+
+# Bu boyutun üstündeki dosyalar tek başına, ayrı bir şeritte işlenir
+LARGE_FILE_THRESHOLD = 256 * 1024 * 1024
+
+
+def default_worker_count():
+    return os.cpu_count() or 1
+
+
+class EnginePool:
+    """Paralel işçiler için sınırlı sayıda kalıcı ExifTool süreci"""
+
+    def __init__(self, size, logger=None):
+        self.size = max(1, int(size))
+        self.logger = logger
+        self._idle = queue.LifoQueue()
+        self._engines = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self):
+        """Boşta bir motor al; gerekirse yenisini oluştur ya da bekle"""
+        engine = None
+        try:
+            engine = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if len(self._engines) < self.size:
+                    engine = ExifToolEngine(logger=self.logger)
+                    self._engines.append(engine)
+            if engine is None:
+                engine = self._idle.get()
+        try:
+            yield engine
+        finally:
+            self._idle.put(engine)
+
+    def resize(self, size):
+        with self._lock:
+            self.size = max(1, int(size))
+
+    def close(self):
+        with self._lock:
+            engines, self._engines = self._engines, []
+        for engine in engines:
+            engine.close()
+        self._idle = queue.LifoQueue()
+
+
+class CleanScheduler:
+    """clean_metadata önünde çalışan, sınırlı işçi havuzlu temizleme zamanlayıcısı
+
+    Dosyalar iş parçalarına bölünür ve en fazla `workers` kadarı aynı anda
+    çalışır. Sonuçlar her zaman giriş sırasıyla döndürülür. Boyut ağırlıklı
+    modda büyük dosyalar tek başına işlenir ve aynı anda en fazla
+    `workers - 1` tanesi çalışır, böylece küçük dosyalar onların arkasında
+    beklemez. Her iş, yedekleme/geri yükleme dahil BatchCleaner ile yapılır;
+    okuma ya da düzenleme için processor(motor, yollar) verilebilir.
+    Günlük verilirse her dosyanın başlangıcı ve sonucu oraya kaydedilir.
+    cancel() yeni işlerin başlamasını hemen durdurur; süren işler biter ya
+    da geri alınır, başlamamış dosyalar iptal sonucuyla döner ve günlükte
+    bitmemiş olarak kalır.
+    """
+
+    def __init__(self, pool, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                 size_weighted=False, large_file_threshold=LARGE_FILE_THRESHOLD,
+                 native=True, keep_icc=True, skip_clean=False, journal=None,
+                 processor=None, profile=None, logger=None):
+        self.pool = pool
+        self.profile = profile
+        self.processor = processor or self._clean_chunk
+        self.journal = journal
+        self.native = native
+        self.keep_icc = keep_icc
+        self.skip_clean = skip_clean
+        self.workers = max(1, int(workers or default_worker_count()))
+        self.chunk_size = max(1, int(chunk_size))
+        self.size_weighted = size_weighted
+        self.large_file_threshold = large_file_threshold
+        self.logger = logger
+        self._slots = threading.Semaphore(self.workers)
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def plan(self, paths):
+        """Dosyaları (iş, büyük_mü) çiftlerine böl"""
+        if not paths:
+            return []
+
+        # Her işçiye birden fazla iş düşsün ama parça boyutu sınırı aşılmasın
+        per_job = max(1, min(self.chunk_size, -(-len(paths) // (self.workers * 4))))
+
+        if not self.size_weighted:
+            return [(paths[i:i + per_job], False) for i in range(0, len(paths), per_job)]
+
+        sizes = {}
+        for path in paths:
+            try:
+                sizes[path] = os.path.getsize(path)
+            except OSError:
+                sizes[path] = 0
+
+        large = [p for p in paths if sizes[p] >= self.large_file_threshold]
+        small = [p for p in paths if sizes[p] < self.large_file_threshold]
+
+        # Küçük dosyaları toplam bayta göre dengeli parçalara ayır
+        budget = max(1, sum(sizes[p] for p in small) // max(1, self.workers * 4))
+        jobs = []
+        current, current_bytes = [], 0
+        for path in small:
+            current.append(path)
+            current_bytes += sizes[path]
+            if len(current) >= self.chunk_size or current_bytes >= budget:
+                jobs.append((current, False))
+                current, current_bytes = [], 0
+        if current:
+            jobs.append((current, False))
+
+        # Büyük dosyalar en büyükten küçüğe, küçük işlerle dönüşümlü sıraya girer
+        large.sort(key=lambda p: sizes[p], reverse=True)
+        ordered = []
+        large_jobs = [([p], True) for p in large]
+        while jobs or large_jobs:
+            if jobs:
+                ordered.append(jobs.pop(0))
+            if large_jobs:
+                ordered.append(large_jobs.pop(0))
+        return ordered
+
+    def _clean_chunk(self, engine, paths):
+        cleaner = BatchCleaner(engine, chunk_size=len(paths), native=self.native,
+                               keep_icc=self.keep_icc, skip_clean=self.skip_clean,
+                               cancelled=self._cancelled.is_set, profile=self.profile,
+                               logger=self.logger)
+        return cleaner.clean_chunk(paths)
+
+    def _run_job(self, paths, on_result=None, progress=None):
+        with self._slots:
+            if self.cancelled:
+                return [CleanResult.cancelled_result(path) for path in paths]
+            if self.journal is not None:
+                self.journal.mark_started(paths)
+            try:
+                with self.pool.acquire() as engine:
+                    results = self.processor(engine, paths)
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Temizleme işi başarısız: {e}")
+                results = [CleanResult(path, False, str(e)) for path in paths]
+            if self.journal is not None:
+                for result in results:
+                    if not result.cancelled:
+                        self.journal.mark_done(result.path, result.success, result.error)
+            # Sonuçlar iş bittikçe bildirilir
+            for result in results:
+                if result.cancelled:
+                    continue
+                if progress is not None:
+                    progress.update(result)
+                if on_result:
+                    on_result(result)
+            return results
+
+    def clean(self, paths, on_result=None, on_progress=None):
+        """Dosyaları paralel temizle ve sonuçları giriş sırasıyla döndür
+
+        on_progress verilirse işçi iş parçacıklarından, kısıtlanmış aralıklarla
+        ProgressSnapshot ile çağrılır.
+        """
+        paths = list(paths)
+        jobs = self.plan(paths)
+        self.pool.resize(max(self.pool.size, self.workers))
+        progress = BatchProgress(paths, on_progress) if on_progress else None
+
+        # Büyük dosyalar ayrı bir şeritte çalışır; iki şeridin toplamı `workers` kadardır ve
+        # küçük işlere her zaman en az bir işçi kalır. Tek işçide her şey sırayla işlenir.
+        large_count = sum(1 for _, is_large in jobs if is_large)
+        large_workers = min(large_count, self.workers - 1)
+        small_executor = ThreadPoolExecutor(max_workers=self.workers - large_workers,
+                                            thread_name_prefix='metador-clean')
+        large_executor = small_executor
+        if large_workers:
+            large_executor = ThreadPoolExecutor(max_workers=large_workers,
+                                                thread_name_prefix='metador-clean-large')
+        futures = []
+        try:
+            for job, is_large in jobs:
+                executor = large_executor if is_large else small_executor
+                futures.append(executor.submit(self._run_job, job, on_result, progress))
+
+            results = {}
+            for future in futures:
+                for result in future.result():
+                    results[result.path] = result
+        except BaseException:
+            # Ctrl+C ya da beklenmeyen hata: sıradaki işler başlamadan dönsün
+            self.cancel()
+            raise
+        finally:
+            small_executor.shutdown(wait=True)
+            if large_executor is not small_executor:
+                large_executor.shutdown(wait=True)
+
+        if progress is not None:
+            progress.finish()
+        return [results[path] for path in paths]
@@ -0,0 +1,320 @@
+import json
+import os
+import re
+import selectors
+import shutil
+import subprocess
+import threading
+import time
+
+from exiftool_json import JsonStreamParser
+
+
+# Metadata okuma için kullanılan ortak argümanlar (-json ile birlikte)
+READ_ARGS = [
+    '-G',
+    '-struct',
+    '-duplicates',
+    '-unknown',
+    '-charset', 'filename=utf8',
+    '-charset', 'utf8',
+]
+
+
+VERSION_CACHE_FILE = 'exiftool-version.json'
+
+# Akış modunda stdout'un sonunda bekletilen bayt sayısı ({readyN} işaretçisi için)
+READY_TAIL = 32
+
+def argfile_line(arg):
+    """Bir argümanı '-@ -' argfile satırına çevir
+
+    Satır sonu içeren değerler (çok satırlı Comment, Description, XMP) ve
+    '#' ile başlayıp yorum sanılacak argümanlar ExifTool'un '#[CSTR]'
+    satırlarıyla, C kaçış dizileri kullanılarak yazılır.
+    """
+    arg = str(arg)
+    if '\n' not in arg and '\r' not in arg and not arg.startswith('#'):
+        return arg
+    escaped = arg.replace('\\', '\\\\').replace('\n', '\\n').replace('\r', '\\r')
+    return '#[CSTR]' + escaped
+
+
+# Aynı süreçte sürüm bir kez sorulur
+_versions = {}
+
+
+def exiftool_version(executable='exiftool', cache_dir=None):
+    """ExifTool sürümünü döndür; bulunamazsa None
+
+    Sonuç, yürütülebilir dosyanın yolu, boyutu ve mtime'ı ile birlikte
+    cache_dir'e yazılır; dosya değişmedikçe sonraki açılışlarda ExifTool
+    hiç çalıştırılmaz.
+    """
+    path = shutil.which(executable)
+    if path is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = [path, st.st_size, st.st_mtime_ns]
+    if tuple(key) in _versions:
+        return _versions[tuple(key)]
+
+    cache_file = os.path.join(cache_dir, VERSION_CACHE_FILE) if cache_dir else None
+    version = None
+    if cache_file:
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('key') == key:
+                version = cached.get('version')
+        except (OSError, ValueError):
+            pass
+
+    if version is None:
+        try:
+            result = subprocess.run([path, '-ver'], capture_output=True, text=True, timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        version = result.stdout.strip() if result.returncode == 0 else None
+        if version and cache_file:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                with open(cache_file, 'w', encoding='utf-8') as f:
+                    json.dump({'key': key, 'version': version}, f)
+            except OSError:
+                pass
+
+    if version:
+        _versions[tuple(key)] = version
+    return version
+
+
+class ExifToolError(Exception):
+    """ExifTool komutu başarısız olduğunda fırlatılır"""
+
+    def __init__(self, message, stderr=''):
+        super().__init__(message)
+        self.stderr = stderr
+
+
+class ExifToolResult:
+    """Tek bir -execute komutunun çıktısı"""
+
+    def __init__(self, stdout, stderr):
+        self.stdout = stdout  # bytes
+        self.stderr = stderr  # str
+
+    @property
+    def text(self):
+        return self.stdout.decode('utf-8', errors='replace')
+
+    @property
+    def errors(self):
+        return [line for line in self.stderr.splitlines() if line.startswith('Error')]
+
+    @property
+    def warnings(self):
+        return [line for line in self.stderr.splitlines() if line.startswith('Warning')]
+
+
+class ExifToolEngine:
+    """Pencere ömrü boyunca açık kalan tek bir ExifTool süreci (-stay_open True -@ -)
+
+    Komutlar stdin üzerinden argüman dosyası olarak gönderilir, yanıtlar
+    -execute sıra numarasıyla eşleştirilir. Süreç çökerse bir sonraki
+    komutta otomatik olarak yeniden başlatılır.
+    """
+
+    READY_PATTERN = re.compile(rb'\{ready(\d+)\}\r?\n$')
+
+    def __init__(self, executable='exiftool', logger=None, timeout=None, niceness=0):
+        self.executable = executable
+        self.logger = logger
+        self.timeout = timeout
+        self.niceness = niceness
+        self._process = None
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def is_running(self):
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        """ExifTool sürecini başlat (zaten çalışıyorsa bir şey yapmaz)"""
+        with self._lock:
+            self._start_locked()
+
+    def _start_locked(self):
+        if self.is_running():
+            return
+        self._process = subprocess.Popen(
+            [self.executable, '-stay_open', 'True', '-@', '-'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0
+        )
+        if self.niceness:
+            # Arka plan işleri (ön yükleme gibi) ön plandaki komutları yavaşlatmasın
+            try:
+                os.setpriority(os.PRIO_PROCESS, self._process.pid, self.niceness)
+            except OSError:
+                pass
+        if self.logger:
+            self.logger.debug(f"ExifTool motoru başlatıldı (pid {self._process.pid})")
+
+    def close(self):
+        """ExifTool sürecini düzgünce kapat"""
+        with self._lock:
+            process, self._process = self._process, None
+            if process is None:
+                return
+            try:
+                if process.poll() is None:
+                    process.stdin.write(b'-stay_open\nFalse\n')
+                    process.stdin.flush()
+                process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                process.kill()
+                process.wait()
+            finally:
+                for stream in (process.stdin, process.stdout, process.stderr):
+                    try:
+                        stream.close()
+                    except OSError:
+                        pass
+            if self.logger:
+                self.logger.debug("ExifTool motoru kapatıldı")
+
+    def _kill_locked(self):
+        if self._process is not None:
+            try:
+                self._process.kill()
+                self._process.wait()
+            except OSError:
+                pass
+            self._process = None
+
+    def execute(self, *args, check=False, timeout=None, sink=None):
+        """Argümanları çalışan sürece gönder ve ExifToolResult döndür
+
+        sink verilirse stdout biriktirilmez, geldikçe sink.feed()'e aktarılır.
+        """
+        with self._lock:
+            try:
+                result = self._execute_locked(args, timeout, sink)
+            except (BrokenPipeError, EOFError, ConnectionResetError) as e:
+                # Süreç çökmüş, yeniden başlatıp bir kez daha dene
+                if self.logger:
+                    self.logger.warning(f"ExifTool süreci yanıt vermedi, yeniden başlatılıyor: {e}")
+                self._kill_locked()
+                if sink is not None:
+                    sink.reset()
+                result = self._execute_locked(args, timeout, sink)
+
+        if check and result.errors:
+            raise ExifToolError(f"ExifTool hatası: {result.stderr.strip()}", result.stderr)
+        return result
+
+    def execute_json(self, *args, timeout=None, max_value_size=None):
+        """-json çıktısını ayrıştırılmış liste olarak döndür
+
+        max_value_size verilirse çıktı akış halinde ayrıştırılır ve bu boyutu
+        aşan değerler LazyValue tutamaklarıyla değiştirilir.
+        """
+        if max_value_size:
+            parser = JsonStreamParser(max_value_size)
+            result = self.execute('-json', *args, timeout=timeout, sink=parser)
+            if not parser.entries and parser.oversized == 0:
+                raise ExifToolError(f"ExifTool hatası: {result.stderr.strip()}", result.stderr)
+            data = parser.close()
+            if parser.oversized and self.logger:
+                self.logger.debug(f"{parser.oversized} büyük değer okunmadan bırakıldı")
+        else:
+            result = self.execute('-json', *args, timeout=timeout)
+            if not result.stdout.strip():
+                raise ExifToolError(f"ExifTool hatası: {result.stderr.strip()}", result.stderr)
+            data = json.loads(result.stdout)
+        if result.stderr and self.logger:
+            self.logger.warning(f"ExifTool uyarıları: {result.stderr}")
+        return data
+
+    def read_binary(self, path, tag, timeout=None):
+        """Bir etiketin ham baytlarını (-b) döndür; etiket yoksa None"""
+        result = self.execute('-b', f'-{tag}', path, timeout=timeout)
+        return result.stdout or None
+
+    def _execute_locked(self, args, timeout, sink=None):
+        self._start_locked()
+        self._sequence += 1
+        sequence = self._sequence
+
+        lines = [argfile_line(arg) for arg in args]
+        # -echo4 stderr akışına da aynı işaretçiyi yazar, böylece iki akış senkron kalır
+        lines += ['-echo4', f'{{ready{sequence}}}', f'-execute{sequence}']
+        payload = ('\n'.join(lines) + '\n').encode('utf-8')
+
+        self._process.stdin.write(payload)
+        self._process.stdin.flush()
+
+        stdout, stderr = self._read_reply(sequence, timeout or self.timeout, sink)
+        return ExifToolResult(stdout, stderr.decode('utf-8', errors='replace'))
+
+    def _read_reply(self, sequence, timeout, sink=None):
+        """stdout ve stderr'i aynı anda oku, {readyN} işaretçisine kadar"""
+        buffers = {'stdout': bytearray(), 'stderr': bytearray()}
+        done = {'stdout': False, 'stderr': False}
+        deadline = time.monotonic() + timeout if timeout else None
+
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._process.stdout, selectors.EVENT_READ, 'stdout')
+            selector.register(self._process.stderr, selectors.EVENT_READ, 'stderr')
+
+            while not all(done.values()):
+                wait = None
+                if deadline is not None:
+                    wait = deadline - time.monotonic()
+                    if wait <= 0:
+                        self._kill_locked()
+                        raise ExifToolError("ExifTool zaman aşımına uğradı")
+
+                for key, _ in selector.select(wait):
+                    name = key.data
+                    chunk = os.read(key.fileobj.fileno(), 65536)
+                    if not chunk:
+                        raise EOFError("ExifTool süreci beklenmedik şekilde sonlandı")
+                    buffer = buffers[name]
+                    # İşaretçi ancak sonda olabilir; yalnızca yeni parça ve öncesindeki kuyruk taranır
+                    start = max(0, len(buffer) - READY_TAIL)
+                    buffer.extend(chunk)
+
+                    match = self.READY_PATTERN.search(buffer, start)
+                    if not match:
+                        if sink is not None and name == 'stdout' and len(buffer) > READY_TAIL:
+                            # İşaretçi parçalara bölünmüş olabilir, sonu bekletilir
+                            sink.feed(bytes(buffer[:-READY_TAIL]))
+                            del buffer[:-READY_TAIL]
+                        continue
+                    if int(match.group(1)) != sequence:
+                        # Önceki bir komuttan kalan yanıt, atla
+                        del buffer[:]
+                        if sink is not None and name == 'stdout':
+                            sink.reset()
+                        continue
+                    del buffer[match.start():]
+                    if sink is not None and name == 'stdout':
+                        sink.feed(bytes(buffer))
+                        del buffer[:]
+                    done[name] = True
+                    selector.unregister(key.fileobj)
+
+        return bytes(buffers['stdout']), bytes(buffers['stderr'])
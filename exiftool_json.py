@@ -0,0 +1,188 @@
+import json
+import re
+
+# Bu boyutu (bayt) aşan metin değerleri bellekte tutulmaz, tembel tutamakla değiştirilir
+DEFAULT_MAX_VALUE_SIZE = 64 * 1024
+
+# ExifTool'un -b kullanılmadığında ikili veriler için yazdığı yer tutucu
+BINARY_PATTERN = re.compile(r'^\(Binary data (\d+) bytes')
+
+_STRUCTURAL = re.compile(rb'["{}\[\]]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+
+def binary_placeholder(size):
+    return f"(Binary data {size} bytes, use -b option to extract)"
+
+
+class LazyValue(str):
+    """Değeri okunmamış büyük bir etiket (küçük resim, MakerNote, büyük XMP)
+
+    Metin olarak ExifTool'un yer tutucusu gibi görünür; asıl baytlar yalnızca
+    fetch() çağrıldığında (kopyalama/dışa aktarma) ExifTool'dan okunur.
+    """
+
+    def __new__(cls, path, tag, size):
+        value = super().__new__(cls, binary_placeholder(size))
+        value.path = path
+        value.tag = tag
+        value.size = size
+        return value
+
+    def __getnewargs__(self):
+        # copy.deepcopy (bellek önbelleği) ve pickle için
+        return (self.path, self.tag, self.size)
+
+    def fetch(self, engine):
+        """Ham baytları oku; etiket artık yoksa None"""
+        return engine.read_binary(self.path, self.tag)
+
+
+def attach_lazy_values(entries):
+    """Üst düzey yer tutucu değerleri LazyValue ile değiştir (yerinde)
+
+    Katalogdan okunan veride de yer tutucular düz metin olarak saklandığı
+    için her iki yoldan gelen sonuçlara uygulanır.
+    """
+    for entry in entries:
+        path = entry.get('SourceFile')
+        if not path:
+            continue
+        for key, value in entry.items():
+            if type(value) is str and value.startswith('(Binary data '):
+                match = BINARY_PATTERN.match(value)
+                if match:
+                    entry[key] = LazyValue(path, key, int(match.group(1)))
+    return entries
+
+
+class JsonStreamParser:
+    """ExifTool -json çıktısını parça parça ayrıştırır
+
+    Çıktı '[{...},{...}]' biçimindedir. Yalnızca o an okunan dosyanın nesnesi
+    bellekte tutulur; max_value_size'ı aşan metin değerleri daha okunurken
+    atılır ve yerine ExifTool'un ikili veri yer tutucusu yazılır. Böylece
+    onlarca MB'lık çıktılar ne tek bir dizgede ne de Python nesnelerinde
+    tam olarak birikir.
+    """
+
+    def __init__(self, max_value_size=DEFAULT_MAX_VALUE_SIZE):
+        self.max_value_size = max_value_size
+        self.reset()
+
+    def reset(self):
+        """Yarım kalan çıktıyı at (komut yeniden gönderilmeden önce)"""
+        self.entries = []
+        self.oversized = 0
+        self._containers = []
+        self._last = b''
+        self._entry = None
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._string_size = 0
+        self._dropped = False
+        self._is_key = False
+        self._key = b''
+
+    def feed(self, chunk):
+        i = 0
+        end = len(chunk)
+        while i < end:
+            if self._in_string:
+                i = self._feed_string(chunk, i, end)
+                continue
+
+            match = _STRUCTURAL.search(chunk, i)
+            j = match.start() if match else end
+            segment = chunk[i:j]
+            if self._entry is not None:
+                self._entry += segment
+            segment = segment.rstrip()
+            if segment:
+                self._last = segment[-1:]
+            if match is None:
+                return
+            char = chunk[j:j + 1]
+            i = j + 1
+
+            if char == b'"':
+                # Nesne içinde '{' ya da ',' sonrası gelen dizge anahtardır, kısaltılmaz
+                self._is_key = (self._containers[-1:] == [b'{'] and self._last in (b'{', b','))
+                self._in_string = True
+                if self._entry is not None:
+                    self._entry += char
+                    self._string_start = len(self._entry)
+                self._string_size = 0
+                self._dropped = False
+            elif char in b'{[':
+                self._containers.append(char)
+                if len(self._containers) == 2:
+                    self._entry = bytearray()
+                if self._entry is not None:
+                    self._entry += char
+            else:
+                if not self._containers:
+                    raise ValueError("ExifTool JSON çıktısı beklenmedik şekilde kapandı")
+                self._containers.pop()
+                if self._entry is not None:
+                    self._entry += char
+                    if len(self._containers) == 1:
+                        self._finish_entry()
+            self._last = char
+
+    def _feed_string(self, chunk, i, end):
+        if self._escape:
+            # Önceki parçanın sonunda kalan kaçış karakterinin devamı
+            self._escape = False
+            self._append_string(chunk[i:i + 1])
+            return i + 1
+
+        match = _STRING_SPECIAL.search(chunk, i)
+        j = match.start() if match else end
+        self._append_string(chunk[i:j])
+        if match is None:
+            return end
+
+        if chunk[j:j + 1] == b'\\':
+            if j + 1 < end:
+                self._append_string(chunk[j:j + 2])
+                return j + 2
+            self._append_string(chunk[j:j + 1])
+            self._escape = True
+            return end
+
+        # Dizgenin sonu
+        self._in_string = False
+        self._last = b'"'
+        if self._entry is not None:
+            if self._is_key:
+                self._key = bytes(self._entry[self._string_start:])
+            elif self._dropped:
+                self._entry += binary_placeholder(self._string_size).encode('utf-8')
+            self._entry += b'"'
+        return j + 1
+
+    def _append_string(self, data):
+        self._string_size += len(data)
+        if self._entry is None or self._dropped:
+            return
+        if (self.max_value_size and self._string_size > self.max_value_size
+                and not self._is_key and self._key != b'SourceFile'):
+            # Büyük değer: şimdiye kadar biriken kısmı da at
+            del self._entry[self._string_start:]
+            self._dropped = True
+            self.oversized += 1
+            return
+        self._entry += data
+
+    def _finish_entry(self):
+        entry = json.loads(self._entry)
+        self._entry = None
+        self.entries.append(entry)
+
+    def close(self):
+        """Ayrıştırılan dosya nesnelerini döndür"""
+        if self._in_string or self._containers or self._entry is not None:
+            raise ValueError("ExifTool JSON çıktısı yarım kaldı")
+        return attach_lazy_values(self.entries)
@@ -0,0 +1,21 @@
+import mimetypes
+from pathlib import Path
+
+# Metadata temizleme için desteklenmeyen dosya tipleri
+UNSUPPORTED_EXTENSIONS = {'.lnk', '.url', '.desktop', '.exe', '.dll', '.sys', '.bat', '.cmd'}
+UNSUPPORTED_MIMES = {'application/x-ms-shortcut', 'application/x-msdownload'}
+
+
+def is_supported_file_type(file_path):
+    """Dosya tipinin metadata temizleme için desteklenip desteklenmediğini kontrol eder"""
+    file_ext = Path(file_path).suffix.lower()
+
+    if file_ext in UNSUPPORTED_EXTENSIONS:
+        return False, f"'{file_ext}' dosya tipi metadata temizleme için desteklenmiyor."
+
+    # MIME type kontrolü
+    mime_type, _ = mimetypes.guess_type(file_path)
+    if mime_type and mime_type in UNSUPPORTED_MIMES:
+        return False, f"'{mime_type}' dosya tipi desteklenmiyor."
+
+    return True, None
@@ -0,0 +1,107 @@
+import os
+import threading
+import time
+
+from backup_strategy import BACKUP_SUFFIX
+
+DEFAULT_PAGE_SIZE = 500
+# Sayfa dolmasa da bu aralıkla bulunan dosyalar teslim edilir
+FLUSH_INTERVAL = 0.2
+
+
+def _is_candidate(entry, accept):
+    name = entry.name
+    # Yarım kalmış temizliklerden kalan yedek ve geçici dosyalar
+    if name.endswith(BACKUP_SUFFIX) or name.startswith('.metador-'):
+        return False
+    return accept is None or accept(entry.path)
+
+
+def iter_files(roots, accept=None, cancelled=None, logger=None):
+    """Klasörleri derinlik öncelikli, her klasörde ada göre sıralı gez
+
+    Klasör olmayan kökler olduğu gibi döndürülür. Sembolik bağlı klasörlere
+    inilmez (döngüleri önlemek için).
+    """
+    for root in roots:
+        if not os.path.isdir(root):
+            yield root
+            continue
+        stack = [root]
+        while stack:
+            if cancelled is not None and cancelled():
+                return
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as iterator:
+                    entries = sorted(iterator, key=lambda entry: entry.name)
+            except OSError as e:
+                if logger:
+                    logger.warning(f"Klasör okunamadı: {directory} - {e}")
+                continue
+
+            subdirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file() and _is_candidate(entry, accept):
+                        yield entry.path
+                except OSError:
+                    continue
+            # Alt klasörler ada göre sırayla işlensin diye ters eklenir
+            stack.extend(reversed(subdirs))
+
+
+class FolderScanner:
+    """Klasör ağaçlarını os.scandir ile akış halinde, arka planda gezer
+
+    Bulunan dosyalar sayfalar halinde on_batch'e verilir; böylece büyük bir
+    ağacın tamamı listelenmeden gezinme ve temizleme başlayabilir. Geri
+    çağrılar tarama iş parçacığında çalışır.
+    """
+
+    def __init__(self, roots, on_batch, on_finished=None, accept=None,
+                 page_size=DEFAULT_PAGE_SIZE, logger=None):
+        self.roots = list(roots)
+        self.on_batch = on_batch
+        self.on_finished = on_finished
+        self.accept = accept
+        self.page_size = max(1, int(page_size))
+        self.logger = logger
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._worker, name='metador-scan', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def _worker(self):
+        count = 0
+        page = []
+        last_flush = time.monotonic()
+        try:
+            for path in iter_files(self.roots, self.accept, self._cancelled.is_set, self.logger):
+                page.append(path)
+                now = time.monotonic()
+                if len(page) >= self.page_size or now - last_flush >= FLUSH_INTERVAL:
+                    if self.cancelled:
+                        return
+                    count += len(page)
+                    self.on_batch(page)
+                    page = []
+                    last_flush = now
+            if page and not self.cancelled:
+                count += len(page)
+                self.on_batch(page)
+        finally:
+            if self.logger:
+                self.logger.info(f"Klasör taraması bitti: {count} dosya")
+            if self.on_finished and not self.cancelled:
+                self.on_finished(count)
@@ -0,0 +1,167 @@
+# Metador komut satırı modu: metador --headless clean|dump|edit YOLLAR...
+# GTK/Adw yüklenmez; ekransız sunucularda ve cron işlerinde kullanılır.
+# Her dosya için stdout'a bir JSON satırı yazılır.
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import threading
+
+from batch_cleaner import DEFAULT_CHUNK_SIZE
+from batch_progress import format_bytes, format_duration
+from batch_editor import BatchEditor, read_chunk
+from clean_profiles import load_profiles, DEFAULT_PROFILE
+from clean_scheduler import CleanScheduler, EnginePool, default_worker_count
+from file_types import is_supported_file_type
+from folder_scanner import iter_files
+
+# Çıkış kodları
+EXIT_OK = 0
+EXIT_FAILURES = 1       # En az bir dosya işlenemedi
+EXIT_USAGE = 2          # argparse ile aynı
+EXIT_NO_EXIFTOOL = 3
+EXIT_INTERRUPTED = 130
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='metador --headless',
+                                     description="Metador'u arayüz olmadan çalıştır")
+    parser.add_argument('-v', '--verbose', action='store_true', help="ayrıntılı günlük (stderr)")
+    parser.add_argument('-j', '--workers', type=int, default=0,
+                        help="paralel ExifTool süreci sayısı (0 = işlemci sayısı)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="tek komutta işlenecek en fazla dosya")
+    parser.add_argument('--progress', action='store_true',
+                        help="ilerlemeyi, hızı ve kalan süreyi stderr'e yaz")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    clean = commands.add_parser('clean', help="metadata'yı temizle")
+    clean.add_argument('--no-native', action='store_true', help="JPEG/PNG için de ExifTool kullan")
+    clean.add_argument('--drop-icc', action='store_true', help="ICC renk profilini de sil")
+    clean.add_argument('--no-skip', action='store_true', help="zaten temiz dosyaları da yeniden yaz")
+    clean.add_argument('--size-weighted', action='store_true', help="büyük dosyaları ayrı şeritte işle")
+    clean.add_argument('-p', '--profile', default=DEFAULT_PROFILE,
+                       help="temizlik profili (full, gps, camera, keep_copyright ya da ayarlardaki bir profil)")
+    clean.add_argument('paths', nargs='+')
+
+    dump = commands.add_parser('dump', help="metadata'yı JSON olarak yaz")
+    dump.add_argument('paths', nargs='+')
+
+    edit = commands.add_parser('edit', help="etiketleri değiştir")
+    edit.add_argument('-t', '--tag', action='append', required=True, metavar='ETIKET=DEĞER',
+                      help="değiştirilecek etiket (birden çok kez verilebilir, boş değer siler)")
+    edit.add_argument('paths', nargs='+')
+    return parser
+
+
+def parse_tags(values):
+    changes = {}
+    for value in values:
+        if '=' not in value:
+            raise ValueError(f"Geçersiz etiket: {value!r} (ETIKET=DEĞER bekleniyor)")
+        key, _, tag_value = value.partition('=')
+        changes[key.strip()] = tag_value
+    return changes
+
+
+def read_settings():
+    """Arayüzle ortak settings.json'u oku (kullanıcı profilleri için)"""
+    config_dir = os.environ.get('XDG_CONFIG_HOME') or os.path.expanduser('~/.config')
+    try:
+        with open(os.path.join(config_dir, 'metador', 'settings.json'), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def result_record(command, result):
+    if not result.success:
+        return {'path': result.path, 'status': 'error', 'error': result.error}
+    if command == 'dump':
+        return {'path': result.path, 'status': 'ok', 'metadata': result.data}
+    if result.skipped:
+        return {'path': result.path, 'status': 'skipped'}
+    return {'path': result.path, 'status': 'cleaned' if command == 'clean' else 'edited'}
+
+
+def print_progress(snapshot):
+    line = (f"{snapshot.done}/{snapshot.total} dosya, {format_bytes(snapshot.bytes_done)}"
+            f" / {format_bytes(snapshot.bytes_total)}, {snapshot.files_per_second:.1f} dosya/sn,"
+            f" kalan {format_duration(snapshot.eta)}")
+    sys.stderr.write(line + ('\n' if snapshot.finished else '\r'))
+    sys.stderr.flush()
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING, stream=sys.stderr,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    logger = logging.getLogger('metador.headless')
+
+    if args.command == 'edit':
+        try:
+            changes = parse_tags(args.tag)
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.command == 'clean':
+        profiles = load_profiles(read_settings(), logger=logger)
+        if args.profile not in profiles:
+            parser.error(f"Bilinmeyen profil: {args.profile} (mevcut: {', '.join(profiles)})")
+
+    if shutil.which('exiftool') is None:
+        print("ExifTool bulunamadı. Lütfen sisteminize 'exiftool' paketini kurun.", file=sys.stderr)
+        return EXIT_NO_EXIFTOOL
+
+    paths = []
+    for path in iter_files(args.paths, accept=lambda p: is_supported_file_type(p)[0], logger=logger):
+        supported, error = is_supported_file_type(path)
+        if supported:
+            paths.append(path)
+        else:
+            logger.warning(f"Desteklenmeyen dosya atlanıyor: {path} - {error}")
+
+    workers = args.workers or default_worker_count()
+    pool = EnginePool(workers, logger=logger)
+    options = {}
+    if args.command == 'clean':
+        options = {
+            'native': not args.no_native,
+            'keep_icc': not args.drop_icc,
+            'skip_clean': not args.no_skip,
+            'size_weighted': args.size_weighted,
+            'profile': profiles[args.profile],
+        }
+    elif args.command == 'dump':
+        options['processor'] = lambda engine, chunk: read_chunk(engine, chunk, logger)
+    else:
+        options['processor'] = lambda engine, chunk: BatchEditor(engine, changes, logger).edit_chunk(chunk)
+    scheduler = CleanScheduler(pool, workers=workers, chunk_size=args.chunk_size, logger=logger, **options)
+
+    output_lock = threading.Lock()
+    counts = {'ok': 0, 'error': 0}
+
+    def emit(result):
+        # Sonuçlar işler bittikçe yazılır; sıra giriş sırasıyla aynı olmayabilir
+        line = json.dumps(result_record(args.command, result), ensure_ascii=False, default=str)
+        with output_lock:
+            counts['ok' if result.success else 'error'] += 1
+            sys.stdout.write(line + '\n')
+            sys.stdout.flush()
+
+    try:
+        scheduler.clean(paths, on_result=emit, on_progress=print_progress if args.progress else None)
+    except KeyboardInterrupt:
+        return EXIT_INTERRUPTED
+    finally:
+        pool.close()
+
+    logger.info(f"{args.command}: {counts['ok']} başarılı, {counts['error']} hatalı")
+    return EXIT_FAILURES if counts['error'] else EXIT_OK
+
+
+if __name__ == '__main__':
+    sys.exit(main())
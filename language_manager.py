@@ -1,7 +1,12 @@
 import configparser
+import marshal
 import os
+import zlib
 from gi.repository import Gio, GLib
 
+# Derlenmiş katalog biçimi değişirse artırılır
+CATALOG_VERSION = 1
+
 class LanguageManager:
     def __init__(self):
         self.current_language = 'turkish'
@@ -58,63 +63,115 @@ class LanguageManager:
                 pass
     
     def load_translations(self):
-        """Çeviri dosyalarını yükle"""
-        # Dinamik dil listesi oluştur
-        available_langs = self.get_available_language_files()
+        """Yalnızca etkin dili ve yedek olarak İngilizceyi yükle"""
+        self.translations = {}
+        self._texts = {}
+        for lang in dict.fromkeys(['english', self.current_language]):
+            self.load_language(lang)
+        self._rebuild_texts()
+    
+    def load_language(self, lang):
+        """Bir dili derlenmiş önbellekten ya da .ini kaynağından yükle"""
+        if lang in self.translations:
+            return True
         
-        for lang in available_langs:
-            # Önce GResource'tan yüklemeyi dene
+        source = self._read_source(lang)
+        if source is None:
+            return False
+        cache_key, read_content = source
+        
+        cache_file = os.path.join(GLib.get_user_cache_dir(), 'metador', f'translations-{lang}.marshal')
+        texts = self._load_compiled(cache_file, cache_key)
+        if texts is None:
             try:
-                resource_path = f"/com/github/metador/languages/{lang}.ini"
-                resource_bytes = Gio.resources_lookup_data(resource_path, Gio.ResourceLookupFlags.NONE)
-                content = resource_bytes.get_data().decode('utf-8')
-                
-                config = configparser.ConfigParser()
-                config.read_string(content)
-                self.translations[lang] = {}
-                for section in config.sections():
-                    self.translations[lang][section] = dict(config[section])
-            except:
-                # Fallback: dosya sisteminden yükle
-                lang_file = os.path.join(self.languages_dir, f'{lang}.ini')
-                if os.path.exists(lang_file):
-                    config = configparser.ConfigParser()
-                    config.read(lang_file, encoding='utf-8')
-                    self.translations[lang] = {}
-                    for section in config.sections():
-                        self.translations[lang][section] = dict(config[section])
+                texts = self._compile(read_content())
+            except (OSError, UnicodeDecodeError, configparser.Error):
+                return False
+            self._store_compiled(cache_file, cache_key, texts)
+        
+        self.translations[lang] = texts
+        return True
+    
+    def _read_source(self, lang):
+        """(önbellek anahtarı, içerik okuyucu) döndür; dil bulunamazsa None
+        
+        Dosya sistemindeki kaynak için anahtar yol, boyut ve mtime'dır;
+        dosya yalnızca önbellek geçersizse okunur.
+        """
+        # Önce GResource'tan yüklemeyi dene
+        try:
+            resource_path = f"/com/github/metador/languages/{lang}.ini"
+            data = Gio.resources_lookup_data(resource_path, Gio.ResourceLookupFlags.NONE).get_data()
+            return ['resource', zlib.crc32(data)], lambda: data.decode('utf-8')
+        except Exception:
+            pass
+        
+        # Fallback: dosya sisteminden yükle
+        lang_file = os.path.join(self.languages_dir, f'{lang}.ini')
+        try:
+            st = os.stat(lang_file)
+        except OSError:
+            return None
+        
+        def read_file():
+            with open(lang_file, 'r', encoding='utf-8') as f:
+                return f.read()
+        return ['file', lang_file, st.st_size, st.st_mtime_ns], read_file
+    
+    def _compile(self, content):
+        """.ini içeriğini (bölüm, anahtar) -> metin sözlüğüne çevir"""
+        config = configparser.ConfigParser()
+        config.read_string(content)
+        return {(section, key): value for section in config.sections() for key, value in config[section].items()}
+    
+    def _load_compiled(self, cache_file, cache_key):
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = marshal.load(f)
+            if cached.get('key') == cache_key and cached.get('version') == CATALOG_VERSION:
+                return cached['texts']
+        except (OSError, EOFError, ValueError, TypeError, AttributeError, KeyError):
+            pass
+        return None
+    
+    def _store_compiled(self, cache_file, cache_key, texts):
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            tmp_file = f'{cache_file}.{os.getpid()}.tmp'
+            with open(tmp_file, 'wb') as f:
+                marshal.dump({'version': CATALOG_VERSION, 'key': cache_key, 'texts': texts}, f)
+            os.replace(tmp_file, cache_file)
+        except (OSError, ValueError):
+            pass
+    
+    def _rebuild_texts(self):
+        """İngilizce yedek üzerine etkin dili yazarak tek bir düz sözlük oluştur"""
+        texts = dict(self.translations.get('english', {}))
+        texts.update(self.translations.get(self.current_language, {}))
+        self._texts = texts
     
     def get_text(self, section, key, fallback=None, **kwargs):
         """Çeviri metnini al"""
-        try:
-            text = self.translations[self.current_language][section][key]
-            if kwargs:
-                return text.format(**kwargs)
-            return text
-        except KeyError:
-            # Fallback to English if Turkish translation not found
-            try:
-                text = self.translations['english'][section][key]
-                if kwargs:
-                    return text.format(**kwargs)
-                return text
-            except KeyError:
-                # Eğer İngilizce'de de yoksa, 'fallback' değerini veya anahtarı döndür
-                if fallback:
-                    return fallback
-                return f"{section}.{key}"
+        text = self._texts.get((section, key))
+        if text is None:
+            # Eğer İngilizce'de de yoksa, 'fallback' değerini veya anahtarı döndür
+            return fallback if fallback else f"{section}.{key}"
+        if kwargs:
+            return text.format(**kwargs)
+        return text
     
     def set_language(self, language):
         """Dili değiştir"""
-        if language in self.translations:
+        if self.load_language(language):
             self.current_language = language
+            self._rebuild_texts()
             self.save_settings()
             return True
         return False
     
     def get_available_languages(self):
         """Mevcut dilleri dinamik olarak al"""
-        return list(self.translations.keys())
+        return self.get_available_language_files()
     
     def get_current_language(self):
         """Mevcut dili al"""
@@ -0,0 +1,120 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+import time
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+
+# Ayrıntılı mod kapalıyken tek bir kaydın en fazla uzunluğu
+MAX_MESSAGE_CHARS = 2000
+# Ayrıntılı mod kapalıyken saniyede yazılacak en fazla DEBUG kaydı
+DEBUG_PER_SECOND = 50
+
+# Kuyruk dolarsa yeni kayıtlar atılır; çalışan iş parçacıkları diski beklemez
+QUEUE_SIZE = 10000
+
+
+def truncate(text, limit=MAX_MESSAGE_CHARS):
+    """Uzun bir metni kısalt ve atılan karakter sayısını ekle"""
+    text = str(text)
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}... (+{len(text) - limit} karakter)"
+
+
+class LogLimiter(logging.Filter):
+    """Kayıtları kısaltır ve DEBUG kayıtlarını saniye başına sınırlar
+
+    Sınırı aşan DEBUG kayıtları atılır; atılanların sayısı bir sonraki
+    yazılan kayda eklenir. verbose açıkken hiçbir şey değiştirilmez.
+    """
+
+    def __init__(self, verbose=False, max_chars=MAX_MESSAGE_CHARS, debug_per_second=DEBUG_PER_SECOND):
+        super().__init__()
+        self.verbose = verbose
+        self.max_chars = max_chars
+        self.debug_per_second = debug_per_second
+        self._window = 0
+        self._count = 0
+        self._dropped = 0
+
+    def filter(self, record):
+        if self.verbose:
+            return True
+        if record.levelno <= logging.DEBUG:
+            now = int(time.monotonic())
+            if now != self._window:
+                self._window = now
+                self._count = 0
+            self._count += 1
+            if self._count > self.debug_per_second:
+                self._dropped += 1
+                return False
+
+        message = record.getMessage()
+        if len(message) > self.max_chars:
+            message = truncate(message, self.max_chars)
+        if self._dropped:
+            message = f"{message} [{self._dropped} DEBUG kaydı atlandı]"
+            self._dropped = 0
+        record.msg = message
+        record.args = None
+        return True
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+class LogPipeline:
+    """Kayıtları kuyruğa alıp ayrı bir iş parçacığında yazan günlük hattı
+
+    Logger'a yalnızca bir QueueHandler eklenir; biçimlendirme, dosyaya
+    yazma ve boyuta göre döndürme QueueListener iş parçacığında yapılır.
+    """
+
+    def __init__(self, logger, log_file, verbose=False, max_bytes=DEFAULT_MAX_BYTES,
+                 backup_count=DEFAULT_BACKUP_COUNT, console_level=logging.INFO):
+        self.logger = logger
+        self.verbose = verbose
+        formatter = logging.Formatter(LOG_FORMAT)
+
+        # Konsol handler
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(console_level)
+        console_handler.setFormatter(formatter)
+
+        # Dosya handler - boyut aşılınca metador.log.1, .2 ... olarak döndürülür
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(formatter)
+
+        self.queue = queue.Queue(QUEUE_SIZE)
+        self.queue_handler = _DroppingQueueHandler(self.queue)
+        # Kısaltma kuyruğa girmeden yapılır, büyük metinler bellekte beklemez
+        self.queue_handler.addFilter(LogLimiter(verbose))
+        self.listener = logging.handlers.QueueListener(
+            self.queue, console_handler, file_handler, respect_handler_level=True)
+
+    def start(self):
+        self.logger.addHandler(self.queue_handler)
+        self.listener.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        """Kuyruktaki kayıtları yaz ve dinleyiciyi durdur"""
+        if self.listener._thread is None:
+            return
+        self.listener.stop()
+        self.logger.removeHandler(self.queue_handler)
+        for handler in self.listener.handlers:
+            handler.close()
@@ -0,0 +1,207 @@
+import datetime
+import mmap
+import os
+import struct
+from collections import namedtuple
+
+# Bu boyutun üzerindeki videolar için ExifTool beklenirken hızlı tarama yapılır
+QUICK_SCAN_THRESHOLD = 256 * 1024 * 1024
+
+# Metadata taşıyan bir kutunun/elemanın dosya içindeki bayt aralığı
+MetadataRange = namedtuple('MetadataRange', ['path', 'offset', 'size'])
+
+# İçine inilen ISO-BMFF kapsayıcı kutuları
+ISOBMFF_CONTAINERS = {b'moov', b'trak', b'udta', b'meta', b'ilst', b'mdia', b'minf'}
+# Metadata taşıyan ISO-BMFF kutuları
+ISOBMFF_METADATA = {b'udta', b'meta', b'uuid', b'ilst', b'XMP_', b'Xtra'}
+
+# XMP paketini taşıyan uuid kutusunun kimliği
+XMP_UUID = bytes.fromhex('be7acfcb97a942e89c71999491e3afac')
+
+ISOBMFF_QUICK_TAGS = {
+    b'\xa9mak': 'Make',
+    b'\xa9mod': 'Model',
+    b'\xa9too': 'Encoder',
+    b'\xa9day': 'ContentCreateDate',
+    b'\xa9nam': 'Title',
+    b'\xa9ART': 'Artist',
+    b'\xa9swr': 'Software',
+}
+
+QUICKTIME_EPOCH = datetime.datetime(1904, 1, 1, tzinfo=datetime.timezone.utc)
+MATROSKA_EPOCH = datetime.datetime(2001, 1, 1, tzinfo=datetime.timezone.utc)
+
+# Matroska eleman kimlikleri
+EBML_HEADER = 0x1A45DFA3
+MKV_SEGMENT = 0x18538067
+MKV_CLUSTER = 0x1F43B675
+MKV_INFO = 0x1549A966
+MKV_METADATA = {
+    0x1549A966: 'Info',
+    0x1254C367: 'Tags',
+    0x1941A469: 'Attachments',
+    0x1043A770: 'Chapters',
+}
+MKV_INFO_TAGS = {
+    0x7BA9: ('Title', 'string'),
+    0x4D80: ('MuxingApp', 'string'),
+    0x5741: ('WritingApp', 'string'),
+    0x4461: ('DateTimeOriginal', 'date'),
+}
+
+
+class ScanResult:
+    """Tarama sonucu: metadata bayt aralıkları ve hızlıca okunabilen etiketler"""
+
+    def __init__(self, container, ranges, tags):
+        self.container = container  # 'isobmff', 'matroska' ya da None
+        self.ranges = ranges
+        self.tags = tags
+
+
+def _format_date(epoch, seconds):
+    try:
+        value = epoch + datetime.timedelta(seconds=seconds)
+    except OverflowError:
+        return None
+    return value.strftime('%Y:%m:%d %H:%M:%S')
+
+
+def _iter_boxes(mm, start, end):
+    """[start, end) aralığındaki ISO-BMFF kutularını (tip, başlangıç, başlık, bitiş) olarak gez"""
+    offset = start
+    while offset + 8 <= end:
+        size, box_type = struct.unpack_from('>I4s', mm, offset)
+        header = 8
+        if size == 1:
+            if offset + 16 > end:
+                return
+            size = struct.unpack_from('>Q', mm, offset + 8)[0]
+            header = 16
+        elif size == 0:
+            size = end - offset
+        if size < header or offset + size > end:
+            return
+        yield box_type, offset, header, offset + size
+        offset += size
+
+
+def scan_isobmff(mm):
+    ranges = []
+    tags = {}
+
+    def walk(start, end, parent):
+        for box_type, offset, header, box_end in _iter_boxes(mm, start, end):
+            name = box_type.decode('latin-1')
+            path = f'{parent}/{name}' if parent else name
+            body = offset + header
+
+            if box_type == b'uuid' and mm[body:body + 16] == XMP_UUID:
+                ranges.append(MetadataRange(path + ':XMP', offset, box_end - offset))
+            elif box_type in ISOBMFF_METADATA:
+                ranges.append(MetadataRange(path, offset, box_end - offset))
+
+            if box_type == b'mvhd':
+                version = mm[body]
+                if version == 1:
+                    created, _, timescale, duration = struct.unpack_from('>QQIQ', mm, body + 4)
+                else:
+                    created, _, timescale, duration = struct.unpack_from('>IIII', mm, body + 4)
+                if created:
+                    tags['QuickTime:CreateDate'] = _format_date(QUICKTIME_EPOCH, created)
+                if timescale:
+                    tags['QuickTime:Duration'] = f'{duration / timescale:.2f} s'
+            elif box_type == b'\xa9xyz':
+                # ISO 6709 konum dizgesi: 2 bayt uzunluk + 2 bayt dil kodu
+                length = struct.unpack_from('>H', mm, body)[0]
+                tags['QuickTime:GPSCoordinates'] = bytes(mm[body + 4:body + 4 + length]).decode('utf-8', 'replace')
+            elif parent.endswith('ilst') and box_type in ISOBMFF_QUICK_TAGS:
+                for child_type, child_offset, child_header, child_end in _iter_boxes(mm, body, box_end):
+                    if child_type == b'data':
+                        value = bytes(mm[child_offset + child_header + 8:child_end])
+                        tags[f'QuickTime:{ISOBMFF_QUICK_TAGS[box_type]}'] = value.decode('utf-8', 'replace')
+                        break
+            elif box_type in ISOBMFF_CONTAINERS:
+                # 'meta' bir "full box"tur: çocuklardan önce 4 bayt sürüm/bayrak gelir
+                # (QuickTime tarzı meta'da bu alan yoktur, 'hdlr' doğrudan başlar)
+                child_start = body
+                if box_type == b'meta' and mm[body + 4:body + 8] != b'hdlr':
+                    child_start += 4
+                walk(child_start, box_end, path)
+
+    walk(0, len(mm), '')
+    return ranges, tags
+
+
+def _read_vint(mm, offset, keep_marker=False):
+    """EBML değişken uzunluklu tamsayısını oku; (değer, uzunluk, bilinmeyen_boyut_mu)"""
+    first = mm[offset]
+    if first == 0:
+        raise ValueError("Geçersiz EBML vint")
+    length = 8 - first.bit_length() + 1
+    value = first if keep_marker else first & ((1 << (8 - length)) - 1)
+    for i in range(1, length):
+        value = (value << 8) | mm[offset + i]
+    unknown = not keep_marker and value == (1 << (7 * length)) - 1
+    return value, length, unknown
+
+
+def _iter_elements(mm, start, end):
+    offset = start
+    while offset < end:
+        element_id, id_length, _ = _read_vint(mm, offset, keep_marker=True)
+        size, size_length, unknown = _read_vint(mm, offset + id_length)
+        data = offset + id_length + size_length
+        data_end = end if unknown else data + size
+        if data_end > end:
+            data_end = end
+        yield element_id, offset, data, data_end, unknown
+        if unknown:
+            return
+        offset = data_end
+
+
+def scan_matroska(mm):
+    ranges = []
+    tags = {}
+    for element_id, offset, data, data_end, _ in _iter_elements(mm, 0, len(mm)):
+        if element_id != MKV_SEGMENT:
+            continue
+        for child_id, child_offset, child_data, child_end, unknown in _iter_elements(mm, data, data_end):
+            if child_id in MKV_METADATA:
+                ranges.append(MetadataRange(f'Segment/{MKV_METADATA[child_id]}', child_offset, child_end - child_offset))
+            if child_id == MKV_INFO:
+                for info_id, _, info_data, info_end, _ in _iter_elements(mm, child_data, child_end):
+                    if info_id not in MKV_INFO_TAGS:
+                        continue
+                    name, kind = MKV_INFO_TAGS[info_id]
+                    raw = bytes(mm[info_data:info_end])
+                    if kind == 'string':
+                        tags[f'Matroska:{name}'] = raw.rstrip(b'\x00').decode('utf-8', 'replace')
+                    elif len(raw) == 8:
+                        nanoseconds = struct.unpack('>q', raw)[0]
+                        tags[f'Matroska:{name}'] = _format_date(MATROSKA_EPOCH, nanoseconds / 1e9)
+            if child_id == MKV_CLUSTER and unknown:
+                # Boyutu bilinmeyen küme (canlı yayın kaydı); devamı taranamaz
+                break
+        break
+    return ranges, tags
+
+
+def scan_file(path):
+    """Dosyayı belleğe almadan mmap ile tara ve ScanResult döndür"""
+    size = os.path.getsize(path)
+    if size < 16:
+        return ScanResult(None, [], {})
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        try:
+            if struct.unpack_from('>I', mm, 0)[0] == EBML_HEADER:
+                ranges, tags = scan_matroska(mm)
+                return ScanResult('matroska', ranges, tags)
+            if mm[4:8] in (b'ftyp', b'moov', b'mdat', b'wide', b'free', b'skip'):
+                ranges, tags = scan_isobmff(mm)
+                return ScanResult('isobmff', ranges, tags)
+        except (ValueError, IndexError, struct.error):
+            pass
+    return ScanResult(None, [], {})
@@ -0,0 +1,103 @@
+import copy
+import os
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def file_fingerprint(path):
+    """Dosyanın (aygıt, inode, boyut, mtime_ns) parmak izi; dosya yoksa None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def estimate_size(value):
+    """Ayrıştırılmış JSON verisinin bellekte kapladığı yaklaşık bayt sayısı"""
+    if isinstance(value, (str, bytes)):
+        return len(value) + 48
+    if isinstance(value, dict):
+        return 64 + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return 56 + sum(estimate_size(v) for v in value)
+    return 24
+
+
+class MetadataCache:
+    """Ayrıştırılmış ExifTool sonuçları için kayıt ve bayt sınırlı LRU önbellek
+
+    Anahtar dosyanın parmak izidir; dosya değiştiğinde parmak izi de
+    değişeceği için eski kayıt kendiliğinden geçersiz olur.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self.total_bytes = 0
+        self._entries = OrderedDict()  # parmak izi -> (veri, boyut)
+        self._paths = {}               # yol -> son bilinen parmak izi
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, path, fingerprint=None):
+        """Dosya değişmediyse önbellekteki verinin bir kopyasını döndür"""
+        fingerprint = fingerprint or file_fingerprint(path)
+        if fingerprint is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is None:
+                return None
+            self._entries.move_to_end(fingerprint)
+            self._paths[path] = fingerprint
+            data = copy.deepcopy(entry[0])
+
+        # Aynı inode'a farklı bir yoldan (hardlink) erişilmiş olabilir
+        for item in data:
+            if isinstance(item, dict) and 'SourceFile' in item:
+                item['SourceFile'] = path
+        return data
+
+    def put(self, path, data, fingerprint=None):
+        fingerprint = fingerprint or file_fingerprint(path)
+        if fingerprint is None:
+            return
+        size = estimate_size(data)
+        if size > self.max_bytes:
+            return
+        data = copy.deepcopy(data)
+        with self._lock:
+            old = self._paths.get(path)
+            if old is not None and old != fingerprint:
+                self._remove_locked(old)
+            self._remove_locked(fingerprint)
+            self._entries[fingerprint] = (data, size)
+            self._paths[path] = fingerprint
+            self.total_bytes += size
+            while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove_locked(oldest)
+
+    def invalidate(self, path):
+        """Kaydetme/temizleme sonrası dosyanın kaydını çıkar"""
+        with self._lock:
+            fingerprint = self._paths.pop(path, None)
+            if fingerprint is not None:
+                self._remove_locked(fingerprint)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._paths.clear()
+            self.total_bytes = 0
+
+    def _remove_locked(self, fingerprint):
+        entry = self._entries.pop(fingerprint, None)
+        if entry is not None:
+            self.total_bytes -= entry[1]
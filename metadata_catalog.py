@@ -0,0 +1,230 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+import zlib
+
+from metadata_cache import file_fingerprint
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+CATALOG_FILE = 'catalog.sqlite3'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    fingerprint TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS metadata_path ON metadata(path);
+CREATE INDEX IF NOT EXISTS metadata_accessed ON metadata(accessed);
+"""
+
+
+def fingerprint_key(fingerprint):
+    return ':'.join(str(part) for part in fingerprint)
+
+
+class MetadataCatalog:
+    """Oturumlar arası kalıcı ExifTool JSON kataloğu (SQLite, WAL modu)
+
+    Okumalar çağıran iş parçacığının kendi bağlantısıyla yapılır; yazmalar
+    tek bir arka plan yazıcısına kuyruklanır, böylece arayüz beklemez.
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES, logger=None):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, CATALOG_FILE)
+        self.max_bytes = max(1, int(max_bytes))
+        self.logger = logger
+        self._local = threading.local()
+        self._queue = queue.Queue()
+        self._closed = False
+
+        connection = self._connect()
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.executescript(SCHEMA)
+        connection.commit()
+
+        self._writer = threading.Thread(target=self._writer_loop, name='metador-catalog', daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=10)
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def get(self, path, fingerprint=None):
+        """Dosyanın parmak izi eşleşiyorsa kayıtlı ExifTool verisini döndür"""
+        fingerprint = fingerprint or file_fingerprint(path)
+        if fingerprint is None:
+            return None
+        key = fingerprint_key(fingerprint)
+        try:
+            row = self._connect().execute(
+                'SELECT data FROM metadata WHERE fingerprint = ?', (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            if self.logger:
+                self.logger.warning(f"Katalog okunamadı: {e}")
+            return None
+        if row is None:
+            return None
+
+        self._queue.put(('touch', key))
+        data = json.loads(zlib.decompress(row[0]))
+        for item in data:
+            if isinstance(item, dict) and 'SourceFile' in item:
+                item['SourceFile'] = path
+        return data
+
+    def iter_entries(self):
+        """Dosyası değişmemiş tüm kayıtları (yol, veri) olarak döndür
+
+        Arama dizinini açılışta doldurmak için kullanılır; çağıran iş
+        parçacığının kendi bağlantısıyla okunur.
+        """
+        try:
+            rows = self._connect().execute('SELECT fingerprint, path, data FROM metadata')
+        except sqlite3.Error as e:
+            if self.logger:
+                self.logger.warning(f"Katalog okunamadı: {e}")
+            return
+        for key, path, blob in rows:
+            fingerprint = file_fingerprint(path)
+            if fingerprint is None or fingerprint_key(fingerprint) != key:
+                continue
+            try:
+                data = json.loads(zlib.decompress(blob))
+            except (zlib.error, ValueError):
+                continue
+            yield path, data
+
+    def put(self, path, data, fingerprint=None):
+        """Veriyi arka planda kataloğa yaz"""
+        fingerprint = fingerprint or file_fingerprint(path)
+        if fingerprint is None or self._closed:
+            return
+        blob = zlib.compress(json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), 1)
+        self._queue.put(('put', (fingerprint_key(fingerprint), path, blob)))
+
+    def invalidate(self, path):
+        if not self._closed:
+            self._queue.put(('invalidate', path))
+
+    def clear(self):
+        """Kataloğu tamamen boşalt ve diski geri kazan"""
+        self._run_sync('clear')
+
+    def compact(self):
+        """Artık var olmayan ya da değişmiş dosyaların kayıtlarını sil, dosyayı küçült"""
+        return self._run_sync('compact')
+
+    def flush(self):
+        """Kuyruktaki tüm yazmaların bitmesini bekle"""
+        self._run_sync('flush')
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(('stop', None))
+        self._writer.join(timeout=5)
+
+    def _run_sync(self, command):
+        if self._closed:
+            return None
+        done = threading.Event()
+        reply = {}
+        self._queue.put((command, (done, reply)))
+        done.wait()
+        return reply.get('result')
+
+    def _writer_loop(self):
+        connection = self._connect()
+        pending = 0
+        while True:
+            command, payload = self._queue.get()
+            try:
+                if command == 'stop':
+                    connection.commit()
+                    connection.close()
+                    return
+                elif command == 'put':
+                    key, path, blob = payload
+                    connection.execute('DELETE FROM metadata WHERE path = ? AND fingerprint != ?', (path, key))
+                    connection.execute(
+                        'INSERT OR REPLACE INTO metadata (fingerprint, path, data, size, accessed) '
+                        'VALUES (?, ?, ?, ?, ?)',
+                        (key, path, blob, len(blob), time.time())
+                    )
+                    pending += 1
+                elif command == 'touch':
+                    connection.execute('UPDATE metadata SET accessed = ? WHERE fingerprint = ?', (time.time(), payload))
+                    pending += 1
+                elif command == 'invalidate':
+                    connection.execute('DELETE FROM metadata WHERE path = ?', (payload,))
+                    pending += 1
+                else:
+                    done, reply = payload
+                    try:
+                        connection.commit()
+                        if command == 'clear':
+                            connection.execute('DELETE FROM metadata')
+                            connection.commit()
+                            self._vacuum(connection)
+                        elif command == 'compact':
+                            reply['result'] = self._compact(connection)
+                    finally:
+                        done.set()
+                    pending = 0
+                    continue
+
+                # Arka arkaya gelen yazmalar tek işlemde toplanır
+                if pending >= 64 or self._queue.empty():
+                    connection.commit()
+                    self._evict(connection)
+                    pending = 0
+            except sqlite3.Error as e:
+                if self.logger:
+                    self.logger.warning(f"Katalog yazılamadı: {e}")
+
+    def _evict(self, connection):
+        """Boyut sınırı aşıldıysa en uzun süredir kullanılmayan kayıtları sil"""
+        total = connection.execute('SELECT COALESCE(SUM(size), 0) FROM metadata').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        rows = connection.execute('SELECT fingerprint, size FROM metadata ORDER BY accessed').fetchall()
+        victims = []
+        for key, size in rows:
+            if total - removed <= target:
+                break
+            victims.append((key,))
+            removed += size
+        connection.executemany('DELETE FROM metadata WHERE fingerprint = ?', victims)
+        connection.commit()
+        if self.logger:
+            self.logger.debug(f"Katalogdan {len(victims)} kayıt çıkarıldı")
+
+    def _compact(self, connection):
+        stale = []
+        for key, path in connection.execute('SELECT fingerprint, path FROM metadata').fetchall():
+            fingerprint = file_fingerprint(path)
+            if fingerprint is None or fingerprint_key(fingerprint) != key:
+                stale.append((key,))
+        connection.executemany('DELETE FROM metadata WHERE fingerprint = ?', stale)
+        connection.commit()
+        self._vacuum(connection)
+        return len(stale)
+
+    def _vacuum(self, connection):
+        connection.execute('VACUUM')
+        connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
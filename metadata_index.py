@@ -0,0 +1,300 @@
+import re
+import shlex
+import threading
+
+# Her dosyada farklı olan ya da aramaya değmeyen etiketlerin değerleri dizinlenmez
+# (etiketin varlığı yine de dizinlenir)
+UNINDEXED_VALUES = {
+    'sourcefile', 'filename', 'directory', 'filesize', 'filemodifydate', 'fileaccessdate',
+    'fileinodechangedate', 'filepermissions', 'exiftoolversion',
+}
+# Bundan uzun değerler (XMP paketleri, yer tutucular) dizinlenmez
+MAX_VALUE_LENGTH = 128
+
+_CLAUSE = re.compile(r'^(?P<tag>[\w:\-*]+?)\s*(?P<op>!=|>=|<=|=|~|>|<)(?P<value>.*)$', re.S)
+_OPERATOR_SPACES = re.compile(r'\s*(!=|>=|<=|=|~|>|<)\s*')
+_RANGE = re.compile(r'^(\d{4})(?:\.\.(\d{4}))?$')
+
+
+def normalize(value):
+    return str(value).strip().lower()
+
+
+def _add_posting(postings, key, doc):
+    # Tek belgeli girdiler bellek için küme yerine tamsayı olarak tutulur
+    current = postings.get(key)
+    if current is None:
+        postings[key] = doc
+    elif isinstance(current, set):
+        current.add(doc)
+    elif current != doc:
+        postings[key] = {current, doc}
+
+
+def _remove_posting(postings, key, doc):
+    current = postings.get(key)
+    if current is None:
+        return
+    if isinstance(current, set):
+        current.discard(doc)
+        if len(current) == 1:
+            postings[key] = next(iter(current))
+        elif not current:
+            del postings[key]
+    elif current == doc:
+        del postings[key]
+
+
+def _docs(posting):
+    if posting is None:
+        return set()
+    if isinstance(posting, set):
+        return posting
+    return {posting}
+
+
+def _number(value):
+    try:
+        return float(str(value).split()[0])
+    except (ValueError, IndexError):
+        return None
+
+
+class MetadataIndex:
+    """Yüklenen dosyaların etiketleri üzerinde bellek içi ters dizin
+
+    Her 'Grup:Etiket' için etiketin hangi dosyalarda bulunduğu ve kısa
+    değerlerin hangi dosyalarda geçtiği tutulur. Sorgular boşlukla ayrılmış
+    ve hepsi sağlanması gereken koşullardan oluşur:
+
+        has:GPS                 GPS grubu ya da GPS ile başlayan bir etiket
+        Make=Canon              değer eşitliği (büyük/küçük harf duyarsız)
+        EXIF:Model~eos          değer içinde arama
+        DateTimeOriginal in 2023    (ya da 2021..2023) yıl aralığı
+        ISO>=800                sayısal karşılaştırma
+        -has:GPS                başına '-' koşulu tersine çevirir
+
+    Etiket adı grupsuz yazılırsa tüm gruplardaki aynı adlı etiketler aranır.
+    Arama dizindeki tüm dosyaları kapsar: load_catalog() ile kalıcı
+    katalogdan eklenen, o an açık olmayan dosyalar da sonuçlarda yer alır.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        self._paths = []          # belge no -> yol (silinenler None)
+        self._free = []           # silinen dosyalardan boşalan, yeniden kullanılacak belge noları
+        self._ids = {}            # yol -> belge no
+        self._terms = {}          # belge no -> (etiket anahtarları, (anahtar, değer) çiftleri)
+        self._presence = {}       # 'grup:etiket' -> belgeler
+        self._groups = {}         # 'grup' -> belgeler
+        self._values = {}         # 'grup:etiket' -> {değer -> belgeler}
+        self._keys_by_name = {}   # 'etiket' -> {'grup:etiket', ...}
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, path):
+        return path in self._ids
+
+    def add(self, path, entry):
+        """Bir dosyanın ExifTool kaydını dizine ekle (varsa eskisinin yerine)"""
+        keys = []
+        pairs = []
+        for key, value in entry.items():
+            if ':' not in key:
+                continue  # SourceFile
+            full_key = key.lower()
+            keys.append(full_key)
+            if full_key.split(':', 1)[1] in UNINDEXED_VALUES or isinstance(value, (dict, list)):
+                continue
+            value = normalize(value)
+            if value and len(value) <= MAX_VALUE_LENGTH and not value.startswith('(binary data '):
+                pairs.append((full_key, value))
+
+        with self._lock:
+            # Yeniden yüklenen dosya aynı belge nosunu korur
+            doc = self._ids.get(path)
+            if doc is not None:
+                self._remove_terms_locked(doc)
+            elif self._free:
+                doc = self._free.pop()
+            else:
+                doc = len(self._paths)
+                self._paths.append(None)
+            self._paths[doc] = path
+            self._ids[path] = doc
+            self._terms[doc] = (tuple(keys), tuple(pairs))
+            for full_key in keys:
+                group, name = full_key.split(':', 1)
+                _add_posting(self._presence, full_key, doc)
+                _add_posting(self._groups, group, doc)
+                self._keys_by_name.setdefault(name, set()).add(full_key)
+            for full_key, value in pairs:
+                _add_posting(self._values.setdefault(full_key, {}), value, doc)
+
+    def remove(self, path):
+        with self._lock:
+            self._remove_locked(path)
+
+    def _remove_locked(self, path):
+        doc = self._ids.pop(path, None)
+        if doc is None:
+            return
+        self._paths[doc] = None
+        self._remove_terms_locked(doc)
+        self._free.append(doc)
+
+    def _remove_terms_locked(self, doc):
+        """Belgenin tüm girdilerini çıkar; boşalan anahtarlar da silinir"""
+        keys, pairs = self._terms.pop(doc)
+        for full_key in keys:
+            _remove_posting(self._presence, full_key, doc)
+            _remove_posting(self._groups, full_key.split(':', 1)[0], doc)
+            if full_key not in self._presence:
+                name = full_key.split(':', 1)[1]
+                full_keys = self._keys_by_name.get(name)
+                if full_keys is not None:
+                    full_keys.discard(full_key)
+                    if not full_keys:
+                        del self._keys_by_name[name]
+        for full_key, value in pairs:
+            values = self._values.get(full_key)
+            if values is not None:
+                _remove_posting(values, value, doc)
+                if not values:
+                    del self._values[full_key]
+
+    def clear(self):
+        with self._lock:
+            self._reset()
+
+    def _matching_keys(self, tag):
+        """Sorgudaki etiket adına uyan 'grup:etiket' anahtarları"""
+        tag = tag.lower()
+        if ':' in tag:
+            return [tag] if tag in self._presence else []
+        return list(self._keys_by_name.get(tag, ()))
+
+    def _has(self, name):
+        name = name.lower()
+        docs = set(_docs(self._groups.get(name)))
+        if ':' in name:
+            return docs | _docs(self._presence.get(name))
+        for tag, full_keys in self._keys_by_name.items():
+            if tag.startswith(name):
+                for full_key in full_keys:
+                    docs |= _docs(self._presence.get(full_key))
+        return docs
+
+    def _compare(self, tag, op, operand):
+        docs = set()
+        if op != 'in':
+            operand = normalize(operand)
+        number = _number(operand) if op in ('>', '<', '>=', '<=') else None
+        if op in ('>', '<', '>=', '<=') and number is None:
+            raise ValueError(f"Sayısal değer bekleniyor: {operand}")
+        for full_key in self._matching_keys(tag):
+            values = self._values.get(full_key, {})
+            if op == '=':
+                docs |= _docs(values.get(operand))
+                continue
+            for value, posting in values.items():
+                if op == '~':
+                    matched = operand in value
+                elif op == 'in':
+                    matched = operand[0] <= value[:4] <= operand[1] and value[:4].isdigit()
+                else:
+                    value_number = _number(value)
+                    matched = value_number is not None and (
+                        (op == '>' and value_number > number) or (op == '<' and value_number < number) or
+                        (op == '>=' and value_number >= number) or (op == '<=' and value_number <= number))
+                if matched:
+                    docs |= _docs(posting)
+        return docs
+
+    def _parse(self, query):
+        """Sorguyu (ters_mi, tür, argümanlar) koşullarına çevir"""
+        # 'Make = Canon' ile 'Make=Canon' aynıdır
+        query = _OPERATOR_SPACES.sub(r'\1', query)
+        try:
+            tokens = shlex.split(query)
+        except ValueError as e:
+            raise ValueError(f"Geçersiz sorgu: {e}")
+        clauses = []
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            negate = token.startswith('-') and len(token) > 1
+            if negate:
+                token = token[1:]
+            if token.lower() == 'has' and i + 1 < len(tokens):
+                clauses.append((negate, 'has', (tokens[i + 1],)))
+                i += 2
+                continue
+            if token.lower().startswith('has:'):
+                clauses.append((negate, 'has', (token[4:],)))
+            elif i + 2 < len(tokens) and tokens[i + 1].lower() == 'in':
+                match = _RANGE.match(tokens[i + 2])
+                if not match:
+                    raise ValueError(f"Yıl ya da yıl aralığı bekleniyor: {tokens[i + 2]}")
+                clauses.append((negate, 'compare', (token, 'in', (match.group(1), match.group(2) or match.group(1)))))
+                i += 3
+                continue
+            else:
+                match = _CLAUSE.match(token)
+                if not match:
+                    raise ValueError(f"Anlaşılmayan koşul: {token}")
+                op = '=' if match.group('op') == '!=' else match.group('op')
+                if match.group('op') == '!=':
+                    negate = not negate
+                clauses.append((negate, 'compare', (match.group('tag'), op, match.group('value'))))
+            i += 1
+        if not clauses:
+            raise ValueError("Boş sorgu")
+        return clauses
+
+    def search(self, query):
+        """Sorguya uyan dosyaların yollarını belge nosu sırasıyla döndür"""
+        clauses = self._parse(query)
+        with self._lock:
+            result = None
+            excluded = set()
+            for negate, kind, args in clauses:
+                if kind == 'has':
+                    docs = self._has(*args)
+                elif args[1] == 'in':
+                    docs = self._compare(args[0], 'in', args[2])
+                else:
+                    docs = self._compare(*args)
+                if negate:
+                    excluded |= docs
+                elif result is None:
+                    result = set(docs)
+                else:
+                    result &= docs
+            if result is None:
+                result = set(self._ids.values())
+            result -= excluded
+            return [self._paths[doc] for doc in sorted(result)]
+
+    def load_catalog(self, catalog, cancelled=None):
+        """Kalıcı katalogdaki (hâlâ geçerli) kayıtları dizine ekle
+
+        Eklenen dosyalar açık olmasalar da aramalarda bulunur; sonuçlar
+        dosya listesinin yerine geçtiğinde böylece açılmış olurlar.
+        """
+        count = 0
+        for path, data in catalog.iter_entries():
+            if cancelled is not None and cancelled():
+                break
+            if path in self._ids:
+                continue
+            for entry in data:
+                if isinstance(entry, dict):
+                    self.add(path, entry)
+                    count += 1
+                    break
+        return count
@@ -1,11 +1,31 @@
 #!/usr/bin/env python3
+import os
+import sys
+import time
+
+# --profile-startup için başlangıç anı (GTK yüklenmeden önce)
+STARTUP_TIME = time.perf_counter()
+
+# Komut satırı modu GTK yüklenmeden, en başta ayrılır
+if __name__ == '__main__' and sys.argv[1:2] == ['--headless']:
+    if os.path.exists('/usr/share/metador/headless.py'):
+        sys.path.insert(0, '/usr/share/metador')
+    from headless import main
+    sys.exit(main(sys.argv[2:]))
+
+import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 gi.require_version('GdkPixbuf', '2.0')
-from gi.repository import Gtk, Adw, GLib, Gio, Gdk, GdkPixbuf
+from gi.repository import Gtk, Adw, GLib, Gio, Gdk, GdkPixbuf, GObject, Pango
+import shutil
 import subprocess
 import json
-import os
+import logging
+import sqlite3
+import threading
+import traceback
+from pathlib import Path
 
 # Önce sistem konumunu dene
 system_lang_manager = Path('/usr/share/metador/language_manager.py')
@@ -16,16 +36,78 @@ else:
     # Yerel konumdan import et
     from language_manager import LanguageManager
 
+from exiftool_engine import ExifToolEngine, ExifToolError, READ_ARGS, exiftool_version
+from exiftool_json import LazyValue, attach_lazy_values, DEFAULT_MAX_VALUE_SIZE
+from batch_cleaner import DEFAULT_CHUNK_SIZE
+from backup_strategy import create_backup
+from batch_editor import BatchEditor, edit_args
+from clean_journal import CleanJournal
+from clean_profiles import load_profiles, DEFAULT_PROFILE
+from folder_scanner import FolderScanner
+import native_cleaner
+from native_cleaner import NativeCleanError
+from clean_scheduler import CleanScheduler, EnginePool, default_worker_count
+from batch_progress import format_bytes, format_duration
+from metadata_cache import MetadataCache, file_fingerprint, DEFAULT_MAX_ENTRIES, DEFAULT_MAX_BYTES
+from metadata_catalog import MetadataCatalog, DEFAULT_MAX_BYTES as CATALOG_MAX_BYTES
+from metadata_index import MetadataIndex
+from prefetcher import Prefetcher, PreviewCache
+from preview_loader import PreviewLoader, DEFAULT_WORKERS as PREVIEW_WORKERS
+from thumbnail_cache import ThumbnailCache
+import media_scanner
+import file_types
+from log_pipeline import LogPipeline, truncate, DEFAULT_MAX_BYTES as LOG_MAX_BYTES, DEFAULT_BACKUP_COUNT as LOG_BACKUP_COUNT
+
+class MetadataItem(GObject.Object):
+    """Metadata listesindeki tek bir satır ya da grup başlığı"""
+    
+    def __init__(self, kind, group, title, subtitle='', icon_name='', key=None, value=None):
+        super().__init__()
+        self.kind = kind  # 'header' ya da 'row'
+        self.group = group
+        self.title = title
+        self.subtitle = subtitle
+        self.icon_name = icon_name
+        self.key = key
+        self.value = value
+
+# Ayrıntılı günlük kapalıyken ExifTool çıktısından yazılan kısım
+PAYLOAD_PREVIEW_CHARS = 200
+
+# RAW fotoğraf uzantıları (önizleme gömülü JPEG'den alınır)
+RAW_EXTENSIONS = ['.raw', '.cr2', '.cr3', '.nef', '.arw', '.dng', '.orf', '.rw2', '.pef', '.srw']
+
+class StartupProfiler:
+    """--profile-startup ile açılış aşamalarının sürelerini ölçer"""
+    
+    def __init__(self, start):
+        self.start = self.last = start
+        self.phases = []
+    
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+    
+    def report(self, stream=None):
+        stream = stream or sys.stderr
+        for phase, duration in self.phases:
+            print(f"{phase:<32} {duration * 1000:8.1f} ms", file=stream)
+        print(f"{'toplam (ilk pencere)':<32} {(self.last - self.start) * 1000:8.1f} ms", file=stream)
+
 class MetadataCleanerWindow(Adw.ApplicationWindow):
-    def __init__(self, **kwargs):
+    def __init__(self, lang=None, profiler=None, check_journal=True, **kwargs):
         super().__init__(**kwargs)
-        self.lang = LanguageManager()
-        self.setup_logging()
+        # Uygulamanın LanguageManager'ı paylaşılır, çeviriler ikinci kez okunmaz
+        self.lang = lang or LanguageManager()
+        self.profiler = profiler
+        self.logger = logging.getLogger('metador')
         self.set_title(self.lang.get_text('MAIN', 'app_title'))
         
-        # Tema ayarlarını yükle
+        # Tema ayarlarını yükle (günlük ayarları da buradan okunur)
         self.settings_file = Path(GLib.get_user_config_dir()) / "metador" / "settings.json"
         self.load_theme_settings()
+        self.setup_logging()
         
         # Icon theme'e pixmaps path'ini ekle
         try:
@@ -53,32 +135,249 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
         self.metadata = {}
         self.changed_metadata = {}
         self.about_click_count = 0  # Easter Egg için tıklama sayacı
+        self.folder_scanner = None  # Açılan klasörleri arka planda tarar
+        
+        # Yükleme, kaydetme ve temizleme için ortak kalıcı ExifTool süreci
+        self.exiftool = ExifToolEngine(logger=self.logger)
+        self.clean_pool = None  # Toplu temizlikte ilk kullanımda oluşturulur
+        self.active_batch = None  # Süren toplu işin zamanlayıcısı (iptal için)
+        self.clean_profiles = load_profiles(self.settings, logger=self.logger)
+        self.clean_profile = self.clean_profiles[DEFAULT_PROFILE]
+        self.clean_journal = CleanJournal(os.path.join(GLib.get_user_data_dir(), "metador"), logger=self.logger)
+        self.metadata_cache = MetadataCache(
+            max_entries=self.get_setting('metadata_cache_entries', DEFAULT_MAX_ENTRIES),
+            max_bytes=self.get_setting('metadata_cache_mb', DEFAULT_MAX_BYTES // (1024 * 1024)) * 1024 * 1024
+        )
+        self.metadata_catalog = None
+        if self.get_setting('metadata_catalog', False):
+            self.open_metadata_catalog()
+        
+        # Okunan her dosyanın etiketleri dosyalar arası arama için dizinlenir
+        self.search_index = MetadataIndex()
+        self.search_cancelled = False
+        if self.metadata_catalog is not None and self.get_setting('search_index_catalog', True):
+            threading.Thread(target=self.load_search_index, daemon=True).start()
+        
+        # Komşu dosyalar için arka plan ön yükleyici (nice'lanmış ayrı bir ExifTool süreci)
+        self.preview_cache = PreviewCache()
+        self.preview_engine = ExifToolEngine(logger=self.logger)  # RAW önizlemeleri için, ilk kullanımda başlar
+        self.thumbnail_cache = None
+        if self.get_setting('use_thumbnail_cache', True):
+            self.thumbnail_cache = ThumbnailCache(logger=self.logger)
+        self.preview_loader = PreviewLoader(
+            self.create_preview_pixbuf, self.preview_cache,
+            workers=self.get_setting('preview_workers', PREVIEW_WORKERS), logger=self.logger
+        )
+        self.prefetch_engine = ExifToolEngine(logger=self.logger, niceness=10)
+        prefetch_tasks = [self.prefetch_metadata]
+        if self.get_setting('prefetch_previews', True):
+            prefetch_tasks.append(self.prefetch_preview)
+        self.prefetcher = Prefetcher(prefetch_tasks, radius=self.get_setting('prefetch_radius', 2), logger=self.logger)
+        self.connect("close-request", self.on_close_request)
+        # Sürüm arka planda sorulur; önbellek soğuksa 'exiftool -ver' ana thread'i bekletmez
+        self.exiftool_version = None
+        threading.Thread(target=self.probe_exiftool_version, daemon=True).start()
+        self.mark_startup("pencere: ayarlar ve motorlar")
         
         self.setup_ui()
+        self.mark_startup("pencere: arayüz")
         self.load_css()
         self.apply_theme()
-   
+        self.mark_startup("pencere: CSS ve tema")
+        
+        # Önceki oturumda yarım kalan temizlik varsa sürdürmeyi öner (süreç başına bir kez;
+        # dil değişiminde yeniden oluşturulan pencere günlüğe dokunmaz)
+        if check_journal:
+            GLib.idle_add(self.check_interrupted_clean)
+        
+        if self.profiler is not None:
+            self.connect("map", self._on_first_map)
         
-        # Dosya handler - kullanıcı dizininde
+        self.logger.info("Metador başlatıldı")
+    
+    def setup_logging(self):
+        """Loglama sistemini ayarla"""
+        # ExifTool çıktısının tamamı yalnızca bu ayar açıkken yazılır
+        self.verbose_log = self.get_setting('verbose_exiftool_log', False)
+        if self.logger.handlers:
+            return  # Dil değişince pencere yeniden oluşturulur
+        self.logger.setLevel(logging.DEBUG)
+        
+        # Dosya kullanıcı dizininde; yazma işi arka planda, boyuta göre döndürülerek yapılır
         log_dir = Path(GLib.get_user_data_dir()) / "metador"
         log_dir.mkdir(parents=True, exist_ok=True)
-        log_file = log_dir / "metador.log"
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        pipeline = LogPipeline(
+            self.logger, log_dir / "metador.log", verbose=self.verbose_log,
+            max_bytes=self.get_setting('log_max_mb', LOG_MAX_BYTES // (1024 * 1024)) * 1024 * 1024,
+            backup_count=self.get_setting('log_backups', LOG_BACKUP_COUNT)
+        )
+        pipeline.start()
+    
+    def log_payload(self, label, payload):
+        """Büyük bir çıktıyı günlüğe yaz; ayrıntılı mod kapalıysa yalnızca başını"""
+        if self.verbose_log:
+            self.logger.debug(f"{label}: {payload}")
+        else:
+            self.logger.debug(f"{label}: {truncate(payload, PAYLOAD_PREVIEW_CHARS)}")
+    
+    def mark_startup(self, phase):
+        if self.profiler is not None:
+            self.profiler.mark(phase)
+    
+    def _on_first_map(self, window):
+        """Pencere ilk kez çizildikten sonra açılış süresini raporla"""
+        self.disconnect_by_func(self._on_first_map)
         
-        self.logger.info("Metador başlatıldı")
+        def report():
+            self.mark_startup("ilk kare")
+            self.profiler.report()
+            return False
+        
+        GLib.idle_add(report, priority=GLib.PRIORITY_LOW)
+    
+    def on_close_request(self, window):
+        """Pencere kapanırken işleri durdur ve ExifTool süreçlerini arka planda kapat"""
+        if self.folder_scanner is not None:
+            self.folder_scanner.cancel()
+        if self.active_batch is not None:
+            self.active_batch.cancel()
+        self.search_cancelled = True
+        self.prefetcher.close()
+        self.preview_loader.close()
+        # Motorlar süren parça bitene kadar kilitli kalabilir; arayüz donmasın diye
+        # ayrı bir iş parçacığında kapatılır (daemon değil, süreç çıkmadan bitmesi beklenir)
+        threading.Thread(target=self.shutdown_engines, name='metador-shutdown').start()
+        return False
+    
+    def shutdown_engines(self):
+        """ExifTool süreçlerini, kataloğu ve temizlik günlüğünü kapat"""
+        self.preview_engine.close()
+        self.prefetch_engine.close()
+        self.exiftool.close()
+        if self.clean_pool is not None:
+            self.clean_pool.close()
+        if self.metadata_catalog is not None:
+            self.metadata_catalog.close()
+        # Süren bir temizlik varsa günlük silinmez, sonraki açılışta sürdürülebilir
+        self.clean_journal.close()
+    
+    def check_interrupted_clean(self):
+        """Yarım kalan temizliğin yedeklerini çöz ve kalan dosyalar için devam etmeyi öner"""
+        state = self.clean_journal.load()
+        if state is None:
+            return False
+        
+        restored, removed = self.clean_journal.recover_backups(state)
+        self.logger.info(f"Yarım kalan temizlik bulundu: {state.completed_count()}/{len(state.files)} dosya bitmiş, "
+                         f"{restored} yedek geri yüklendi, {removed} yedek silindi")
+        
+        remaining = [path for path in state.remaining() if os.path.exists(path)]
+        if not remaining:
+            self.clean_journal.finish()
+            return False
+        
+        dialog = Adw.MessageDialog.new(self)
+        dialog.set_heading(self.lang.get_text('DIALOGS', 'resume_title'))
+        dialog.set_body(self.lang.get_text('DIALOGS', 'resume_message', done=state.completed_count(),
+                                           total=len(state.files), remaining=len(remaining)))
+        dialog.add_response("discard", self.lang.get_text('DIALOGS', 'discard'))
+        dialog.add_response("resume", self.lang.get_text('DIALOGS', 'resume'))
+        dialog.set_response_appearance("resume", Adw.ResponseAppearance.SUGGESTED)
+        dialog.set_default_response("resume")
+        dialog.set_close_response("discard")
+        dialog.connect("response", self.on_resume_response, remaining, state.profile)
+        dialog.present()
+        return False
+    
+    def on_resume_response(self, dialog, response, remaining, profile_name):
+        if response != "resume":
+            self.clean_journal.finish()
+            return
+        # Yalnızca kalan dosyalar, yarım kalan çalışmanın profiliyle yeni bir çalışma olarak temizlenir
+        self.current_files = remaining
+        self.current_file_index = 0
+        self.clean_metadata(self.clean_profiles.get(profile_name))
+    
+    def open_metadata_catalog(self):
+        """Kalıcı SQLite metadata kataloğunu aç (isteğe bağlı)"""
+        try:
+            catalog_dir = os.path.join(GLib.get_user_cache_dir(), "metador")
+            max_mb = self.get_setting('metadata_catalog_mb', CATALOG_MAX_BYTES // (1024 * 1024))
+            self.metadata_catalog = MetadataCatalog(catalog_dir, max_bytes=max_mb * 1024 * 1024, logger=self.logger)
+        except (sqlite3.Error, OSError) as e:
+            self.logger.warning(f"Metadata kataloğu açılamadı: {e}")
+            self.metadata_catalog = None
+    
+    def invalidate_metadata(self, file_path):
+        """Dosya değiştiğinde önbellek, katalog ve arama dizini kayıtlarını çıkar"""
+        self.metadata_cache.invalidate(file_path)
+        self.search_index.remove(file_path)
+        if self.metadata_catalog is not None:
+            self.metadata_catalog.invalidate(file_path)
+    
+    def load_search_index(self):
+        """Arama dizinini kalıcı katalogdaki kayıtlarla doldur (arka planda)"""
+        start = time.monotonic()
+        count = self.search_index.load_catalog(self.metadata_catalog, lambda: self.search_cancelled)
+        self.logger.info(f"Arama dizini katalogdan yüklendi: {count} dosya, {time.monotonic() - start:.2f} sn")
+    
+    def index_metadata(self, file_path, data):
+        """Okunan ExifTool verisini arama dizinine ekle"""
+        for entry in data or ():
+            if isinstance(entry, dict):
+                self.search_index.add(file_path, entry)
+                return
+    
+    def on_clear_catalog(self, action, param):
+        """Metadata kataloğunu ve bellek önbelleğini temizle"""
+        self.metadata_cache.clear()
+        if self.metadata_catalog is None:
+            return
+        self.run_catalog_task(
+            self.metadata_catalog.clear,
+            lambda result: self.logger.info("Metadata kataloğu temizlendi")
+        )
+    
+    def on_compact_catalog(self, action, param):
+        """Geçersiz katalog kayıtlarını sil ve veritabanını küçült"""
+        if self.metadata_catalog is None:
+            return
+        self.run_catalog_task(
+            self.metadata_catalog.compact,
+            lambda removed: self.logger.info(f"Metadata kataloğu sıkıştırıldı, {removed} kayıt silindi")
+        )
+    
+    def run_catalog_task(self, task, on_done):
+        """Katalog bakımını (DELETE/VACUUM) arka planda çalıştır, bitince on_done(sonuç)
+
+        Bakım sürerken menüdeki katalog eylemleri devre dışı kalır.
+        """
+        actions = [self.lookup_action(name) for name in ("clear-catalog", "compact-catalog")]
+        for action in actions:
+            action.set_enabled(False)
+        
+        def finish(result):
+            for action in actions:
+                action.set_enabled(True)
+            on_done(result)
+            return False
+        
+        def worker():
+            result = task()
+            GLib.idle_add(finish, result)
+        
+        threading.Thread(target=worker, daemon=True).start()
     
     def load_theme_settings(self):
         """Tema ayarlarını yükle"""
         self.current_theme = "light"  # Varsayılan tema
+        self.settings = {}
         
         try:
             if self.settings_file.exists():
                 with open(self.settings_file, 'r') as f:
-                    settings = json.load(f)
-                    self.current_theme = settings.get('theme', 'light')
+                    self.settings = json.load(f)
+                    self.current_theme = self.settings.get('theme', 'light')
         except Exception as e:
             self.logger.warning(f"Tema ayarları yüklenemedi: {e}")
     
@@ -86,12 +385,24 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
         """Tema ayarlarını kaydet"""
         try:
             self.settings_file.parent.mkdir(parents=True, exist_ok=True)
-            settings = {'theme': self.current_theme}
+            self.settings['theme'] = self.current_theme
             with open(self.settings_file, 'w') as f:
-                json.dump(settings, f)
+                json.dump(self.settings, f)
         except Exception as e:
             self.logger.error(f"Tema ayarları kaydedilemedi: {e}")
     
+    def max_value_size(self):
+        """Metadata okumasında bellekte tutulacak en büyük değer (bayt)"""
+        return self.get_setting('max_value_kb', DEFAULT_MAX_VALUE_SIZE // 1024) * 1024
+    
+    def get_setting(self, key, default):
+        """settings.json içindeki bir ayarı, tipi varsayılanla aynı olacak şekilde al"""
+        value = self.settings.get(key, default)
+        try:
+            return type(default)(value)
+        except (TypeError, ValueError):
+            return default
+    
     def apply_theme(self):
         """Temayı uygula"""
         style_manager = Adw.StyleManager.get_default()
@@ -173,6 +484,23 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
         self.theme_button.connect("clicked", self.on_theme_clicked)
         left_box.append(self.theme_button)
         
+        # Ana menü
+        main_menu = Gio.Menu()
+        main_menu.append(self.lang.get_text('MENU', 'clear_catalog'), "win.clear-catalog")
+        main_menu.append(self.lang.get_text('MENU', 'compact_catalog'), "win.compact-catalog")
+        
+        for name, callback in (("clear-catalog", self.on_clear_catalog),
+                               ("compact-catalog", self.on_compact_catalog)):
+            action = Gio.SimpleAction.new(name, None)
+            action.connect("activate", callback)
+            self.add_action(action)
+        
+        menu_button = Gtk.MenuButton()
+        menu_button.set_icon_name("open-menu-symbolic")
+        menu_button.add_css_class("flat")
+        menu_button.set_menu_model(main_menu)
+        left_box.append(menu_button)
+        
         # Hakkında butonu
         about_button = Gtk.Button(icon_name="help-about-symbolic")
         about_button.set_tooltip_text(self.lang.get_text('MENU', 'about'))
@@ -180,6 +508,12 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
         about_button.connect("clicked", self.on_about_clicked)
         left_box.append(about_button)
         
+        # Dosyalar arası metadata araması
+        self.search_button = Gtk.ToggleButton(icon_name="system-search-symbolic")
+        self.search_button.set_tooltip_text(self.lang.get_text('MAIN', 'search'))
+        self.search_button.add_css_class("flat")
+        left_box.append(self.search_button)
+        
         header.pack_start(left_box)
         
         # Sağ taraf butonlar
@@ -230,6 +564,22 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         main_box.append(header)
         
+        # Arama çubuğu: 'has:GPS', 'Make=Canon', 'DateTimeOriginal in 2023' gibi sorgular
+        self.search_bar = Gtk.SearchBar()
+        search_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        self.search_entry = Gtk.SearchEntry(hexpand=True)
+        self.search_entry.set_placeholder_text(self.lang.get_text('MAIN', 'search_placeholder'))
+        self.search_entry.connect("activate", self.on_search_activate)
+        self.search_status = Gtk.Label(xalign=0)
+        self.search_status.add_css_class("dim-label")
+        search_box.append(self.search_entry)
+        search_box.append(self.search_status)
+        self.search_bar.set_child(search_box)
+        self.search_bar.connect_entry(self.search_entry)
+        self.search_button.bind_property("active", self.search_bar, "search-mode-enabled",
+                                         GObject.BindingFlags.BIDIRECTIONAL)
+        main_box.append(self.search_bar)
+        
         # Content
         self.stack = Gtk.Stack()
         self.stack.set_transition_type(Gtk.StackTransitionType.CROSSFADE)
@@ -238,12 +588,70 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
         welcome_page = self.create_welcome_page()
         self.stack.add_named(welcome_page, "welcome")
         
-        # Metadata Page
-        metadata_page = self.create_metadata_page()
-        self.stack.add_named(metadata_page, "metadata")
+        # Metadata sayfası ilk dosya açıldığında oluşturulur
+        self.metadata_page = None
         
         main_box.append(self.stack)
+        
+        # Toplu işlemlerde ilerleme çubuğu ve iptal butonu (ilk kullanımda doldurulur)
+        self.progress_revealer = Gtk.Revealer()
+        self.progress_revealer.set_transition_type(Gtk.RevealerTransitionType.SLIDE_UP)
+        main_box.append(self.progress_revealer)
+        self.progress_bar = None
+        
         self.set_content(main_box)
+    
+    def show_batch_progress(self, total):
+        """İlerleme alanını göster ve sıfırla"""
+        if self.progress_bar is None:
+            action_bar = Gtk.ActionBar()
+            box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4, hexpand=True)
+            self.progress_bar = Gtk.ProgressBar()
+            self.progress_label = Gtk.Label(xalign=0, ellipsize=Pango.EllipsizeMode.END)
+            self.progress_label.add_css_class("dim-label")
+            box.append(self.progress_bar)
+            box.append(self.progress_label)
+            action_bar.set_center_widget(box)
+            
+            self.progress_cancel_button = Gtk.Button(label=self.lang.get_text('DIALOGS', 'cancel'))
+            self.progress_cancel_button.add_css_class("destructive-action")
+            self.progress_cancel_button.connect("clicked", self.on_cancel_batch_clicked)
+            action_bar.pack_end(self.progress_cancel_button)
+            self.progress_revealer.set_child(action_bar)
+        
+        self.progress_bar.set_fraction(0.0)
+        self.progress_label.set_label(f"0/{total}")
+        self.progress_cancel_button.set_label(self.lang.get_text('DIALOGS', 'cancel'))
+        self.progress_cancel_button.set_sensitive(True)
+        self.progress_revealer.set_reveal_child(True)
+    
+    def hide_batch_progress(self):
+        self.active_batch = None
+        self.progress_revealer.set_reveal_child(False)
+    
+    def _on_batch_progress(self, snapshot):
+        """Zamanlayıcıdan gelen (kısıtlanmış) ilerleme bilgisini göster"""
+        if self.progress_bar is None or self.active_batch is None:
+            return
+        if snapshot.bytes_total:
+            self.progress_bar.set_fraction(snapshot.bytes_done / snapshot.bytes_total)
+        elif snapshot.total:
+            self.progress_bar.set_fraction(snapshot.done / snapshot.total)
+        self.progress_label.set_label(self.lang.get_text(
+            'DIALOGS', 'progress_status',
+            done=snapshot.done, total=snapshot.total,
+            bytes_done=format_bytes(snapshot.bytes_done), bytes_total=format_bytes(snapshot.bytes_total),
+            rate=f"{snapshot.files_per_second:.1f}", eta=format_duration(snapshot.eta)
+        ))
+    
+    def on_cancel_batch_clicked(self, button):
+        """Yeni işlerin başlamasını durdur; süren dosyalar biter ya da geri alınır"""
+        if self.active_batch is None:
+            return
+        self.logger.info("Toplu işlem iptal ediliyor")
+        self.active_batch.cancel()
+        button.set_sensitive(False)
+        button.set_label(self.lang.get_text('DIALOGS', 'cancelling'))
         
     def create_welcome_page(self):
         page = Adw.StatusPage()
@@ -273,35 +681,205 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
         open_files_button.add_css_class("pill")
         open_files_button.add_css_class("suggested-action")
         open_files_button.connect("clicked", self.on_open_clicked)
-        page.set_child(open_files_button)
         
-        # Sürükle-bırak desteği
-        drop_target = Gtk.DropTarget.new(Gio.File, Gdk.DragAction.COPY)
+        # Klasör aç butonu
+        open_folder_button = Gtk.Button()
+        folder_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        folder_box.append(Gtk.Image.new_from_icon_name("folder-open-symbolic"))
+        folder_box.append(Gtk.Label(label=self.lang.get_text('MENU', 'open_folder')))
+        open_folder_button.set_child(folder_box)
+        open_folder_button.add_css_class("pill")
+        open_folder_button.connect("clicked", self.on_open_folder_clicked)
+        
+        buttons_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        buttons_box.set_halign(Gtk.Align.CENTER)
+        buttons_box.append(open_files_button)
+        buttons_box.append(open_folder_button)
+        page.set_child(buttons_box)
+        
+        # Sürükle-bırak desteği (birden çok dosya ve klasör)
+        drop_target = Gtk.DropTarget.new(GObject.TYPE_NONE, Gdk.DragAction.COPY)
+        drop_target.set_gtypes([Gdk.FileList, Gio.File])
         drop_target.connect("drop", self.on_file_dropped)
         page.add_controller(drop_target)
         
         return page
     
     def on_file_dropped(self, drop_target, value, x, y):
-        """Dosya sürüklenip bırakıldığında çalışır"""
-        if isinstance(value, Gio.File):
-            file_path = value.get_path()
-            
-            # Dosya tipi kontrolü
-            is_supported, error_msg = self.is_supported_file_type(file_path)
+        """Dosya ya da klasör sürüklenip bırakıldığında çalışır"""
+        if isinstance(value, Gdk.FileList):
+            files = value.get_files()
+        elif isinstance(value, Gio.File):
+            files = [value]
+        else:
+            return False
+        
+        paths = [f.get_path() for f in files if f.get_path()]
+        if not paths:
+            return False
+        
+        # Tek bir dosya bırakıldıysa dosya tipi kontrolü
+        if len(paths) == 1 and not os.path.isdir(paths[0]):
+            is_supported, error_msg = self.is_supported_file_type(paths[0])
             if not is_supported:
                 self.show_error_dialog(
                     "Desteklenmeyen Dosya Tipi",
                     f"{error_msg}\n\nLütfen desteklenen dosya tiplerini seçin."
                 )
                 return False
-            
-            self.current_files = [file_path]
+        
+        self.open_paths(paths)
+        return True
+    
+    def open_paths(self, paths):
+        """Dosya ve klasörleri aç; klasörler arka planda taranır"""
+        if self.folder_scanner is not None:
+            self.folder_scanner.cancel()
+            self.folder_scanner = None
+        
+        files = []
+        folders = []
+        for path in paths:
+            if os.path.isdir(path):
+                folders.append(path)
+            elif self.is_supported_file_type(path)[0] or len(paths) == 1:
+                files.append(path)
+        
+        self.current_files = files
+        self.current_file_index = 0
+        
+        if folders:
+            scanner = FolderScanner(
+                folders,
+                on_batch=lambda batch: GLib.idle_add(self._on_scan_batch, scanner, batch),
+                on_finished=lambda count: GLib.idle_add(self._on_scan_finished, scanner, count),
+                accept=lambda path: self.is_supported_file_type(path)[0],
+                logger=self.logger
+            )
+            self.folder_scanner = scanner
+            self.logger.info(f"Klasör taraması başlatıldı: {', '.join(folders)}")
+            scanner.start()
+        
+        if files:
+            self.load_metadata()
+    
+    def _on_scan_batch(self, scanner, batch):
+        """Taramada bulunan dosyaları listeye ekle (ana thread)"""
+        if scanner is not self.folder_scanner:
+            return False
+        first_batch = not self.current_files
+        self.current_files.extend(batch)
+        if first_batch:
+            # İlk dosyalar geldiğinde tarama bitmeden gösterime başla
             self.current_file_index = 0
             self.load_metadata()
-            return True
+        else:
+            self.update_navigation_buttons()
+            self.update_file_title()
+        return False
+    
+    def _on_scan_finished(self, scanner, count):
+        if scanner is not self.folder_scanner:
+            return False
+        self.folder_scanner = None
+        if not self.current_files:
+            self.show_error_dialog(
+                self.lang.get_text('DIALOGS', 'error_title'),
+                self.lang.get_text('DIALOGS', 'no_supported_files')
+            )
+        return False
+
+    def on_search_activate(self, entry):
+        """Sorguyu çalıştır; açık ama henüz okunmamış dosyalar önce dizinlenir"""
+        query = entry.get_text().strip()
+        if not query:
+            return
+        missing = [path for path in self.current_files if path not in self.search_index]
+        if missing and self.active_batch is None:
+            self.search_status.set_label(self.lang.get_text('MAIN', 'search_indexing', count=len(missing)))
+            entry.set_sensitive(False)
+            threading.Thread(target=self.index_files_worker, args=(missing, query), daemon=True).start()
+            return
+        self.run_search(query)
+
+    def index_files_worker(self, paths, query):
+        """Dizinde olmayan dosyaları parça parça okuyup dizine ekle
+
+        Bellek önbelleği doldurulmaz (gezinme için tutulan kayıtları
+        atmamak için); okunanlar varsa kalıcı kataloğa yazılır.
+        """
+        try:
+            for start in range(0, len(paths), DEFAULT_CHUNK_SIZE):
+                if self.search_cancelled:
+                    return
+                pending = {}
+                for path in paths[start:start + DEFAULT_CHUNK_SIZE]:
+                    if not self.is_supported_file_type(path)[0]:
+                        continue
+                    fingerprint = file_fingerprint(path)
+                    data = self.metadata_cache.get(path, fingerprint)
+                    if data is None and self.metadata_catalog is not None:
+                        data = self.metadata_catalog.get(path, fingerprint)
+                    if data is None:
+                        pending[path] = fingerprint
+                    else:
+                        self.index_metadata(path, data)
+                if not pending:
+                    continue
+                try:
+                    entries = self.prefetch_engine.execute_json(
+                        *READ_ARGS, *pending, max_value_size=self.max_value_size())
+                except (ExifToolError, ValueError, OSError) as e:
+                    # Bozuk bir parça kalan dosyaların dizinlenmesini durdurmaz
+                    self.logger.warning(f"Arama için metadata okunamadı: {e}")
+                    continue
+                for entry in entries:
+                    path = entry.get('SourceFile')
+                    if path not in pending:
+                        continue
+                    self.search_index.add(path, entry)
+                    if self.metadata_catalog is not None:
+                        self.metadata_catalog.put(path, [entry], pending[path])
+        except Exception as e:
+            self.logger.error(f"Arama dizini oluşturulamadı: {e}")
+            self.logger.error(traceback.format_exc())
+        finally:
+            GLib.idle_add(self._on_search_indexed, query)
+
+    def _on_search_indexed(self, query):
+        self.search_entry.set_sensitive(True)
+        if not self.search_cancelled:
+            self.run_search(query)
         return False
 
+    def run_search(self, query):
+        """Dizinde ara ve sonuçları gezinme/temizlik listesi yap"""
+        try:
+            results = self.search_index.search(query)
+        except ValueError as e:
+            self.search_status.set_label(str(e))
+            return
+        self.logger.info(f"Arama: {query} -> {len(results)} dosya")
+        if not results:
+            self.search_status.set_label(self.lang.get_text('MAIN', 'search_no_results'))
+            return
+        self.search_status.set_label(self.lang.get_text('MAIN', 'search_results', count=len(results)))
+
+        # Süren klasör taraması sonuç listesine dosya eklemesin
+        if self.folder_scanner is not None:
+            self.folder_scanner.cancel()
+            self.folder_scanner = None
+        self.current_files = results
+        self.current_file_index = 0
+        self.load_metadata()
+
+    def ensure_metadata_page(self):
+        """Metadata sayfasını ilk kullanımda oluştur (açılışı hızlandırır)"""
+        if self.metadata_page is None:
+            self.metadata_page = self.create_metadata_page()
+            self.stack.add_named(self.metadata_page, "metadata")
+        return self.metadata_page
+    
     def create_metadata_page(self):
         # Ana paned (yan yana bölüm)
         paned = Gtk.Paned(orientation=Gtk.Orientation.HORIZONTAL)
@@ -342,6 +920,10 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
         
         self.file_info_row = Adw.ActionRow()
         
+        # Dosya ikonu
+        file_icon = Gtk.Image.new_from_icon_name("text-x-generic-symbolic")
+        self.file_info_row.add_prefix(file_icon)
+        
         # Navigasyon butonları
         nav_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
         
@@ -382,12 +964,31 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
         scrolled.set_vexpand(True)
         scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         
-        self.metadata_list = Gtk.ListBox()
-        self.metadata_list.add_css_class("boxed-list")
-        self.metadata_list.set_selection_mode(Gtk.SelectionMode.NONE)
+        # Sanal liste: yalnızca görünen satırlar için widget oluşturulur ve yeniden kullanılır
+        self.metadata_store = Gio.ListStore.new(MetadataItem)
+        self.metadata_sections = []
+        self.collapsed_groups = {'File', 'Composite'}  # Başlangıçta kapalı gruplar
+        
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_metadata_item_setup)
+        factory.connect("bind", self._on_metadata_item_bind)
         
+        self.metadata_list = Gtk.ListView.new(Gtk.NoSelection.new(self.metadata_store), factory)
+        self.metadata_list.add_css_class("boxed-list")
+        self.metadata_list.set_single_click_activate(True)
+        self.metadata_list.connect("activate", self._on_metadata_item_activate)
         scrolled.set_child(self.metadata_list)
-        right_panel.append(scrolled)
+        
+        # Metadata yoksa gösterilecek sayfa
+        empty_page = Adw.StatusPage()
+        empty_page.set_icon_name("dialog-information-symbolic")
+        empty_page.set_title(self.lang.get_text('MAIN', 'no_metadata_found'))
+        
+        self.metadata_stack = Gtk.Stack()
+        self.metadata_stack.set_vexpand(True)
+        self.metadata_stack.add_named(scrolled, "list")
+        self.metadata_stack.add_named(empty_page, "empty")
+        right_panel.append(self.metadata_stack)
         
         # Panelleri ekle
         paned.set_start_child(left_panel)
@@ -415,7 +1016,7 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
         # Resim dosyaları
         image_exts = ['*.jpg', '*.jpeg', '*.png', '*.tiff', '*.tif', '*.bmp', '*.gif', '*.webp', '*.heic', '*.heif']
         # RAW dosyaları
-        raw_exts = ['*.raw', '*.cr2', '*.cr3', '*.nef', '*.arw', '*.dng', '*.orf', '*.rw2', '*.pef', '*.srw']
+        raw_exts = [f'*{ext}' for ext in RAW_EXTENSIONS]
         # Video dosyaları
         video_exts = ['*.mp4', '*.avi', '*.mov', '*.mkv', '*.wmv', '*.flv', '*.webm', '*.m4v']
         # Ses dosyaları
@@ -460,27 +1061,26 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
         if response == Gtk.ResponseType.ACCEPT:
             files = dialog.get_files()
             if files:
-                self.current_files = [f.get_path() for f in files]
-                self.current_file_index = 0
-                self.load_metadata()
+                self.open_paths([f.get_path() for f in files])
         dialog.destroy()
     
+    def on_open_folder_clicked(self, button):
+        dialog = Gtk.FileChooserDialog(
+            title=self.lang.get_text('MAIN', 'select_folder'),
+            transient_for=self,
+            action=Gtk.FileChooserAction.SELECT_FOLDER
+        )
+        dialog.set_select_multiple(True)
+        dialog.add_buttons(
+            self.lang.get_text('DIALOGS', 'cancel'), Gtk.ResponseType.CANCEL,
+            self.lang.get_text('MENU', 'open'), Gtk.ResponseType.ACCEPT
+        )
+        dialog.connect("response", self.on_file_dialog_response)
+        dialog.show()
+    
     def is_supported_file_type(self, file_path):
         """Dosya tipinin metadata temizleme için desteklenip desteklenmediğini kontrol eder"""
-        unsupported_extensions = {'.lnk', '.url', '.desktop', '.exe', '.dll', '.sys', '.bat', '.cmd'}
-        file_ext = Path(file_path).suffix.lower()
-        
-        if file_ext in unsupported_extensions:
-            return False, f"'{file_ext}' dosya tipi metadata temizleme için desteklenmiyor."
-        
-        # MIME type kontrolü
-        mime_type, _ = mimetypes.guess_type(file_path)
-        if mime_type:
-            unsupported_mimes = {'application/x-ms-shortcut', 'application/x-msdownload'}
-            if mime_type in unsupported_mimes:
-                return False, f"'{mime_type}' dosya tipi desteklenmiyor."
-        
-        return True, None
+        return file_types.is_supported_file_type(file_path)
 
     def load_metadata(self):
         self.changed_metadata.clear()  # Dosya değiştiğinde değişiklikleri temizle
@@ -489,6 +1089,10 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
             return
         
         current_file = self.current_files[self.current_file_index]
+        self.ensure_metadata_page()
+        
+        # Komşu dosyaları arka planda hazırla
+        self.prefetcher.update(self.current_files, self.current_file_index)
         
         # Dosya tipi kontrolü
         is_supported, error_msg = self.is_supported_file_type(current_file)
@@ -499,6 +1103,19 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
                 f"{error_msg}\n\nLütfen desteklenen dosya tiplerini seçin:\n• Resim dosyaları (JPG, PNG, TIFF, vb.)\n• Video dosyaları (MP4, AVI, MOV, vb.)\n• Ses dosyaları (MP3, FLAC, WAV, vb.)\n• Belge dosyaları (PDF, DOCX, vb.)"
             )
             return
+        
+        # Önizleme üretimini metadata okumasıyla paralel başlat
+        self.preview_loader.request(current_file)
+        
+        # Dosya değişmediyse önbellekteki sonucu kullan, alt süreç başlatma
+        fingerprint = file_fingerprint(current_file)
+        cached = self.metadata_cache.get(current_file, fingerprint)
+        if cached is not None:
+            self.logger.debug(f"Metadata önbellekten yüklendi: {current_file}")
+            if current_file not in self.search_index:
+                self.index_metadata(current_file, cached)
+            self._on_metadata_loaded(cached, None)
+            return
             
         if not self.check_exiftool():
             self.logger.error("ExifTool bulunamadı")
@@ -516,56 +1133,81 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
             try:
                 self.logger.info(f"Metadata yükleniyor: {current_file}")
                 
-                cmd = [
-                    'exiftool',
-                    '-json',
-                    '-G',
-                    '-struct',
-                    '-duplicates',
-                    '-unknown',
-                    '-charset', 'filename=utf8',
-                    '-charset', 'utf8',
-                    current_file
-                ]
-                self.logger.debug(f"Çalıştırılan komut: {' '.join(cmd)}")
-                
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
+                args = READ_ARGS + [current_file]
+                self.logger.debug(f"Çalıştırılan komut: exiftool -json {' '.join(args)}")
                 
-                self.logger.debug(f"ExifTool çıktısı: {result.stdout}")
-                if result.stderr:
-                    self.logger.warning(f"ExifTool uyarıları: {result.stderr}")
-                
-                data = json.loads(result.stdout)
+                data = None
+                if self.metadata_catalog is not None:
+                    data = self.metadata_catalog.get(current_file, fingerprint)
+                if data is None:
+                    self.quick_scan_metadata(current_file)
+                    data = self.exiftool.execute_json(*args, max_value_size=self.max_value_size())
+                    if self.metadata_catalog is not None:
+                        self.metadata_catalog.put(current_file, data, fingerprint)
+                else:
+                    attach_lazy_values(data)
+                    self.logger.debug(f"Metadata katalogdan yüklendi: {current_file}")
+                self.metadata_cache.put(current_file, data, fingerprint)
+                self.index_metadata(current_file, data)
                 
                 # Ana thread'e geri dön
-                GLib.idle_add(self._on_metadata_loaded, data, None)
+                GLib.idle_add(self._on_metadata_loaded, data, None, current_file)
                 
-            except subprocess.CalledProcessError as e:
-                error_msg = f"ExifTool hatası: {e.stderr}"
+            except ExifToolError as e:
+                error_msg = str(e)
                 self.logger.error(error_msg)
-                GLib.idle_add(self._on_metadata_loaded, None, error_msg)
+                GLib.idle_add(self._on_metadata_loaded, None, error_msg, current_file)
                 
             except json.JSONDecodeError as e:
                 error_msg = f"JSON parse hatası: {str(e)}"
                 self.logger.error(error_msg)
-                GLib.idle_add(self._on_metadata_loaded, None, error_msg)
+                GLib.idle_add(self._on_metadata_loaded, None, error_msg, current_file)
                 
             except Exception as e:
                 error_msg = f"Beklenmeyen hata: {str(e)}"
                 self.logger.error(error_msg)
                 self.logger.error(traceback.format_exc())
-                GLib.idle_add(self._on_metadata_loaded, None, error_msg)
+                GLib.idle_add(self._on_metadata_loaded, None, error_msg, current_file)
         
         thread = threading.Thread(target=load_worker, daemon=True)
         thread.start()
     
-    def _on_metadata_loaded(self, data, error):
+    def is_current_file(self, file_path):
+        """Verilen dosya şu an görüntülenen dosya mı"""
+        return (self.current_file_index < len(self.current_files) and
+                self.current_files[self.current_file_index] == file_path)
+    
+    def quick_scan_metadata(self, file_path):
+        """Büyük videolarda temel etiketleri ExifTool'u beklemeden mmap ile oku"""
+        threshold = self.get_setting('quick_scan_min_mb', media_scanner.QUICK_SCAN_THRESHOLD // (1024 * 1024)) * 1024 * 1024
+        try:
+            if os.path.getsize(file_path) < threshold:
+                return
+            result = media_scanner.scan_file(file_path)
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Hızlı tarama başarısız: {file_path} - {e}")
+            return
+        if not result.tags:
+            return
+        self.logger.debug(f"Hızlı tarama: {file_path} - {len(result.ranges)} metadata bölümü")
+        data = {'SourceFile': file_path}
+        data.update({key: value for key, value in result.tags.items() if value is not None})
+        GLib.idle_add(self._on_quick_metadata_loaded, data, file_path)
+
+    def _on_quick_metadata_loaded(self, data, file_path):
+        """Hızlı tarama sonucunu ExifTool sonucu gelene kadar göster"""
+        if not self.is_current_file(file_path):
+            return
+        self.metadata = data
+        self.organize_metadata()
+        self.stack.set_visible_child_name("metadata")
+
+    def _on_metadata_loaded(self, data, error, file_path=None):
         """Metadata yükleme tamamlandığında ana thread'de çalışır"""
+        # Kullanıcı bu arada başka bir dosyaya geçtiyse sonucu gösterme
+        if file_path is not None and not self.is_current_file(file_path):
+            return
+        
         if error:
             self.show_error_dialog(self.lang.get_text('DIALOGS', 'error_title'), error)
             return
@@ -585,11 +1227,67 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
             )
     
     def load_image_preview(self):
-        """Dosya önizlemesini yükle"""
+        """Dosya önizlemesini yükle (üretim arka planda yapılır)"""
         if not self.current_files:
             return
             
         current_file = self.current_files[self.current_file_index]
+        future = self.preview_loader.request(current_file)
+        
+        if future.done():
+            # Önbellekte ya da ön yükleyici tarafından hazırlanmış
+            self._on_preview_ready(current_file, future.result())
+            return
+        
+        # Önizleme hazır olana kadar yer tutucu göster
+        self.show_preview_placeholder()
+        future.add_done_callback(
+            lambda f: f.cancelled() or GLib.idle_add(self._on_preview_ready, current_file, f.result())
+        )
+    
+    def _on_preview_ready(self, file_path, pixbuf):
+        """Önizleme hazır olduğunda ana thread'de çalışır"""
+        # Kullanıcı başka bir dosyaya geçtiyse sonucu at
+        if not self.is_current_file(file_path):
+            return
+        
+        try:
+            if pixbuf is not None:
+                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+                self.image_preview.set_paintable(texture)
+                self.image_preview.set_visible(True)
+            else:
+                # Diğer dosyalar için ikon göster
+                self.show_file_icon()
+        except Exception as e:
+            self.logger.warning(f"Dosya önizlemesi yüklenemedi: {e}")
+            self.show_file_icon()
+    
+    def show_preview_placeholder(self):
+        """Önizleme üretilirken yer tutucu ikon göster"""
+        try:
+            icon_theme = Gtk.IconTheme.get_for_display(Gdk.Display.get_default())
+            icon_paintable = icon_theme.lookup_icon("image-loading-symbolic", None, 128, 1, Gtk.TextDirection.NONE, 0)
+            self.image_preview.set_paintable(icon_paintable)
+        except Exception:
+            self.image_preview.set_paintable(None)
+        self.image_preview.set_visible(True)
+    
+    def create_preview_pixbuf(self, current_file):
+        """Önizleme pixbuf'ını oluştur; arayüze dokunmaz, iş parçacığından çağrılabilir"""
+        # Geçerli bir XDG küçük resmi varsa (bizim ya da dosya yöneticisinin ürettiği) onu kullan
+        if self.thumbnail_cache is not None:
+            pixbuf = self.thumbnail_cache.lookup(current_file)
+            if pixbuf is not None:
+                return pixbuf
+        
+        pixbuf = self.render_preview_pixbuf(current_file)
+        if pixbuf is not None and self.thumbnail_cache is not None:
+            self.thumbnail_cache.store(current_file, pixbuf)
+        return pixbuf
+    
+    def render_preview_pixbuf(self, current_file):
+        """Önizlemeyi kaynak dosyadan sıfırdan üret"""
         file_ext = Path(current_file).suffix.lower()
         
         # Resim dosyaları
@@ -599,44 +1297,56 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
         # PDF dosyaları
         pdf_extensions = {'.pdf'}
         
+        if file_ext in RAW_EXTENSIONS:
+            # RAW dosyası - gömülü JPEG önizlemesini kullan
+            return self.load_raw_preview(current_file)
+        
+        elif file_ext in image_extensions:
+            # Resim dosyası - doğrudan yükle (GIF dahil)
+            if file_ext == '.gif':
+                # GIF için animasyon desteği - statik ya da animasyonlu, ilk kareyi al
+                pixbuf_animation = GdkPixbuf.PixbufAnimation.new_from_file(current_file)
+                pixbuf = pixbuf_animation.get_static_image()
+                return pixbuf.scale_simple(280, 200, GdkPixbuf.InterpType.BILINEAR)
+            # Diğer resim formatları
+            return GdkPixbuf.Pixbuf.new_from_file_at_scale(current_file, 280, 200, True)
+            
+        elif file_ext in video_extensions:
+            # Video dosyası - ffmpeg ile thumbnail çıkar
+            return self.load_video_thumbnail(current_file)
+            
+        elif file_ext in pdf_extensions:
+            # PDF dosyası - poppler ile thumbnail çıkar
+            return self.load_pdf_thumbnail(current_file)
+        
+        return None
+    
+    def load_raw_preview(self, raw_file):
+        """RAW dosyasındaki gömülü JPEG'i bellekte çözerek önizleme oluştur"""
         try:
-            if file_ext in image_extensions:
-                # Resim dosyası - doğrudan yükle (GIF dahil)
-                if file_ext == '.gif':
-                    # GIF için animasyon desteği
-                    pixbuf_animation = GdkPixbuf.PixbufAnimation.new_from_file(current_file)
-                    if pixbuf_animation.is_static_image():
-                        # Statik GIF
-                        pixbuf = pixbuf_animation.get_static_image()
-                        pixbuf = pixbuf.scale_simple(280, 200, GdkPixbuf.InterpType.BILINEAR)
-                    else:
-                        # Animasyonlu GIF - ilk kareyi al
-                        pixbuf = pixbuf_animation.get_static_image()
-                        pixbuf = pixbuf.scale_simple(280, 200, GdkPixbuf.InterpType.BILINEAR)
-                    texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-                else:
-                    # Diğer resim formatları
-                    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(current_file, 280, 200, True)
-                    texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-                
-                self.image_preview.set_paintable(texture)
-                self.image_preview.set_visible(True)
-                
-            elif file_ext in video_extensions:
-                # Video dosyası - ffmpeg ile thumbnail çıkar
-                self.load_video_thumbnail(current_file)
+            for tag in ('PreviewImage', 'JpgFromRaw', 'ThumbnailImage'):
+                data = self.preview_engine.read_binary(raw_file, tag)
+                if not data:
+                    continue
                 
-            elif file_ext in pdf_extensions:
-                # PDF dosyası - poppler ile thumbnail çıkar
-                self.load_pdf_thumbnail(current_file)
-                
-            else:
-                # Diğer dosyalar için ikon göster
-                self.show_file_icon()
+                loader = GdkPixbuf.PixbufLoader()
+                # Çözme sırasında ölçekle, tam çözünürlüklü görüntü belleğe alınmaz
+                loader.connect("size-prepared", self._on_preview_size_prepared)
+                loader.write(data)
+                loader.close()
+                pixbuf = loader.get_pixbuf()
+                if pixbuf is not None:
+                    return pixbuf
                 
         except Exception as e:
-            self.logger.warning(f"Dosya önizlemesi yüklenemedi: {e}")
-            self.show_file_icon()
+            self.logger.warning(f"RAW önizlemesi oluşturulamadı: {e}")
+        return None
+    
+    def _on_preview_size_prepared(self, loader, width, height):
+        """PixbufLoader için: görüntüyü 280x200 kutusuna sığacak şekilde küçült"""
+        scale = min(280 / width, 200 / height, 1.0)
+        if scale < 1.0:
+            loader.set_size(max(1, int(width * scale)), max(1, int(height * scale)))
     
     def load_video_thumbnail(self, video_file):
         """Video dosyası için thumbnail çıkar"""
@@ -658,21 +1368,17 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
             
             result = subprocess.run(cmd, capture_output=True, text=True)
             
-            if result.returncode == 0 and os.path.exists(thumbnail_path):
-                # Thumbnail'i yükle
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(thumbnail_path, 280, 200, True)
-                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-                self.image_preview.set_paintable(texture)
-                self.image_preview.set_visible(True)
-                
+            try:
+                if result.returncode == 0 and os.path.getsize(thumbnail_path) > 0:
+                    # Thumbnail'i yükle
+                    return GdkPixbuf.Pixbuf.new_from_file_at_scale(thumbnail_path, 280, 200, True)
+            finally:
                 # Geçici dosyayı sil
                 os.unlink(thumbnail_path)
-            else:
-                self.show_file_icon()
                 
         except Exception as e:
             self.logger.warning(f"Video thumbnail oluşturulamadı: {e}")
-            self.show_file_icon()
+        return None
     
     def load_pdf_thumbnail(self, pdf_file):
         """PDF dosyası için thumbnail çıkar"""
@@ -696,18 +1402,35 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
                     # Oluşturulan PNG dosyasını bul
                     png_files = list(Path(tmp_dir).glob('page-*.png'))
                     if png_files:
-                        thumbnail_path = str(png_files[0])
-                        pixbuf = GdkPixbuf.Pixbuf.new_from_file(thumbnail_path)
-                        texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-                        self.image_preview.set_paintable(texture)
-                        self.image_preview.set_visible(True)
-                        return
-                        
-                self.show_file_icon()
+                        return GdkPixbuf.Pixbuf.new_from_file(str(png_files[0]))
                 
         except Exception as e:
             self.logger.warning(f"PDF thumbnail oluşturulamadı: {e}")
-            self.show_file_icon()
+        return None
+    
+    def prefetch_metadata(self, file_path):
+        """Ön yükleyici için: metadata'yı önbelleğe al (düşük öncelikli motorla)"""
+        if not self.is_supported_file_type(file_path)[0]:
+            return
+        fingerprint = file_fingerprint(file_path)
+        if fingerprint is None or self.metadata_cache.get(file_path, fingerprint) is not None:
+            return
+        
+        data = None
+        if self.metadata_catalog is not None:
+            data = self.metadata_catalog.get(file_path, fingerprint)
+        if data is None:
+            data = self.prefetch_engine.execute_json(*READ_ARGS, file_path, max_value_size=self.max_value_size())
+            if self.metadata_catalog is not None:
+                self.metadata_catalog.put(file_path, data, fingerprint)
+        else:
+            attach_lazy_values(data)
+        self.metadata_cache.put(file_path, data, fingerprint)
+        self.index_metadata(file_path, data)
+    
+    def prefetch_preview(self, file_path):
+        """Ön yükleyici için: önizlemeyi üret ve önbelleğe alınmasını bekle"""
+        self.preview_loader.request(file_path).result()
     
     def show_file_icon(self):
         """Dosyalar için işletim sistemi varsayılan ikonlarını göster"""
@@ -754,19 +1477,35 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
             
         self.image_preview.set_visible(True)
 
-    
+
+    def organize_metadata(self):
+        """Metadata'yı ExifTool gruplarına göre düzenle"""
+        groups = {
+            'File': {'title': self.lang.get_text('GROUPS', 'file_info'), 'icon': 'text-x-generic-symbolic'},
+            'EXIF': {'title': self.lang.get_text('GROUPS', 'exif_info'), 'icon': 'camera-photo-symbolic'},
+            'XMP': {'title': self.lang.get_text('GROUPS', 'xmp_metadata'), 'icon': 'text-x-script-symbolic'},
+            'IPTC': {'title': self.lang.get_text('GROUPS', 'iptc_metadata'), 'icon': 'text-x-generic-symbolic'},
+            'GPS': {'title': self.lang.get_text('GROUPS', 'location_info'), 'icon': 'mark-location-symbolic'},
+            'ICC_Profile': {'title': self.lang.get_text('GROUPS', 'icc_profile'), 'icon': 'applications-graphics-symbolic'},
+            'Composite': {'title': self.lang.get_text('GROUPS', 'composite_info'), 'icon': 'applications-science-symbolic'},
+            'ExifTool': {'title': self.lang.get_text('GROUPS', 'system_info'), 'icon': 'emblem-system-symbolic'},
+        }
+        
+        grouped_data = {group_name: {} for group_name in groups}
+        for key, value in self.metadata.items():
+            if ':' not in key:
+                continue  # SourceFile
+            group_name = key.split(':', 1)[0]
+            grouped_data.setdefault(group_name, {})[key] = value
+        grouped_data = {name: items for name, items in grouped_data.items() if items}
+        
         # Grupları görüntüle
         self.display_grouped_metadata(grouped_data, groups)
 
-    def display_grouped_metadata(self, grouped_data, groups):
-        # Clear existing rows
-        while True:
-            row = self.metadata_list.get_row_at_index(0)
-            if row is None:
-                break
-            self.metadata_list.remove(row)
-
-        # Dosya bilgilerini güncelle
+    def update_file_title(self):
+        """Dosya adını ve çoklu dosya durumunda sırasını göster"""
+        if not self.current_files or self.metadata_page is None:
+            return
         current_file = self.current_files[self.current_file_index]
         file_name = os.path.basename(current_file)
         
@@ -778,175 +1517,249 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
             
         self.file_info_row.set_title(title)
         self.file_info_row.set_subtitle(current_file)
-        
-        # Dosya ikonu ekle
-        file_icon = Gtk.Image.new_from_icon_name("text-x-generic-symbolic")
-        self.file_info_row.add_prefix(file_icon)
+    
+    def display_grouped_metadata(self, grouped_data, groups):
+        # Dosya bilgilerini güncelle
+        self.update_file_title()
 
-        # Her grubu görüntüle
+        # Satır verilerini hazırla; widget'lar yalnızca görünür oldukça oluşturulur
+        sections = []
         for group_name, items in grouped_data.items():
-            if items:
-                group_info = groups.get(group_name, {
-                    'title': group_name,
-                    'icon': 'dialog-information-symbolic'
-                })
-
-                # File ve Composite grupları için gizli expander kullan
-                if group_name in ['File', 'Composite']:
-                    # Adw.ExpanderRow ile gizli grup
-                    expander = Adw.ExpanderRow()
-                    expander.set_title(group_info['title'])
-                    expander.set_expanded(False)  # Başlangıçta kapalı
-                    
-                    # Grup ikonu ekle
-                    group_icon = Gtk.Image.new_from_icon_name(group_info['icon'])
-                    expander.add_prefix(group_icon)
-                    
-                    # Grup içindeki metadata'ları ekle
-                    for key, value in sorted(items.items()):
-                        if isinstance(value, (list, dict)):
-                            value = json.dumps(value, indent=2, ensure_ascii=False)
-                        elif isinstance(value, bytes):
-                            value = str(value)
-                        elif value is None:
-                            continue
-
-                        display_value = str(value)
-                        if len(display_value) > 100:
-                            display_value = display_value[:97] + "..."
-                        
-                        display_key = key.split(':', 1)[-1].strip()
-                        display_key = self.lang.get_text('KEYS', display_key, fallback=display_key)
-                        
-                        row = Adw.ActionRow()
-                        row.set_title(display_key)
-                        row.set_subtitle(display_value)
-                        
-                        if 'GPS' in key or 'Location' in key:
-                            icon = Gtk.Image.new_from_icon_name("mark-location-symbolic")
-                        elif 'Date' in key or 'Time' in key:
-                            icon = Gtk.Image.new_from_icon_name("x-office-calendar-symbolic")
-                        elif 'Size' in key or 'Width' in key or 'Height' in key:
-                            icon = Gtk.Image.new_from_icon_name("view-fullscreen-symbolic")
-                        elif 'Camera' in key or 'Make' in key or 'Model' in key:
-                            icon = Gtk.Image.new_from_icon_name("camera-photo-symbolic")
-                        else:
-                            icon = Gtk.Image.new_from_icon_name("dialog-information-symbolic")
-                        
-                        row.add_prefix(icon)
-                        
-                        # Buton kutusu
-                        btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-                        
-                        # Düzenle butonu
-                        edit_btn = Gtk.Button(icon_name="document-edit-symbolic")
-                        edit_btn.add_css_class("flat")
-                        edit_btn.set_tooltip_text(self.lang.get_text('MAIN', 'edit'))
-                        edit_btn.connect("clicked", self.on_edit_value, key, str(value))
-                        btn_box.append(edit_btn)
-                        
-                        # Kopyala butonu
-                        copy_btn = Gtk.Button(icon_name="edit-copy-symbolic")
-                        copy_btn.add_css_class("flat")
-                        copy_btn.set_tooltip_text(self.lang.get_text('MAIN', 'copy'))
-                        copy_btn.connect("clicked", self.on_copy_value, str(value))
-                        btn_box.append(copy_btn)
-                        
-                        row.add_suffix(btn_box)
-                        
-                        expander.add_row(row)
-                    
-                    self.metadata_list.append(expander)
-                    
-                else:
-                    # Diğer gruplar için normal görünüm
-                    group_widget = Adw.PreferencesGroup()
-                    group_widget.set_title(group_info['title'])
-                    group_widget.set_margin_top(12)
-                    
-                    for key, value in sorted(items.items()):
-                        if isinstance(value, (list, dict)):
-                            value = json.dumps(value, indent=2, ensure_ascii=False)
-                        elif isinstance(value, bytes):
-                            value = str(value)
-                        elif value is None:
-                            continue
+            group_info = groups.get(group_name, {
+                'title': group_name,
+                'icon': 'dialog-information-symbolic'
+            })
+            
+            rows = []
+            for key, value in sorted(items.items()):
+                if isinstance(value, (list, dict)):
+                    value = json.dumps(value, indent=2, ensure_ascii=False)
+                elif isinstance(value, bytes):
+                    value = str(value)
+                elif value is None:
+                    continue
 
-                        display_value = str(value)
-                        if len(display_value) > 100:
-                            display_value = display_value[:97] + "..."
-                        
-                        display_key = key.split(':', 1)[-1].strip()
-                        display_key = self.lang.get_text('KEYS', display_key, fallback=display_key)
-                        
-                        row = Adw.ActionRow()
-                        row.set_title(display_key)
-                        row.set_subtitle(display_value)
-                        
-                        if 'GPS' in key or 'Location' in key:
-                            icon = Gtk.Image.new_from_icon_name("mark-location-symbolic")
-                        elif 'Date' in key or 'Time' in key:
-                            icon = Gtk.Image.new_from_icon_name("x-office-calendar-symbolic")
-                        elif 'Size' in key or 'Width' in key or 'Height' in key:
-                            icon = Gtk.Image.new_from_icon_name("view-fullscreen-symbolic")
-                        elif 'Camera' in key or 'Make' in key or 'Model' in key:
-                            icon = Gtk.Image.new_from_icon_name("camera-photo-symbolic")
-                        else:
-                            icon = Gtk.Image.new_from_icon_name("dialog-information-symbolic")
-                        
-                        row.add_prefix(icon)
-                        
-                        # Buton kutusu
-                        btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-                        
-                        # Düzenle butonu
-                        edit_btn = Gtk.Button(icon_name="document-edit-symbolic")
-                        edit_btn.add_css_class("flat")
-                        edit_btn.set_tooltip_text(self.lang.get_text('MAIN', 'edit'))
-                        edit_btn.connect("clicked", self.on_edit_value, key, str(value))
-                        btn_box.append(edit_btn)
-                        
-                        # Kopyala butonu
-                        copy_btn = Gtk.Button(icon_name="edit-copy-symbolic")
-                        copy_btn.add_css_class("flat")
-                        copy_btn.set_tooltip_text(self.lang.get_text('MAIN', 'copy'))
-                        copy_btn.connect("clicked", self.on_copy_value, str(value))
-                        btn_box.append(copy_btn)
-                        
-                        row.add_suffix(btn_box)
-                        
-                        group_widget.add(row)
-                    
-                    list_row = Gtk.ListBoxRow()
-                    list_row.set_activatable(False)
-                    list_row.set_child(group_widget)
-                    self.metadata_list.append(list_row)
+                display_value = str(value)
+                if len(display_value) > 100:
+                    display_value = display_value[:97] + "..."
+                
+                display_key = key.split(':', 1)[-1].strip()
+                display_key = self.lang.get_text('KEYS', display_key, fallback=display_key)
+                
+                # Büyük değerler tutamak olarak kalır; baytlar kopyalanırken okunur
+                if not isinstance(value, LazyValue):
+                    value = str(value)
+                rows.append(MetadataItem('row', group_name, display_key, display_value,
+                                         self.get_metadata_icon_name(key), key, value))
+            
+            if rows:
+                sections.append((group_name, group_info, rows))
+        
+        self.metadata_sections = sections
+        self.refresh_metadata_model()
 
         # Metadata yoksa mesaj göster
-        if not grouped_data:
+        if not sections:
             self.clean_button.set_sensitive(False)
             self.save_button.set_sensitive(False)
-            
-            status_page = Adw.StatusPage()
-            status_page.set_icon_name("dialog-information-symbolic")
-            status_page.set_title(self.lang.get_text('MAIN', 'no_metadata_found'))
-            
-            no_data_row = Gtk.ListBoxRow()
-            no_data_row.set_activatable(False)
-            no_data_row.set_child(status_page)
-            self.metadata_list.append(no_data_row)
+            self.metadata_stack.set_visible_child_name("empty")
         else:
             self.clean_button.set_sensitive(True)
             self.save_button.set_sensitive(bool(self.changed_metadata))
+            self.metadata_stack.set_visible_child_name("list")
         
         # Navigasyon butonlarını güncelle
         self.update_navigation_buttons()
     
+    def refresh_metadata_model(self):
+        """Liste modelinin içeriğini tek bir splice ile değiştir"""
+        items = []
+        for group_name, group_info, rows in self.metadata_sections:
+            items.append(MetadataItem('header', group_name, group_info['title'], str(len(rows)), group_info['icon']))
+            if group_name not in self.collapsed_groups:
+                items.extend(rows)
+        self.metadata_store.splice(0, self.metadata_store.get_n_items(), items)
+    
+    def get_metadata_icon_name(self, key):
+        """Etiket adına göre satır ikonu"""
+        if 'GPS' in key or 'Location' in key:
+            return "mark-location-symbolic"
+        elif 'Date' in key or 'Time' in key:
+            return "x-office-calendar-symbolic"
+        elif 'Size' in key or 'Width' in key or 'Height' in key:
+            return "view-fullscreen-symbolic"
+        elif 'Camera' in key or 'Make' in key or 'Model' in key:
+            return "camera-photo-symbolic"
+        return "dialog-information-symbolic"
+    
+    def _on_metadata_item_setup(self, factory, list_item):
+        """Yeniden kullanılacak satır widget'ını bir kez oluştur"""
+        container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        
+        # Grup başlığı
+        header = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        header.add_css_class("category-header")
+        header_icon = Gtk.Image()
+        header_label = Gtk.Label(xalign=0, hexpand=True)
+        header_count = Gtk.Label()
+        header_count.add_css_class("dim-label")
+        header_arrow = Gtk.Image()
+        for widget in (header_icon, header_label, header_count, header_arrow):
+            header.append(widget)
+        
+        # Metadata satırı
+        row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        row.add_css_class("metadata-row")
+        row_icon = Gtk.Image()
+        text_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, hexpand=True)
+        key_label = Gtk.Label(xalign=0, ellipsize=Pango.EllipsizeMode.END)
+        key_label.add_css_class("metadata-key")
+        value_label = Gtk.Label(xalign=0, ellipsize=Pango.EllipsizeMode.END)
+        value_label.add_css_class("metadata-value")
+        text_box.append(key_label)
+        text_box.append(value_label)
+        
+        # Buton kutusu
+        btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        btn_box.set_valign(Gtk.Align.CENTER)
+        
+        # Düzenle butonu
+        edit_btn = Gtk.Button(icon_name="document-edit-symbolic")
+        edit_btn.add_css_class("flat")
+        edit_btn.set_tooltip_text(self.lang.get_text('MAIN', 'edit'))
+        edit_btn.connect("clicked", lambda btn: self.on_edit_value(btn, list_item.get_item().key, list_item.get_item().value))
+        btn_box.append(edit_btn)
+        
+        # Kopyala butonu
+        copy_btn = Gtk.Button(icon_name="edit-copy-symbolic")
+        copy_btn.add_css_class("flat")
+        copy_btn.set_tooltip_text(self.lang.get_text('MAIN', 'copy'))
+        copy_btn.connect("clicked", lambda btn: self.on_copy_value(btn, list_item.get_item().value))
+        btn_box.append(copy_btn)
+        
+        # Dışa aktar butonu (yalnızca okunmamış büyük değerler için)
+        export_btn = Gtk.Button(icon_name="document-save-as-symbolic")
+        export_btn.add_css_class("flat")
+        export_btn.set_tooltip_text(self.lang.get_text('MAIN', 'export_value'))
+        export_btn.connect("clicked", lambda btn: self.on_export_value(btn, list_item.get_item().value))
+        btn_box.append(export_btn)
+        
+        for widget in (row_icon, text_box, btn_box):
+            row.append(widget)
+        
+        container.append(header)
+        container.append(row)
+        container.parts = (header, header_icon, header_label, header_count, header_arrow,
+                           row, row_icon, key_label, value_label, edit_btn, export_btn)
+        list_item.set_child(container)
+    
+    def _on_metadata_item_bind(self, factory, list_item):
+        """Yeniden kullanılan widget'a modeldeki öğeyi bağla"""
+        item = list_item.get_item()
+        (header, header_icon, header_label, header_count, header_arrow,
+         row, row_icon, key_label, value_label, edit_btn, export_btn) = list_item.get_child().parts
+        
+        is_header = item.kind == 'header'
+        header.set_visible(is_header)
+        row.set_visible(not is_header)
+        list_item.set_activatable(is_header)
+        
+        if is_header:
+            header_icon.set_from_icon_name(item.icon_name)
+            header_label.set_label(item.title)
+            header_count.set_label(item.subtitle)
+            collapsed = item.group in self.collapsed_groups
+            header_arrow.set_from_icon_name("pan-end-symbolic" if collapsed else "pan-down-symbolic")
+        else:
+            row_icon.set_from_icon_name(item.icon_name)
+            key_label.set_label(item.title)
+            value_label.set_label(item.subtitle)
+            value_label.set_tooltip_text(item.subtitle)
+            is_lazy = isinstance(item.value, LazyValue)
+            edit_btn.set_visible(not is_lazy)
+            export_btn.set_visible(is_lazy)
+    
+    def _on_metadata_item_activate(self, list_view, position):
+        """Grup başlığına tıklanınca grubu aç/kapat"""
+        item = self.metadata_store.get_item(position)
+        if item is None or item.kind != 'header':
+            return
+        if item.group in self.collapsed_groups:
+            self.collapsed_groups.discard(item.group)
+        else:
+            self.collapsed_groups.add(item.group)
+        self.refresh_metadata_model()
+    
     def on_copy_value(self, button, value):
         """Değeri panoya kopyalar"""
+        if isinstance(value, LazyValue):
+            self.fetch_lazy_value(value, self._copy_bytes_to_clipboard)
+            return
         clipboard = Gdk.Display.get_default().get_clipboard()
         clipboard.set(value)
     
+    def fetch_lazy_value(self, value, callback):
+        """Büyük bir değerin baytlarını arka planda oku, callback'i ana thread'de çağır"""
+        def fetch_worker():
+            try:
+                data = value.fetch(self.exiftool)
+            except (ExifToolError, OSError) as e:
+                self.logger.error(f"Değer okunamadı: {value.tag} - {e}")
+                GLib.idle_add(self.show_error_dialog, self.lang.get_text('DIALOGS', 'error_title'), str(e))
+                return
+            if data is None:
+                self.logger.warning(f"Değer bulunamadı: {value.path} - {value.tag}")
+                return
+            GLib.idle_add(callback, value, data)
+        
+        threading.Thread(target=fetch_worker, daemon=True).start()
+    
+    def _copy_bytes_to_clipboard(self, value, data):
+        """Metin ise metin, görüntü ise resim, değilse ham bayt olarak kopyala"""
+        clipboard = Gdk.Display.get_default().get_clipboard()
+        try:
+            clipboard.set(data.decode('utf-8'))
+            return
+        except UnicodeDecodeError:
+            pass
+        try:
+            clipboard.set_texture(Gdk.Texture.new_from_bytes(GLib.Bytes.new(data)))
+        except GLib.Error:
+            provider = Gdk.ContentProvider.new_for_bytes('application/octet-stream', GLib.Bytes.new(data))
+            clipboard.set_content(provider)
+    
+    def on_export_value(self, button, value):
+        """Büyük bir değeri dosyaya kaydet"""
+        dialog = Gtk.FileChooserDialog(
+            title=self.lang.get_text('MAIN', 'export_value'),
+            transient_for=self,
+            action=Gtk.FileChooserAction.SAVE
+        )
+        dialog.add_buttons(
+            self.lang.get_text('DIALOGS', 'cancel'), Gtk.ResponseType.CANCEL,
+            self.lang.get_text('MAIN', 'save'), Gtk.ResponseType.ACCEPT
+        )
+        base_name = os.path.splitext(os.path.basename(value.path))[0]
+        dialog.set_current_name(f"{base_name}-{value.tag.split(':', 1)[-1]}.bin")
+        
+        def on_response(dialog, response):
+            if response == Gtk.ResponseType.ACCEPT and dialog.get_file():
+                target = dialog.get_file().get_path()
+                self.fetch_lazy_value(value, lambda value, data: self._write_exported_value(target, data))
+            dialog.destroy()
+        
+        dialog.connect("response", on_response)
+        dialog.show()
+    
+    def _write_exported_value(self, target, data):
+        try:
+            with open(target, 'wb') as f:
+                f.write(data)
+            self.logger.info(f"Değer dışa aktarıldı: {target} ({len(data)} bayt)")
+        except OSError as e:
+            self.logger.error(f"Değer dışa aktarılamadı: {target} - {e}")
+            self.show_error_dialog(self.lang.get_text('DIALOGS', 'error_title'), str(e))
+    
     def on_edit_value(self, button, key, value):
         """Metadata değerini düzenle"""
         dialog = Adw.MessageDialog.new(self)
@@ -976,6 +1789,14 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
         dialog.connect("response", on_response)
         dialog.present()
  
+    def update_metadata_value(self, key, new_value):
+        """Düzenlenen değeri kaydedilmek üzere işaretle ve listeyi güncelle"""
+        self.changed_metadata[key] = new_value
+        self.metadata[key] = new_value
+        self.organize_metadata()
+        self.save_button.set_sensitive(True)
+        self.undo_button.set_sensitive(True)
+    
     def on_undo_clicked(self, button):
         """Değişiklikleri geri al"""
         if self.changed_metadata:
@@ -995,34 +1816,131 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
             GLib.idle_add(self._on_save_success, "Değişiklik yapılmadığı için işlem atlandı.")
             return
         
+        # Birden çok dosya açıksa değişikliklerin nereye yazılacağını sor
+        if len(self.current_files) > 1:
+            dialog = Adw.MessageDialog.new(self)
+            dialog.set_heading(self.lang.get_text('DIALOGS', 'save_scope_title'))
+            dialog.set_body(self.lang.get_text('DIALOGS', 'save_scope_message', count=len(self.current_files)))
+            dialog.add_response("cancel", self.lang.get_text('DIALOGS', 'cancel'))
+            dialog.add_response("current", self.lang.get_text('DIALOGS', 'save_current'))
+            dialog.add_response("all", self.lang.get_text('DIALOGS', 'save_all', count=len(self.current_files)))
+            dialog.set_response_appearance("all", Adw.ResponseAppearance.SUGGESTED)
+            dialog.set_default_response("current")
+            dialog.set_close_response("cancel")
+            dialog.connect("response", self.on_save_scope_response)
+            dialog.present()
+            return
+        
+        self.save_current_file()
+    
+    def on_save_scope_response(self, dialog, response):
+        if response == "current":
+            self.save_current_file()
+        elif response == "all":
+            self.apply_changes_to_all()
+    
+    def save_current_file(self):
+        """Değişiklikleri yalnızca görüntülenen dosyaya yaz"""
         current_file = self.current_files[self.current_file_index]
         
         def save_worker():
             try:
-                cmd = ['exiftool', '-overwrite_original']
-                
-                for key, value in self.changed_metadata.items():
-                    # Salt okunur etiketleri atla
-                    if key.startswith('File:') or key.startswith('Composite:'):
-                        continue
-                    
-                    if ':' in key:
-                        tag_name = key.split(':', 1)[1]
-                        cmd.extend([f'-{tag_name}={value}'])
+                args = ['-overwrite_original'] + edit_args(self.changed_metadata)
+                args.append(current_file)
                 
-                cmd.append(current_file)
-                
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+                self.exiftool.execute(*args, check=True)
+                self.invalidate_metadata(current_file)
                 
                 # Değişiklikler kaydedildikten sonra listeyi temizle
                 self.changed_metadata.clear()
                 
                 GLib.idle_add(self._on_save_success)
                 
-                   
+            except ExifToolError as e:
+                error_msg = str(e)
+                self.logger.error(error_msg)
+                GLib.idle_add(self._on_save_error, error_msg)
+                
+            except Exception as e:
+                error_msg = f"Beklenmeyen hata: {str(e)}"
+                self.logger.error(error_msg)
+                self.logger.error(traceback.format_exc())
+                GLib.idle_add(self._on_save_error, error_msg)
+        
         thread = threading.Thread(target=save_worker, daemon=True)
         thread.start()
     
+    def apply_changes_to_all(self):
+        """Aynı değişiklikleri tüm açık dosyalara toplu ve paralel olarak yaz"""
+        changes = dict(self.changed_metadata)
+        files = []
+        for current_file in self.current_files:
+            is_supported, error_msg = self.is_supported_file_type(current_file)
+            if is_supported:
+                files.append(current_file)
+            else:
+                self.logger.warning(f"Desteklenmeyen dosya atlanıyor: {current_file} - {error_msg}")
+        
+        # Düzenleme dosya başına atomik olduğundan temizlik günlüğü kullanılmaz
+        scheduler = self.create_clean_scheduler(
+            processor=lambda engine, paths: BatchEditor(engine, changes, self.logger).edit_chunk(paths)
+        )
+        self.active_batch = scheduler
+        self.save_button.set_sensitive(False)
+        self.clean_button.set_sensitive(False)
+        self.show_batch_progress(len(files))
+        
+        def edit_worker():
+            try:
+                self.logger.info(f"Toplu düzenleme başlatıldı: {len(files)} dosya, {len(changes)} etiket")
+                results = scheduler.clean(files, on_progress=lambda snapshot: GLib.idle_add(self._on_batch_progress, snapshot))
+                for result in results:
+                    if result.success:
+                        self.invalidate_metadata(result.path)
+                GLib.idle_add(self._on_batch_edit_finished, results)
+            except Exception as e:
+                error_msg = f"Beklenmeyen hata: {str(e)}"
+                self.logger.error(error_msg)
+                self.logger.error(traceback.format_exc())
+                GLib.idle_add(self._on_batch_edit_finished, [], error_msg)
+        
+        threading.Thread(target=edit_worker, daemon=True).start()
+    
+    def _on_batch_edit_finished(self, results, error=None):
+        """Toplu düzenlemenin dosya başına sonuçlarını raporla"""
+        self.hide_batch_progress()
+        self.clean_button.set_sensitive(True)
+        if error:
+            self.save_button.set_sensitive(True)
+            self._on_save_error(error)
+            return
+        
+        cancelled = [r for r in results if r.cancelled]
+        failed = [r for r in results if not r.success and not r.cancelled]
+        for result in failed:
+            self.logger.error(f"Düzenlenemedi: {result.path} - {result.error}")
+        
+        updated = len(results) - len(failed) - len(cancelled)
+        message = self.lang.get_text('DIALOGS', 'batch_edit_message', done=updated, total=len(results))
+        if failed:
+            message += "\n\n" + self.format_failures(failed)
+        
+        # Yazılan değerler dosyadan yeniden okunur
+        self.changed_metadata.clear()
+        self.load_metadata()
+        
+        if failed or cancelled:
+            self.show_error_dialog(self.lang.get_text('DIALOGS', 'save_error_title'), message)
+        else:
+            self._on_save_success(message)
+    
+    def format_failures(self, failed, limit=20):
+        """Başarısız dosyaları 'ad: hata' satırları olarak listele"""
+        lines = [f"• {os.path.basename(r.path)}: {r.error}" for r in failed[:limit]]
+        if len(failed) > limit:
+            lines.append(f"… (+{len(failed) - limit})")
+        return "\n".join(lines)
+    
     def _on_save_success(self, message=None):
         """Kaydetme başarılı"""
         self.save_button.set_sensitive(False)
@@ -1125,25 +2043,139 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
         dialog = Adw.MessageDialog.new(self)
         dialog.set_heading(self.lang.get_text('DIALOGS', 'clean_title'))
         dialog.set_body(message)
+        
+        # Temizlik profili her çalışma için seçilir; son seçim hatırlanır
+        names = list(self.clean_profiles)
+        titles = [self.lang.get_text('PROFILES', name, fallback=self.clean_profiles[name].title) for name in names]
+        profile_dropdown = Gtk.DropDown.new_from_strings(titles)
+        last_profile = self.get_setting('clean_profile', DEFAULT_PROFILE)
+        if last_profile in names:
+            profile_dropdown.set_selected(names.index(last_profile))
+        profile_dropdown.set_margin_start(12)
+        profile_dropdown.set_margin_end(12)
+        dialog.set_extra_child(profile_dropdown)
+        
         dialog.add_response("cancel", self.lang.get_text('DIALOGS', 'cancel'))
         dialog.add_response("clean", self.lang.get_text('DIALOGS', 'clean'))
         dialog.set_response_appearance("clean", Adw.ResponseAppearance.DESTRUCTIVE)
         dialog.set_default_response("cancel")
         dialog.set_close_response("cancel")
-        dialog.connect("response", self.on_clean_response)
+        dialog.connect("response", self.on_clean_response, profile_dropdown, names)
         dialog.present()
     
-    def on_clean_response(self, dialog, response):
+    def on_clean_response(self, dialog, response, profile_dropdown, names):
         if response == "clean":
-            self.clean_metadata()
+            name = names[profile_dropdown.get_selected()]
+            if name != self.settings.get('clean_profile', DEFAULT_PROFILE):
+                self.settings['clean_profile'] = name
+                self.save_theme_settings()
+            self.clean_metadata(self.clean_profiles[name])
     
-    def clean_metadata(self):
+    def clean_metadata(self, profile=None):
         if not self.current_files:
             return
         
+        self.clean_profile = profile or self.clean_profiles[DEFAULT_PROFILE]
+        self.logger.info(f"Temizlik profili: {self.clean_profile.name}")
         self.clean_file_index = 0
         self.clean_button.set_sensitive(False)
-        self.clean_next_file()
+        self.clean_journal.begin(self.current_files, profile=self.clean_profile.name)
+        
+        # Çoklu seçimde dosyalar parçalar halinde tek komutla temizlenir
+        if len(self.current_files) > 1:
+            self.clean_files_batched()
+        else:
+            self.clean_next_file()
+    
+    def clean_files_batched(self):
+        """Seçili dosyaları toplu modda temizle"""
+        files = []
+        for current_file in self.current_files:
+            is_supported, error_msg = self.is_supported_file_type(current_file)
+            if is_supported:
+                files.append(current_file)
+            else:
+                self.logger.warning(f"Desteklenmeyen dosya atlanıyor: {current_file} - {error_msg}")
+        
+        scheduler = self.create_clean_scheduler()
+        self.active_batch = scheduler
+        self.show_batch_progress(len(files))
+        
+        def batch_worker():
+            try:
+                self.logger.info(f"Toplu metadata temizleme başlatıldı: {len(files)} dosya, "
+                                 f"{scheduler.workers} işçi")
+                results = scheduler.clean(files, on_progress=lambda snapshot: GLib.idle_add(self._on_batch_progress, snapshot))
+                for result in results:
+                    if result.success:
+                        self.invalidate_metadata(result.path)
+                GLib.idle_add(self._on_batch_clean_finished, results)
+            except Exception as e:
+                error_msg = f"Beklenmeyen hata: {str(e)}"
+                self.logger.error(error_msg)
+                self.logger.error(traceback.format_exc())
+                GLib.idle_add(self._on_clean_error, error_msg)
+        
+        thread = threading.Thread(target=batch_worker, daemon=True)
+        thread.start()
+    
+    def create_clean_scheduler(self, processor=None):
+        """Ayarlara göre paralel temizleme (ya da processor ile düzenleme) zamanlayıcısını oluştur"""
+        # 0 = işlemci sayısı kadar işçi
+        workers = self.get_setting('clean_workers', 0) or default_worker_count()
+        if self.clean_pool is None:
+            self.clean_pool = EnginePool(workers, logger=self.logger)
+        return CleanScheduler(
+            self.clean_pool,
+            workers=workers,
+            chunk_size=self.get_setting('clean_chunk_size', DEFAULT_CHUNK_SIZE),
+            size_weighted=self.get_setting('clean_size_weighted', False),
+            native=self.get_setting('native_cleaner', True),
+            keep_icc=self.get_setting('keep_icc_profile', True),
+            skip_clean=self.get_setting('skip_clean_files', True),
+            journal=self.clean_journal if processor is None else None,
+            processor=processor,
+            profile=self.clean_profile,
+            logger=self.logger
+        )
+    
+    def _on_batch_clean_finished(self, results):
+        """Toplu temizleme bittiğinde dosya başına hataları raporla"""
+        self.hide_batch_progress()
+        cancelled = [r for r in results if r.cancelled]
+        failed = [r for r in results if not r.success and not r.cancelled]
+        skipped = [r for r in results if r.skipped]
+        if skipped:
+            self.logger.info(f"Silinecek metadata'sı olmayan {len(skipped)} dosya atlandı")
+        if cancelled:
+            self._on_batch_cancelled(results, cancelled, failed)
+            return
+        if not failed:
+            self._on_all_files_cleaned(len(skipped))
+            return
+        
+        for result in failed:
+            self.logger.error(f"Temizlenemedi: {result.path} - {result.error}")
+        
+        message = self.lang.get_text('DIALOGS', 'batch_clean_message',
+                                     done=len(results) - len(failed), total=len(results))
+        message += "\n\n" + self.format_failures(failed)
+        if skipped:
+            message += "\n\n" + self.lang.get_text('DIALOGS', 'skipped_message', count=len(skipped))
+        self._on_clean_error(message)
+    
+    def _on_batch_cancelled(self, results, cancelled, failed):
+        """İptal edilen toplu temizliğin özetini göster"""
+        self.logger.info(f"Toplu temizlik iptal edildi: {len(cancelled)} dosyaya dokunulmadı")
+        # Kullanıcı bilerek durdurdu; sonraki açılışta devam etmek önerilmez
+        self.clean_journal.finish()
+        self.clean_button.set_sensitive(True)
+        
+        message = self.lang.get_text('DIALOGS', 'cancelled_message',
+                                     done=len(results) - len(cancelled), total=len(results))
+        if failed:
+            message += "\n\n" + self.format_failures(failed)
+        self.show_error_dialog(self.lang.get_text('DIALOGS', 'cancelled_title'), message)
     
     def clean_next_file(self):
         if self.clean_file_index >= len(self.current_files):
@@ -1162,57 +2194,62 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
             GLib.idle_add(self.clean_next_file)
             return
         
-        backup_file = f"{current_file}.metadatacleaner.bak"
-        
         def clean_worker():
+            backup = None
+            self.clean_journal.mark_started([current_file])
             try:
                 self.logger.info(f"Metadata temizleme başlatıldı: {current_file}")
                 
-                # Yedek dosya oluştur
-                self.logger.debug(f"Yedek dosya oluşturuluyor: {backup_file}")
-                shutil.copy2(current_file, backup_file)
+                # JPEG/PNG için yerel temizleyici (geçici dosya + atomik yer değiştirme, yedek gerekmez)
+                profile = self.clean_profile
+                if self.get_setting('native_cleaner', True) and profile.native and native_cleaner.supports(current_file):
+                    keep_icc = profile.keep_icc if profile.keep else self.get_setting('keep_icc_profile', True)
+                    try:
+                        native_cleaner.strip_file(current_file, keep_icc=keep_icc)
+                        self.logger.debug(f"Yerel temizleyici kullanıldı: {current_file}")
+                        self.invalidate_metadata(current_file)
+                        self.clean_journal.mark_done(current_file, True)
+                        self.clean_file_index += 1
+                        GLib.idle_add(self.clean_next_file)
+                        return
+                    except NativeCleanError as e:
+                        self.logger.debug(f"Yerel temizleme atlandı, ExifTool kullanılacak: {e}")
+                
+                # Yedek dosya oluştur (reflink, sabit bağ ya da son çare olarak kopya)
+                backup = create_backup(current_file, logger=self.logger)
+                self.logger.debug(f"Yedek dosya oluşturuldu ({backup.method}): {backup.backup_path}")
                 
                 # Tek komutla optimize edilmiş temizleme
-                cmd = [
-                    'exiftool',
-                    '-all=',                    # Tüm metadata'yı sil
-                    '-tagsFromFile', '@',       # Orijinal dosyadan temel etiketleri koru
-                    '-FileType',                # Dosya tipini koru
-                    '-FileTypeExtension',       # Dosya uzantısını koru
-                    '-MIMEType',               # MIME tipini koru
-                    '-ImageSize',              # Görüntü boyutunu koru
-                    '-overwrite_original',     # Orijinal dosyayı değiştir
-                    '-P',                      # Dosya izinlerini koru
-                    current_file
-                ]
+                args = profile.exiftool_args() + [current_file]
                 
-                self.logger.debug(f"Temizlik komutu: {' '.join(cmd)}")
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+                self.logger.debug(f"Temizlik komutu: exiftool {' '.join(args)}")
+                result = self.exiftool.execute(*args, check=True)
                 
                 if result.stdout:
-                    self.logger.debug(f"ExifTool çıktısı: {result.stdout}")
+                    self.log_payload("ExifTool çıktısı", result.text)
                 if result.stderr:
-                    self.logger.warning(f"ExifTool uyarıları: {result.stderr}")
+                    self.logger.warning(f"ExifTool uyarıları: {truncate(result.stderr)}")
+                
+                self.invalidate_metadata(current_file)
                 
                 # Yedek dosyayı temizle
-                if os.path.exists(backup_file):
-                    os.remove(backup_file)
-                    self.logger.debug(f"Yedek dosya silindi: {backup_file}")
+                backup.discard()
+                self.logger.debug(f"Yedek dosya silindi: {backup.backup_path}")
+                self.clean_journal.mark_done(current_file, True)
                 
                 # Sonraki dosyaya geç
                 self.clean_file_index += 1
                 GLib.idle_add(self.clean_next_file)
                 
-            except subprocess.CalledProcessError as e:
-                error_msg = f"ExifTool hatası: {e.stderr}"
+            except ExifToolError as e:
+                error_msg = str(e)
                 self.logger.error(error_msg)
-                self.logger.error(f"Hata kodu: {e.returncode}")
                 
                 # Yedek dosyayı geri yükle
-                if os.path.exists(backup_file):
+                if backup is not None and backup.exists():
                     self.logger.info("Yedek dosya geri yükleniyor")
-                    shutil.copy2(backup_file, current_file)
-                    os.remove(backup_file)
+                    backup.restore()
+                self.clean_journal.mark_done(current_file, False, error_msg)
                 
                 GLib.idle_add(self._on_clean_error, error_msg)
                 
@@ -1222,18 +2259,19 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
                 self.logger.error(traceback.format_exc())
                 
                 # Yedek dosyayı geri yükle
-                if os.path.exists(backup_file):
+                if backup is not None and backup.exists():
                     self.logger.info("Yedek dosya geri yükleniyor")
-                    shutil.copy2(backup_file, current_file)
-                    os.remove(backup_file)
+                    backup.restore()
+                self.clean_journal.mark_done(current_file, False, error_msg)
                 
                 GLib.idle_add(self._on_clean_error, error_msg)
         
         thread = threading.Thread(target=clean_worker, daemon=True)
         thread.start()
     
-    def _on_all_files_cleaned(self):
+    def _on_all_files_cleaned(self, skipped=0):
         """Tüm dosyalar temizlendiğinde çalışır"""
+        self.clean_journal.finish()
         self.clean_button.set_sensitive(True)
         
         # Başarı mesajını göster
@@ -1244,6 +2282,8 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
             message = self.lang.get_text('DIALOGS', 'success_message')
         else:
             message = f"{len(self.current_files)} dosyanın metadata'sı başarıyla temizlendi."
+            if skipped:
+                message += "\n\n" + self.lang.get_text('DIALOGS', 'skipped_message', count=skipped)
             
         success_dialog.set_body(message)
         success_dialog.add_response("ok", self.lang.get_text('DIALOGS', 'ok'))
@@ -1254,6 +2294,9 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
     
     def _on_clean_error(self, error):
         """Temizleme hatası durumunda çalışır"""
+        if self.active_batch is not None:
+            self.hide_batch_progress()
+        self.clean_journal.finish()
         self.clean_button.set_sensitive(True)
         self.show_error_dialog(self.lang.get_text('DIALOGS', 'clean_error_title'), error)
     
@@ -1270,26 +2313,44 @@ class MetadataCleanerWindow(Adw.ApplicationWindow):
         # Anasayfaya dön
         self.stack.set_visible_child_name("welcome")
 
+    def show_error_dialog(self, title, message):
+        """Hata mesajı dialogunu göster"""
+        dialog = Adw.MessageDialog.new(self)
+        dialog.set_heading(title)
+        dialog.set_body(message)
+        dialog.add_response("ok", self.lang.get_text('DIALOGS', 'ok'))
+        dialog.set_default_response("ok")
+        dialog.set_close_response("ok")
+        dialog.present()
+
     def check_exiftool(self):
-        try:
-            subprocess.run(['exiftool', '-ver'], capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        """ExifTool PATH'te var mı; alt süreç başlatmaz, ana thread'den çağrılabilir"""
+        # Kalıcı süreç ilk komutta arka plan iş parçacığında başlar
+        return shutil.which('exiftool') is not None
+    
+    def probe_exiftool_version(self):
+        """ExifTool sürümünü sor (arka planda; ExifTool dosyası değişene kadar önbellekte)"""
+        self.exiftool_version = exiftool_version(cache_dir=os.path.join(GLib.get_user_cache_dir(), "metador"))
+        if self.exiftool_version:
+            self.logger.debug(f"ExifTool sürümü: {self.exiftool_version}")
+        else:
+            self.logger.warning("ExifTool sürümü alınamadı")
 
 
 class MetadataCleanerApp(Adw.Application):
-    def __init__(self):
+    def __init__(self, profiler=None):
         super().__init__(application_id='com.github.metador',
                         flags=Gio.ApplicationFlags.FLAGS_NONE)
+        self.profiler = profiler
+        self.window = None
         
-        # LanguageManager'ı önce başlat
+        # LanguageManager'ı önce başlat (pencereyle paylaşılır)
         self.lang = LanguageManager()
+        self.mark_startup("LanguageManager")
         
         # GResource'u yükle
         self.load_resources()
-    
- 
+        self.mark_startup("GResource")
         
         # Dil değiştirme aksiyonu
         set_lang_action = Gio.SimpleAction.new_stateful(
@@ -1299,8 +2360,55 @@ class MetadataCleanerApp(Adw.Application):
         )
         set_lang_action.connect("activate", self.on_set_language)
         self.add_action(set_lang_action)
+    
+    def mark_startup(self, phase):
+        if self.profiler is not None:
+            self.profiler.mark(phase)
+    
+    def load_resources(self):
+        """Derlenmiş GResource dosyasını kaydet (varsa)"""
+        candidates = [
+            '/usr/share/metador/metadatacleaner.gresource',
+            '/usr/share/metadata-cleaner/metadatacleaner.gresource',
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), 'metadatacleaner.gresource'),
+        ]
+        for path in candidates:
+            if os.path.exists(path):
+                try:
+                    Gio.resources_register(Gio.Resource.load(path))
+                    return
+                except GLib.Error:
+                    continue
+    
+    def do_activate(self):
+        if self.window is None:
+            self.window = MetadataCleanerWindow(application=self, lang=self.lang, profiler=self.profiler)
+        self.window.present()
+    
+    def on_set_language(self, action, value):
+        """Dili değiştir ve pencereyi yeni dille yeniden oluştur"""
+        old_window = self.window
+        if old_window is not None and (old_window.active_batch is not None or old_window.clean_journal.active):
+            # Pencere yeniden oluşturulursa süren işin işçileri ve günlüğü sahipsiz kalır
+            old_window.show_error_dialog(
+                self.lang.get_text('DIALOGS', 'error_title'),
+                self.lang.get_text('DIALOGS', 'language_busy')
+            )
+            return
+        if not self.lang.set_language(value.get_string()):
+            return
+        action.set_state(value)
         
+        self.window = MetadataCleanerWindow(application=self, lang=self.lang, check_journal=False)
+        self.window.present()
+        if old_window is not None:
+            old_window.close()
+
 
 if __name__ == '__main__':
-    app = MetadataCleanerApp()
+    profiler = None
+    if '--profile-startup' in sys.argv[1:]:
+        profiler = StartupProfiler(STARTUP_TIME)
+        profiler.mark("modül importları")
+    app = MetadataCleanerApp(profiler=profiler)
     app.run(None)
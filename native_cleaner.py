@@ -0,0 +1,298 @@
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+
+JPEG_SIGNATURE = b'\xff\xd8'
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# PNG'de silinen metadata chunk'ları
+PNG_METADATA_CHUNKS = {b'tEXt', b'iTXt', b'zTXt', b'eXIf', b'tIME'}
+
+# Uzunluk alanı olmayan JPEG işaretçileri (TEM, RSTn, SOI, EOI)
+JPEG_STANDALONE_MARKERS = {0x01, 0xd8, 0xd9} | set(range(0xd0, 0xd8))
+
+COPY_BUFFER = 1024 * 1024
+
+# Temizlenen dosyanın yanına yazılan geçici dosyanın adı: .metador-XXXX.tmp
+TMP_PREFIX = '.metador-'
+TMP_SUFFIX = '.tmp'
+
+
+class NativeCleanError(Exception):
+    """Dosya yerel temizleyiciyle işlenemedi; ExifTool'a geri dönülmeli"""
+
+
+def detect_format(path):
+    """Dosya imzasına göre 'jpeg', 'png' ya da None döndür"""
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(8)
+    except OSError:
+        return None
+    if head.startswith(JPEG_SIGNATURE):
+        return 'jpeg'
+    if head == PNG_SIGNATURE:
+        return 'png'
+    return None
+
+
+def supports(path):
+    return detect_format(path) is not None
+
+
+def _copy_bytes(src, dst, count):
+    """src'deki mevcut konumdan count baytı dst'ye kopyala (mümkünse çekirdek içinde)"""
+    if count <= 0:
+        return
+    dst.flush()
+    try:
+        offset = src.tell()
+        copied = 0
+        while copied < count:
+            sent = os.sendfile(dst.fileno(), src.fileno(), offset + copied, count - copied)
+            if sent == 0:
+                break
+            copied += sent
+        src.seek(offset + copied)
+        dst.seek(0, os.SEEK_END)
+        if copied == count:
+            return
+        count -= copied
+    except (AttributeError, OSError):
+        pass
+    while count > 0:
+        chunk = src.read(min(COPY_BUFFER, count))
+        if not chunk:
+            raise NativeCleanError("Beklenmedik dosya sonu")
+        dst.write(chunk)
+        count -= len(chunk)
+
+
+def _read_exact(f, size):
+    data = f.read(size)
+    if len(data) != size:
+        raise NativeCleanError("Beklenmedik dosya sonu")
+    return data
+
+
+def _keep_jpeg_segment(marker, payload, keep_icc):
+    if marker == 0xfe:
+        return False  # COM
+    if marker == 0xe2:
+        if payload.startswith(b'MPF\x00'):
+            # Çoklu resim dosyası: ek resimler EOI'den sonra gelir, ExifTool'a bırak
+            raise NativeCleanError("MPF içeren JPEG")
+        return keep_icc and payload.startswith(b'ICC_PROFILE\x00')
+    if marker == 0xee and payload.startswith(b'Adobe'):
+        return True  # Renk dönüşümü bilgisi; silinirse CMYK JPEG'ler yanlış çözülür
+    if 0xe1 <= marker <= 0xef:
+        return False  # APP1-APP15 (EXIF, XMP, IPTC, ...)
+    return True
+
+
+def strip_jpeg(src, dst, keep_icc=True):
+    """APP1-APP15 ve COM segmentlerini atarak JPEG'i src'den dst'ye akıt"""
+    if _read_exact(src, 2) != JPEG_SIGNATURE:
+        raise NativeCleanError("Geçerli bir JPEG değil")
+    dst.write(JPEG_SIGNATURE)
+
+    while True:
+        byte = _read_exact(src, 1)
+        if byte != b'\xff':
+            raise NativeCleanError("Bozuk JPEG segment yapısı")
+        marker = _read_exact(src, 1)[0]
+        while marker == 0xff:  # Dolgu baytları
+            marker = _read_exact(src, 1)[0]
+
+        if marker in JPEG_STANDALONE_MARKERS:
+            dst.write(bytes((0xff, marker)))
+            if marker == 0xd9:
+                return
+            continue
+
+        length_bytes = _read_exact(src, 2)
+        length = struct.unpack('>H', length_bytes)[0]
+        if length < 2:
+            raise NativeCleanError("Geçersiz JPEG segment uzunluğu")
+
+        if marker == 0xda:
+            # SOS: sıkıştırılmış veri ve sonrası olduğu gibi kopyalanır
+            dst.write(bytes((0xff, marker)) + length_bytes)
+            remaining = os.fstat(src.fileno()).st_size - src.tell()
+            _copy_bytes(src, dst, remaining)
+            return
+
+        if 0xe0 <= marker <= 0xef or marker == 0xfe:
+            # Karar için segmentin yalnızca başı okunur
+            head = _read_exact(src, min(length - 2, 16))
+            if _keep_jpeg_segment(marker, head, keep_icc):
+                dst.write(bytes((0xff, marker)) + length_bytes + head)
+                _copy_bytes(src, dst, length - 2 - len(head))
+            else:
+                src.seek(length - 2 - len(head), os.SEEK_CUR)
+        else:
+            dst.write(bytes((0xff, marker)) + length_bytes)
+            _copy_bytes(src, dst, length - 2)
+
+
+def strip_png(src, dst, keep_icc=True):
+    """tEXt/iTXt/zTXt/eXIf/tIME chunk'larını atarak PNG'yi src'den dst'ye akıt"""
+    if _read_exact(src, 8) != PNG_SIGNATURE:
+        raise NativeCleanError("Geçerli bir PNG değil")
+    dst.write(PNG_SIGNATURE)
+
+    while True:
+        header = _read_exact(src, 8)
+        length, chunk_type = struct.unpack('>I4s', header)
+        drop = chunk_type in PNG_METADATA_CHUNKS or (chunk_type == b'iCCP' and not keep_icc)
+        if drop:
+            src.seek(length + 4, os.SEEK_CUR)  # veri + CRC
+        else:
+            dst.write(header)
+            _copy_bytes(src, dst, length + 4)
+        if chunk_type == b'IEND':
+            return
+
+
+def _jpeg_image_end(data):
+    """İlk gerçek EOI'nin bittiği konumu bul
+
+    Segmentler uzunluklarıyla, sıkıştırılmış tarama verisi işaretçi
+    kurallarıyla (FF00 dolgusu, RSTn) atlanır; böylece EOI'den sonra
+    eklenmiş ve kendisi de FFD9 ile biten veriler (ikinci bir JPEG gibi)
+    görüntünün parçası sanılmaz.
+    """
+    size = len(data)
+    pos = 2
+    in_scan = False
+    while True:
+        if in_scan:
+            pos = data.find(b'\xff', pos)
+            if pos < 0 or pos + 1 >= size:
+                raise NativeCleanError("JPEG sonu (EOI) bulunamadı")
+            marker = data[pos + 1]
+            if marker == 0x00 or 0xd0 <= marker <= 0xd7 or marker == 0xff:
+                pos += 1 if marker == 0xff else 2
+                continue
+            in_scan = False
+        else:
+            if pos + 1 >= size or data[pos] != 0xff:
+                raise NativeCleanError("Bozuk JPEG segment yapısı")
+            while pos + 1 < size and data[pos + 1] == 0xff:  # Dolgu baytları
+                pos += 1
+            if pos + 1 >= size:
+                raise NativeCleanError("Beklenmedik dosya sonu")
+            marker = data[pos + 1]
+
+        if marker == 0xd9:
+            return pos + 2
+        if marker in JPEG_STANDALONE_MARKERS:
+            pos += 2
+            continue
+        if pos + 4 > size:
+            raise NativeCleanError("Beklenmedik dosya sonu")
+        length = struct.unpack_from('>H', data, pos + 2)[0]
+        if length < 2:
+            raise NativeCleanError("Geçersiz JPEG segment uzunluğu")
+        pos += 2 + length
+        in_scan = marker == 0xda
+
+
+def _check_jpeg_trailer(src):
+    """EOI'den sonra ek veri (üretici trailer'ı, eklenmiş ikinci JPEG) varsa ExifTool'a bırak"""
+    size = os.fstat(src.fileno()).st_size
+    if size < 4:
+        raise NativeCleanError("Geçerli bir JPEG değil")
+    with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        end = _jpeg_image_end(data)
+    if end != size:
+        raise NativeCleanError("JPEG sonunda ek veri var")
+    src.seek(0)
+
+
+def _probe_jpeg(src, keep_icc):
+    if _read_exact(src, 2) != JPEG_SIGNATURE:
+        raise NativeCleanError("Geçerli bir JPEG değil")
+    while True:
+        if _read_exact(src, 1) != b'\xff':
+            raise NativeCleanError("Bozuk JPEG segment yapısı")
+        marker = _read_exact(src, 1)[0]
+        while marker == 0xff:
+            marker = _read_exact(src, 1)[0]
+        if marker in JPEG_STANDALONE_MARKERS:
+            if marker == 0xd9:
+                return False
+            continue
+        length = struct.unpack('>H', _read_exact(src, 2))[0]
+        if length < 2:
+            raise NativeCleanError("Geçersiz JPEG segment uzunluğu")
+        if marker == 0xda:
+            return False  # Metadata segmentleri SOS'tan önce gelir
+        if 0xe0 <= marker <= 0xef or marker == 0xfe:
+            head = _read_exact(src, min(length - 2, 16))
+            if not _keep_jpeg_segment(marker, head, keep_icc):
+                return True
+            src.seek(length - 2 - len(head), os.SEEK_CUR)
+        else:
+            src.seek(length - 2, os.SEEK_CUR)
+
+
+def _probe_png(src, keep_icc):
+    if _read_exact(src, 8) != PNG_SIGNATURE:
+        raise NativeCleanError("Geçerli bir PNG değil")
+    while True:
+        length, chunk_type = struct.unpack('>I4s', _read_exact(src, 8))
+        if chunk_type in PNG_METADATA_CHUNKS or (chunk_type == b'iCCP' and not keep_icc):
+            return True
+        if chunk_type == b'IEND':
+            return False
+        src.seek(length + 4, os.SEEK_CUR)
+
+
+def has_metadata(path, keep_icc=True):
+    """Dosyada strip_file'ın sileceği bir şey var mı? Yalnızca başlıklar okunur
+
+    Emin olunamayan durumlarda (MPF, EOI sonrası veri) NativeCleanError
+    fırlatılır; karar ExifTool'a bırakılmalıdır.
+    """
+    file_format = detect_format(path)
+    if file_format is None:
+        raise NativeCleanError("Desteklenmeyen biçim")
+    with open(path, 'rb') as src:
+        if file_format == 'jpeg':
+            _check_jpeg_trailer(src)
+            return _probe_jpeg(src, keep_icc)
+        return _probe_png(src, keep_icc)
+
+
+def strip_file(path, keep_icc=True):
+    """Dosyayı aynı dizindeki geçici dosyaya temizleyip atomik olarak yerine koy
+
+    Desteklenmeyen ya da beklenmedik yapıdaki dosyalar için NativeCleanError
+    fırlatılır; bu durumda orijinal dosyaya dokunulmamıştır.
+    """
+    file_format = detect_format(path)
+    if file_format is None:
+        raise NativeCleanError("Desteklenmeyen biçim")
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=TMP_PREFIX, suffix=TMP_SUFFIX)
+    try:
+        with open(path, 'rb') as src, os.fdopen(fd, 'w+b') as dst:
+            if file_format == 'jpeg':
+                _check_jpeg_trailer(src)
+                strip_jpeg(src, dst, keep_icc)
+            else:
+                strip_png(src, dst, keep_icc)
+            dst.flush()
+        # İzinleri ve değiştirme zamanını koru (ExifTool -P gibi)
+        shutil.copystat(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
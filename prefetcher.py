@@ -0,0 +1,117 @@
+import threading
+from collections import OrderedDict
+
+from metadata_cache import file_fingerprint
+
+DEFAULT_RADIUS = 2
+DEFAULT_PREVIEW_ENTRIES = 64
+
+
+class PreviewCache:
+    """Önizleme pixbuf'ları için parmak izi anahtarlı küçük LRU önbellek
+
+    None değeri de saklanır: önizlemesi olmayan dosyalar için tekrar
+    deneme yapılmaz.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, max_entries=DEFAULT_PREVIEW_ENTRIES):
+        self.max_entries = max(1, int(max_entries))
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, path):
+        """(bulundu_mu, pixbuf) döndür"""
+        fingerprint = file_fingerprint(path)
+        with self._lock:
+            value = self._entries.get((path, fingerprint), self._MISSING)
+            if value is self._MISSING:
+                return False, None
+            self._entries.move_to_end((path, fingerprint))
+            return True, value
+
+    def get(self, path):
+        return self.lookup(path)[1]
+
+    def put(self, path, pixbuf):
+        fingerprint = file_fingerprint(path)
+        if fingerprint is None:
+            return
+        with self._lock:
+            self._entries[(path, fingerprint)] = pixbuf
+            self._entries.move_to_end((path, fingerprint))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path):
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == path]:
+                del self._entries[key]
+
+
+class Prefetcher:
+    """Gezinme sırasında komşu dosyaları (index ± radius) arka planda hazırlar
+
+    Her dosya için görevler sırayla tek bir düşük öncelikli iş parçacığında
+    çalıştırılır. Kullanıcı uzağa atladığında pencere dışında kalan bekleyen
+    işler iptal edilir; o an çalışan görev bitince kalan görevleri atlanır.
+    """
+
+    def __init__(self, tasks, radius=DEFAULT_RADIUS, logger=None):
+        self.tasks = list(tasks)
+        self.radius = max(0, int(radius))
+        self.logger = logger
+        self._pending = []
+        self._wanted = set()
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._worker, name='metador-prefetch', daemon=True)
+        self._thread.start()
+
+    def update(self, files, index):
+        """Yeni konuma göre ön yükleme sırasını yeniden kur"""
+        order = []
+        for distance in range(1, self.radius + 1):
+            # Önce ileri yöndeki dosya, çünkü kullanıcı çoğunlukla "sonraki"ye basar
+            for position in (index + distance, index - distance):
+                if 0 <= position < len(files):
+                    order.append(files[position])
+
+        with self._condition:
+            self._pending = order
+            self._wanted = set(order)
+            self._condition.notify()
+
+    def cancel(self):
+        self.update([], 0)
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._pending = []
+            self._wanted = set()
+            self._condition.notify()
+
+    def _is_wanted(self, path):
+        with self._condition:
+            return not self._closed and path in self._wanted
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                path = self._pending.pop(0)
+
+            for task in self.tasks:
+                if not self._is_wanted(path):
+                    break
+                try:
+                    task(path)
+                except Exception as e:
+                    if self.logger:
+                        self.logger.debug(f"Ön yükleme başarısız: {path} - {e}")
+                    break
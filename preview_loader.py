@@ -0,0 +1,50 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+DEFAULT_WORKERS = 2
+
+
+class PreviewLoader:
+    """Önizlemeleri ana iş parçacığı dışında, sınırlı bir havuzda üretir
+
+    Aynı dosya için aynı anda tek bir iş çalışır; sonraki istekler aynı
+    Future'ı paylaşır. Üretilen sonuç önizleme önbelleğine yazılır.
+    """
+
+    def __init__(self, create_func, cache, workers=DEFAULT_WORKERS, logger=None):
+        self.create_func = create_func
+        self.cache = cache
+        self.logger = logger
+        self._executor = ThreadPoolExecutor(max_workers=max(1, int(workers)), thread_name_prefix='metador-preview')
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def request(self, path):
+        """Dosyanın önizlemesi için bir Future döndür (önbellekteyse hemen tamamlanmış olur)"""
+        found, pixbuf = self.cache.lookup(path)
+        if found:
+            future = Future()
+            future.set_result(pixbuf)
+            return future
+
+        with self._lock:
+            future = self._jobs.get(path)
+            if future is None:
+                future = self._executor.submit(self._build, path)
+                self._jobs[path] = future
+            return future
+
+    def _build(self, path):
+        try:
+            pixbuf = self.create_func(path)
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Dosya önizlemesi yüklenemedi: {e}")
+            pixbuf = None
+        self.cache.put(path, pixbuf)
+        with self._lock:
+            self._jobs.pop(path, None)
+        return pixbuf
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,70 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch_cleaner import BatchCleaner
+from exiftool_engine import ExifToolResult
+
+
+class FakeEngine:
+    """Dosyaları 'temizlenmiş' olarak yeniden yazan ve verilen stderr'i döndüren motor"""
+
+    def __init__(self, stderr):
+        self.stderr = stderr
+
+    def execute(self, *args, **kwargs):
+        for arg in args:
+            if os.path.isfile(arg):
+                # ExifTool gibi geçici dosyaya yazıp yerine taşır
+                with open(arg + '_exiftool_tmp', 'w') as f:
+                    f.write('temiz')
+                os.replace(arg + '_exiftool_tmp', arg)
+        return ExifToolResult(b'', self.stderr)
+
+
+class BatchCleanerStderrTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.paths = []
+        for name in ('a.tif', 'b.tif', 'c.tif'):
+            path = os.path.join(self.directory.name, name)
+            with open(path, 'w') as f:
+                f.write('orijinal')
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read(self, path):
+        with open(path) as f:
+            return f.read()
+
+    def test_mixed_stderr_fails_and_restores_unmapped_files(self):
+        a, b, c = self.paths
+        stderr = f"Error: Not a valid TIFF - {a}\nError: Temporary file already exists - {b}_exiftool_tmp\n"
+        cleaner = BatchCleaner(FakeEngine(stderr), native=False)
+        results = {result.path: result for result in cleaner.clean_chunk(self.paths)}
+
+        self.assertEqual(results[a].error, 'Not a valid TIFF')
+        for path in self.paths:
+            self.assertFalse(results[path].success)
+            self.assertEqual(self.read(path), 'orijinal')
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ['a.tif', 'b.tif', 'c.tif'])
+
+    def test_mapped_errors_only_fail_their_files(self):
+        a, b, c = self.paths
+        cleaner = BatchCleaner(FakeEngine(f"Error: Not a valid TIFF - {a}\n"), native=False)
+        results = {result.path: result for result in cleaner.clean_chunk(self.paths)}
+
+        self.assertFalse(results[a].success)
+        self.assertEqual(self.read(a), 'orijinal')
+        for path in (b, c):
+            self.assertTrue(results[path].success)
+            self.assertEqual(self.read(path), 'temiz')
+
+
+if __name__ == '__main__':
+    unittest.main()
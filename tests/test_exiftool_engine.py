@@ -0,0 +1,100 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import textwrap
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from exiftool_engine import ExifToolEngine, argfile_line
+
+# '-stay_open True -@ -' protokolünü konuşan ve aldığı argümanları JSON olarak
+# geri yazan küçük bir ExifTool yerine geçen betik; '#[CSTR]' satırlarını
+# ExifTool'un argfile kurallarıyla çözer
+FAKE_EXIFTOOL = textwrap.dedent('''\
+    #!{python}
+    import json, re, sys
+    ESCAPES = {{'\\\\': '\\\\', 'n': '\\n', 'r': '\\r', 't': '\\t', '"': '"', '0': '\\0'}}
+    args = []
+    for line in sys.stdin.buffer:
+        line = line.decode('utf-8').rstrip('\\n')
+        if line.startswith('#[CSTR]'):
+            line = re.sub(r'\\\\(.)', lambda m: ESCAPES.get(m.group(1), '\\\\' + m.group(1)), line[7:])
+        elif line.startswith('#'):
+            continue
+        if line.startswith('-execute'):
+            marker = args[args.index('-echo4') + 1]
+            args = args[:args.index('-echo4')]
+            sys.stdout.write(json.dumps(args) + '\\n' + marker + '\\n')
+            sys.stdout.flush()
+            sys.stderr.write(marker + '\\n')
+            sys.stderr.flush()
+            args = []
+        elif line == 'False':
+            break
+        else:
+            args.append(line)
+''')
+
+# En küçük geçerli JPEG (1x1 gri)
+TINY_JPEG = bytes.fromhex(
+    'ffd8ffdb004300080606070605080707070909080a0c140d0c0b0b0c1912130f141d1a1f1e1d1a1c1c'
+    '20242e2720222c231c1c2837292c30313434341f27393d38323c2e333432ffc0000b080001000101011100'
+    'ffc4001f0000010501010101010100000000000000000102030405060708090a0bffc400b5100002010303'
+    '020403050504040000017d01020300041105122131410613516107227114328191a1082342b1c11552d1f0'
+    '2433627282090a161718191a25262728292a3435363738393a434445464748494a535455565758595a6364'
+    '65666768696a737475767778797a838485868788898a92939495969798999aa2a3a4a5a6a7a8a9aab2b3b4'
+    'b5b6b7b8b9bac2c3c4c5c6c7c8c9cad2d3d4d5d6d7d8d9dae1e2e3e4e5e6e7e8e9eaf1f2f3f4f5f6f7f8f9'
+    'faffda0008010100003f00fbd3ffd9'
+)
+
+
+class ArgfileLineTest(unittest.TestCase):
+    def test_plain_argument_is_unchanged(self):
+        self.assertEqual(argfile_line('-Comment=tek satır'), '-Comment=tek satır')
+
+    def test_multiline_argument_uses_cstr(self):
+        line = argfile_line('-Comment=a\\b\nc\r')
+        self.assertEqual(line, '#[CSTR]-Comment=a\\\\b\\nc\\r')
+        self.assertNotIn('\n', line)
+
+
+class ExifToolEngineArgfileTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.executable = os.path.join(self.directory, 'exiftool')
+        with open(self.executable, 'w', encoding='utf-8') as f:
+            f.write(FAKE_EXIFTOOL.format(python=sys.executable))
+        os.chmod(self.executable, 0o755)
+        self.engine = ExifToolEngine(executable=self.executable)
+
+    def tearDown(self):
+        self.engine.close()
+        shutil.rmtree(self.directory)
+
+    def test_multiline_value_round_trips(self):
+        value = '-Comment=ilk satır\nikinci\\satır\r\n#üçüncü'
+        result = self.engine.execute(value, '#yorum değil', '/tmp/a.jpg')
+        self.assertEqual(json.loads(result.stdout.splitlines()[0]), [value, '#yorum değil', '/tmp/a.jpg'])
+
+
+@unittest.skipUnless(shutil.which('exiftool'), "exiftool kurulu değil")
+class ExifToolEngineMultilineWriteTest(unittest.TestCase):
+    def test_multiline_comment_is_written(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'tiny.jpg')
+            with open(path, 'wb') as f:
+                f.write(TINY_JPEG)
+            engine = ExifToolEngine()
+            try:
+                engine.execute('-overwrite_original', '-Comment=satır 1\nsatır 2', path, check=True)
+                data = engine.execute_json('-Comment', path)
+            finally:
+                engine.close()
+        self.assertEqual(data[0]['Comment'], 'satır 1\nsatır 2')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from exiftool_json import LazyValue, attach_lazy_values
+from metadata_cache import MetadataCache
+
+
+class MetadataCacheLazyValueTest(unittest.TestCase):
+    def test_round_trip_keeps_lazy_value(self):
+        with tempfile.NamedTemporaryFile(suffix='.jpg') as f:
+            data = attach_lazy_values([{
+                'SourceFile': f.name,
+                'EXIF:Make': 'Canon',
+                'EXIF:ThumbnailImage': '(Binary data 5120 bytes, use -b option to extract)',
+            }])
+            cache = MetadataCache()
+            cache.put(f.name, data)
+            cached = cache.get(f.name)
+
+        value = cached[0]['EXIF:ThumbnailImage']
+        self.assertIsInstance(value, LazyValue)
+        self.assertEqual((value.path, value.tag, value.size), (f.name, 'EXIF:ThumbnailImage', 5120))
+        self.assertEqual(value, data[0]['EXIF:ThumbnailImage'])
+        self.assertEqual(cached[0]['EXIF:Make'], 'Canon')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metadata_index import MetadataIndex
+
+
+class FakeCatalog:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def iter_entries(self):
+        return iter(self.rows)
+
+
+def entry(path, **tags):
+    return dict({'SourceFile': path}, **tags)
+
+
+class MetadataIndexTest(unittest.TestCase):
+    def test_readding_a_file_reuses_its_document(self):
+        index = MetadataIndex()
+        for make in ('Canon', 'Nikon', 'Sony') * 10:
+            index.add('/a.jpg', entry('/a.jpg', **{'EXIF:Make': make}))
+        index.add('/b.jpg', entry('/b.jpg', **{'EXIF:Make': 'Canon'}))
+
+        self.assertEqual(index._paths, ['/a.jpg', '/b.jpg'])
+        self.assertEqual(index.search('Make=Sony'), ['/a.jpg'])
+        self.assertEqual(index.search('Make=Canon'), ['/b.jpg'])
+        self.assertEqual(set(index._values['exif:make']), {'sony', 'canon'})
+
+    def test_removed_documents_are_reused_and_keys_pruned(self):
+        index = MetadataIndex()
+        index.add('/a.jpg', entry('/a.jpg', **{'GPS:GPSLatitude': '1', 'EXIF:Make': 'Canon'}))
+        index.add('/b.jpg', entry('/b.jpg', **{'EXIF:Make': 'Canon'}))
+        index.remove('/a.jpg')
+
+        self.assertNotIn('gpslatitude', index._keys_by_name)
+        self.assertNotIn('gps:gpslatitude', index._values)
+        self.assertEqual(index.search('has:GPS'), [])
+
+        index.add('/c.jpg', entry('/c.jpg', **{'EXIF:Make': 'Sony'}))
+        self.assertEqual(len(index._paths), 2)
+        self.assertEqual(sorted(index.search('has:EXIF')), ['/b.jpg', '/c.jpg'])
+
+    def test_catalog_entries_are_searchable_without_being_open(self):
+        index = MetadataIndex()
+        index.add('/open.jpg', entry('/open.jpg', **{'EXIF:Make': 'Canon'}))
+        catalog = FakeCatalog([
+            ('/closed.jpg', [entry('/closed.jpg', **{'EXIF:Make': 'Canon', 'EXIF:DateTimeOriginal': '2023:01:02 10:00:00'})]),
+            ('/open.jpg', [entry('/open.jpg', **{'EXIF:Make': 'Nikon'})]),
+        ])
+
+        self.assertEqual(index.load_catalog(catalog), 1)
+        self.assertEqual(index.search('Make=Canon'), ['/open.jpg', '/closed.jpg'])
+        self.assertEqual(index.search('DateTimeOriginal in 2023'), ['/closed.jpg'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import hashlib
+import os
+import tempfile
+
+import gi
+gi.require_version('GdkPixbuf', '2.0')
+from gi.repository import GLib, GdkPixbuf
+
+# Freedesktop thumbnail spesifikasyonundaki boyut klasörleri, okuma sırasına göre
+FLAVORS = (
+    ('large', 256),
+    ('x-large', 512),
+    ('xx-large', 1024),
+    ('normal', 128),
+)
+STORE_FLAVOR = ('large', 256)
+
+
+class ThumbnailCache:
+    """XDG thumbnail önbelleği (~/.cache/thumbnails) okuyucu/yazıcısı
+
+    Dosya adı URI'nin MD5 özetidir; küçük resim ancak Thumb::URI ve
+    Thumb::MTime değerleri kaynak dosyayla eşleşiyorsa kullanılır. Böylece
+    Nautilus gibi uygulamaların ürettiği küçük resimler de yeniden kullanılır.
+    """
+
+    def __init__(self, cache_dir=None, logger=None):
+        self.cache_dir = cache_dir or os.path.join(GLib.get_user_cache_dir(), 'thumbnails')
+        self.logger = logger
+
+    @staticmethod
+    def file_uri(path):
+        return GLib.filename_to_uri(os.path.abspath(path), None)
+
+    def thumbnail_path(self, uri, flavor):
+        digest = hashlib.md5(uri.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, flavor, f'{digest}.png')
+
+    def lookup(self, path):
+        """Geçerli bir küçük resim varsa pixbuf olarak döndür"""
+        try:
+            mtime = str(int(os.stat(path).st_mtime))
+            uri = self.file_uri(path)
+        except (OSError, GLib.Error):
+            return None
+
+        for flavor, _ in FLAVORS:
+            thumb_path = self.thumbnail_path(uri, flavor)
+            if not os.path.exists(thumb_path):
+                continue
+            try:
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file(thumb_path)
+            except GLib.Error:
+                continue
+            if (pixbuf.get_option('tEXt::Thumb::URI') == uri and
+                    pixbuf.get_option('tEXt::Thumb::MTime') == mtime):
+                return pixbuf
+        return None
+
+    def store(self, path, pixbuf):
+        """Pixbuf'ı 'large' küçük resim olarak atomik şekilde kaydet"""
+        if pixbuf is None:
+            return
+        try:
+            st = os.stat(path)
+            uri = self.file_uri(path)
+            flavor, size = STORE_FLAVOR
+
+            width, height = pixbuf.get_width(), pixbuf.get_height()
+            scale = min(1.0, size / max(width, height))
+            if scale < 1.0:
+                pixbuf = pixbuf.scale_simple(max(1, int(width * scale)), max(1, int(height * scale)),
+                                             GdkPixbuf.InterpType.BILINEAR)
+
+            thumb_path = self.thumbnail_path(uri, flavor)
+            thumb_dir = os.path.dirname(thumb_path)
+            os.makedirs(thumb_dir, mode=0o700, exist_ok=True)
+
+            fd, tmp_path = tempfile.mkstemp(dir=thumb_dir, suffix='.png')
+            os.close(fd)
+            try:
+                pixbuf.savev(tmp_path, 'png',
+                             ['tEXt::Thumb::URI', 'tEXt::Thumb::MTime', 'tEXt::Thumb::Size', 'tEXt::Software'],
+                             [uri, str(int(st.st_mtime)), str(st.st_size), 'Metador'])
+                os.chmod(tmp_path, 0o600)
+                os.replace(tmp_path, thumb_path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, GLib.Error) as e:
+            if self.logger:
+                self.logger.debug(f"Küçük resim kaydedilemedi: {path} - {e}")